@@ -0,0 +1,113 @@
+"""
+ABI fusion of the proxy with its target.
+
+The proxy forwards every selector it doesn't implement to its target, so a
+single handle can call both the admin functions of the proxy and the
+functions of the target. Fusing fails when a function of the target has the
+selector of a proxy function: calls to it would silently run the proxy
+function instead of being forwarded.
+
+The proxy ABI is compiled once, and fused ABIs and handle factories are
+cached by target ABI, so handles for any number of proxies of the same
+target are built from a single parse.
+"""
+
+import functools
+import json
+from pathlib import Path
+from typing import Optional
+
+import boa
+from boa.contracts.abi.abi_contract import ABIContract, ABIContractFactory, ABIFunction
+from vyper.compiler.output import build_abi_output
+
+PROXY_SOURCE = Path(__file__).parent / "proxy.vy"
+
+
+def _canonical(abi) -> str:
+    return json.dumps(abi, sort_keys=True)
+
+
+def _abi_of(contract) -> list[dict]:
+    # ABI JSON, ABI list, boa contract or factory, or boa deployer
+    if isinstance(contract, str):
+        return json.loads(contract)
+    if isinstance(contract, list):
+        return contract
+    if hasattr(contract, "abi"):
+        return contract.abi
+    return build_abi_output(contract.compiler_data)
+
+
+@functools.cache
+def _proxy_abi() -> str:
+    abi = build_abi_output(boa.load_partial(str(PROXY_SOURCE)).compiler_data)
+    return _canonical([item for item in abi if item["type"] != "constructor"])
+
+
+def proxy_abi() -> list[dict]:
+    """ABI of the proxy, including the access control functions it exports."""
+    return json.loads(_proxy_abi())
+
+
+def _selectors(abi) -> dict[bytes, str]:
+    return {
+        f.method_id: f.full_signature
+        for f in (ABIFunction(item, "") for item in abi if item["type"] == "function")
+    }
+
+
+def _event_signature(item) -> str:
+    return f"{item['name']}({','.join(i['type'] for i in item['inputs'])})"
+
+
+@functools.lru_cache(maxsize=None)
+def _fuse(proxy: str, target: str) -> str:
+    proxy_items, target_items = json.loads(proxy), json.loads(target)
+
+    proxy_selectors = _selectors(proxy_items)
+    collisions = [
+        f"0x{selector.hex()} {signature} (proxy: {proxy_selectors[selector]})"
+        for selector, signature in _selectors(target_items).items()
+        if selector in proxy_selectors
+    ]
+    if collisions:
+        raise ValueError("selector collision: " + ", ".join(collisions))
+
+    # the proxy has its own fallback, and handles are never deployed
+    events = {_event_signature(item) for item in proxy_items if item["type"] == "event"}
+    fused = list(proxy_items)
+    for item in target_items:
+        if item["type"] == "function":
+            fused.append(item)
+        elif item["type"] == "event" and _event_signature(item) not in events:
+            events.add(_event_signature(item))
+            fused.append(item)
+    return _canonical(fused)
+
+
+def fuse_abis(target, proxy=None) -> list[dict]:
+    """
+    Fuse the ABI of `target` (ABI JSON or list, or a boa contract, factory or
+    deployer) with the ABI of the proxy, raises a `ValueError` listing every
+    selector of the target that the proxy would not forward.
+    """
+    proxy = _proxy_abi() if proxy is None else _canonical(_abi_of(proxy))
+    return json.loads(_fuse(proxy, _canonical(_abi_of(target))))
+
+
+@functools.lru_cache(maxsize=None)
+def _factory(abi: str, name: str) -> ABIContractFactory:
+    return boa.loads_abi(abi, name=name)
+
+
+def proxy_contract(address, target=None, name: Optional[str] = None) -> ABIContract:
+    """
+    Handle on the proxy at `address` that can call both the proxy functions
+    and the functions of `target` (the proxy functions only if omitted).
+    """
+    if target is None:
+        abi = _proxy_abi()
+    else:
+        abi = _fuse(_proxy_abi(), _canonical(_abi_of(target)))
+    return _factory(abi, name or "proxy").at(address)
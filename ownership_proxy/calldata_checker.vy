@@ -0,0 +1,169 @@
+# pragma version 0.4.3
+
+# Generic checker configured per selector instead of compiled per target. Each
+# allowed selector has a list of rules, every rule checks one argument word of
+# the delegated call (read from the raw calldata) against an interval or a
+# whitelist. Calls to selectors without rules are rejected.
+#
+# The configuration is set once by `initialize`, so a single audited
+# implementation can be cloned through the checker factory for every delegate
+# and target, and approved once in the proxy through its clone code hash.
+#
+# The checker receives the calldata of the target. Its own functions are
+# dispatched before `__default__`, so they are namespaced (`checker__`, like
+# the proxy's `proxy__`) and their selectors can't be configured.
+
+from ownership_proxy.interfaces import ICalldataChecker
+
+implements: ICalldataChecker
+
+from ownership_proxy.permissions import calldata
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
+
+initializes: interval
+initializes: whitelist
+
+MAX_SELECTORS: constant(uint256) = 8
+MAX_RULES: constant(uint256) = 8
+MAX_WHITELIST: constant(uint256) = 16
+
+# rules are packed as 16 bits each, `index | predicate << 8`, so that a
+# selector's rules are read with a single SLOAD. Predicates are never 0,
+# which ends the list.
+RULE_BITS: constant(uint256) = 16
+RULE_MASK: constant(uint256) = 2**16 - 1
+INDEX_MASK: constant(uint256) = 2**8 - 1
+
+# selectors of the external functions of the checker, a target function with
+# one of them would never reach the rules
+RESERVED_SELECTORS: constant(bytes4[5]) = [
+    method_id(
+        "initialize((bytes4,(uint8,uint256,uint256,uint256,address[])[])[])",
+        output_type=bytes4,
+    ),
+    method_id("checker__initialized()", output_type=bytes4),
+    method_id("checker__packed_rules(bytes4)", output_type=bytes4),
+    method_id("checker__rules(bytes4)", output_type=bytes4),
+    method_id("checker__rule_key(bytes4,uint8)", output_type=bytes4),
+]
+
+packed_rules: HashMap[bytes4, uint256]
+initialized: bool
+
+
+@deploy
+def __init__():
+    # only clones are configured, the implementation stays locked
+    self.initialized = True
+
+
+@external
+def initialize(_selectors: DynArray[ICalldataChecker.SelectorRules, MAX_SELECTORS]):
+    assert not self.initialized, "already initialized"
+    self.initialized = True
+
+    assert len(_selectors) > 0, "no selectors"
+    for s: ICalldataChecker.SelectorRules in _selectors:
+        assert len(s.rules) > 0, "no rules"
+        assert s.selector not in RESERVED_SELECTORS, "reserved selector"
+        assert self.packed_rules[s.selector] == 0, "duplicate selector"
+
+        packed: uint256 = 0
+        # one rule per argument, bit `index` is set once it has a rule
+        seen: uint256 = 0
+        for i: uint256 in range(len(s.rules), bound=MAX_RULES):
+            rule: ICalldataChecker.Rule = s.rules[i]
+            assert seen & (1 << convert(rule.index, uint256)) == 0, "duplicate argument"
+            seen |= 1 << convert(rule.index, uint256)
+
+            key: bytes32 = self._rule_key(s.selector, rule.index)
+
+            if rule.predicate == ICalldataChecker.Predicate.INTERVAL:
+                interval.add(key, rule.lb, rule.ub)
+            elif rule.predicate == ICalldataChecker.Predicate.WHITELIST:
+                whitelist.add_multiple(key, rule.whitelist)
+            else:
+                assert rule.predicate == ICalldataChecker.Predicate.ANY, "invalid predicate"
+
+            packed |= (
+                convert(rule.index, uint256) | convert(rule.predicate, uint256) << 8
+            ) << (RULE_BITS * i)
+
+        self.packed_rules[s.selector] = packed
+        log ICalldataChecker.SelectorRulesSet(selector=s.selector, rules=packed)
+
+
+@external
+def __default__():
+    selector: bytes4 = calldata.selector()
+    packed: uint256 = self.packed_rules[selector]
+    assert packed != 0, "selector not allowed"
+
+    for i: uint256 in range(MAX_RULES):
+        rule: uint256 = (packed >> (RULE_BITS * i)) & RULE_MASK
+        if rule == 0:
+            break
+
+        index: uint256 = rule & INDEX_MASK
+        predicate: ICalldataChecker.Predicate = convert(rule >> 8, ICalldataChecker.Predicate)
+        if predicate == ICalldataChecker.Predicate.INTERVAL:
+            interval.check(self._rule_key(selector, convert(index, uint8)), calldata.word(index))
+        elif predicate == ICalldataChecker.Predicate.WHITELIST:
+            whitelist.check(
+                self._rule_key(selector, convert(index, uint8)), calldata.address_arg(index)
+            )
+
+
+@external
+@view
+def checker__initialized() -> bool:
+    return self.initialized
+
+
+@external
+@view
+def checker__packed_rules(_selector: bytes4) -> uint256:
+    return self.packed_rules[_selector]
+
+
+@external
+@view
+def checker__rules(_selector: bytes4) -> DynArray[ICalldataChecker.Rule, MAX_RULES]:
+    result: DynArray[ICalldataChecker.Rule, MAX_RULES] = []
+    packed: uint256 = self.packed_rules[_selector]
+
+    for i: uint256 in range(MAX_RULES):
+        rule: uint256 = (packed >> (RULE_BITS * i)) & RULE_MASK
+        if rule == 0:
+            break
+
+        index: uint8 = convert(rule & INDEX_MASK, uint8)
+        predicate: ICalldataChecker.Predicate = convert(rule >> 8, ICalldataChecker.Predicate)
+        key: bytes32 = self._rule_key(_selector, index)
+
+        r: ICalldataChecker.Rule = ICalldataChecker.Rule(
+            index=index, predicate=predicate, lb=0, ub=0, whitelist=[]
+        )
+        if predicate == ICalldataChecker.Predicate.INTERVAL:
+            r.lb = interval.intervals[key].lb
+            r.ub = interval.intervals[key].ub
+        elif predicate == ICalldataChecker.Predicate.WHITELIST:
+            for j: uint256 in range(len(whitelist.whitelist_array[key]), bound=MAX_WHITELIST):
+                r.whitelist.append(whitelist.whitelist_array[key][j])
+        result.append(r)
+
+    return result
+
+
+@external
+@pure
+def checker__rule_key(_selector: bytes4, _index: uint8) -> bytes32:
+    return self._rule_key(_selector, _index)
+
+
+@internal
+@pure
+def _rule_key(_selector: bytes4, _index: uint8) -> bytes32:
+    # the interval or whitelist checked for an argument of a selector
+    return keccak256(concat(_selector, convert(_index, bytes1)))
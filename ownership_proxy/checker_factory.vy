@@ -0,0 +1,40 @@
+# pragma version 0.4.3
+
+# Deploys EIP-1167 minimal proxies (clones) of audited checker implementations.
+# A clone costs a fraction of a full deployment and its code hash only depends
+# on the implementation, so approving `clone_codehash(impl)` in the proxy
+# approves every clone of `impl`. Cloned checkers take their parameters through
+# an initializer, called in the same transaction so clones are never left
+# uninitialized.
+
+from ownership_proxy.interfaces import ICheckerFactory
+
+implements: ICheckerFactory
+
+MAX_INIT_DATA: constant(uint256) = 32 * 256
+
+# EIP-1167 runtime code, the implementation address goes in between
+CLONE_PREFIX: constant(bytes10) = 0x363d3d373d3d3d363d73
+CLONE_SUFFIX: constant(bytes15) = 0x5af43d82803e903d91602b57fd5bf3
+
+
+@external
+def deploy_checker(_implementation: address, _init_data: Bytes[MAX_INIT_DATA]) -> address:
+    assert _implementation.is_contract, "invalid implementation"
+    assert len(_init_data) != 0, "empty init data"
+
+    checker: address = create_minimal_proxy_to(_implementation)
+    raw_call(checker, _init_data)
+
+    log ICheckerFactory.CheckerDeployed(
+        checker=checker,
+        implementation=_implementation,
+        deployer=msg.sender
+    )
+    return checker
+
+
+@external
+@pure
+def clone_codehash(_implementation: address) -> bytes32:
+    return keccak256(concat(CLONE_PREFIX, convert(_implementation, bytes20), CLONE_SUFFIX))
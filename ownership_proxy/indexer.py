@@ -0,0 +1,450 @@
+"""
+Local index of delegations and permission keys.
+
+Ingests the events emitted by the proxy and the permissions modules, either
+from a JSON-RPC endpoint or from a local titanoboa environment, into a SQLite
+database with a block checkpoint. Syncing is incremental and the database
+answers "what was the state at block N" queries without any RPC call.
+
+Permission events are emitted by the checkers (the permissions modules are
+compiled into them), so every contract emitting them is indexed unless the
+indexer is restricted to a list of addresses.
+"""
+
+import json
+import sqlite3
+import urllib.request
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from eth_abi import decode
+from eth_utils import to_checksum_address
+from vyper.utils import keccak256
+
+# event name -> fields as (name, abi type, indexed), in declaration order
+EVENTS = {
+    "DelegationSet": [
+        ("delegate", "address", True),
+        ("end_ts", "uint256", False),
+        ("checker", "address", True),
+    ],
+    "DelegationKilled": [("delegate", "address", True)],
+    "SelectorDelegationSet": [
+        ("delegate", "address", True),
+        ("selector", "bytes4", True),
+        ("end_ts", "uint256", False),
+        ("checker", "address", True),
+    ],
+    "CooldownSet": [
+        ("key", "bytes32", True),
+        ("start", "uint256", False),
+        ("duration", "uint256", False),
+    ],
+    "CooldownReset": [("key", "bytes32", True), ("new_start", "uint256", False)],
+    "IntervalSet": [
+        ("key", "bytes32", True),
+        ("lb", "uint256", False),
+        ("ub", "uint256", False),
+    ],
+    "AddressWhitelisted": [("key", "bytes32", True), ("addr", "address", True)],
+    "AddressRemovedFromWhitelist": [
+        ("key", "bytes32", True),
+        ("addr", "address", True),
+    ],
+}
+
+
+def _topic(name: str, fields) -> str:
+    signature = f"{name}({','.join(abi_type for _, abi_type, _ in fields)})"
+    return "0x" + keccak256(signature.encode()).hex()
+
+
+TOPICS = {_topic(name, fields): name for name, fields in EVENTS.items()}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx TEXT NOT NULL,
+    address TEXT NOT NULL,
+    event TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_by_address ON events (address, event, block_number);
+"""
+
+
+@dataclass
+class Log:
+    address: str
+    topics: list[str]
+    data: bytes
+    block_number: int
+    log_index: int
+    # transaction hash, used to group the events emitted by the same call
+    tx: str
+
+
+@dataclass
+class Delegation:
+    delegate: str
+    checker: str
+    end_ts: int
+    # set for selector delegations, None for delegate-wide ones
+    selector: Optional[str]
+    # block of the event that set the delegation
+    block_number: int
+
+
+@dataclass
+class Cooldown:
+    key: str
+    start: int
+    duration: int
+
+
+@dataclass
+class Interval:
+    key: str
+    lb: int
+    ub: int
+
+
+def decode_log(log: Log) -> Optional[tuple[str, dict]]:
+    """Decode a log into (event name, args), None if it is not an indexed event."""
+    if len(log.topics) == 0 or log.topics[0] not in TOPICS:
+        return None
+
+    name = TOPICS[log.topics[0]]
+    fields = EVENTS[name]
+    indexed = [
+        (field, abi_type) for field, abi_type, is_indexed in fields if is_indexed
+    ]
+    data_fields = [
+        (field, abi_type) for field, abi_type, is_indexed in fields if not is_indexed
+    ]
+
+    args = {}
+    for (field, abi_type), topic in zip(indexed, log.topics[1:]):
+        (args[field],) = decode([abi_type], bytes.fromhex(topic[2:]))
+    values = decode([abi_type for _, abi_type in data_fields], log.data)
+    args.update(zip([field for field, _ in data_fields], values))
+
+    for field, abi_type, _ in fields:
+        if abi_type == "address":
+            args[field] = to_checksum_address(args[field])
+        elif abi_type.startswith("bytes"):
+            args[field] = "0x" + args[field].hex()
+    return name, args
+
+
+class RPCLogSource:
+    """Logs from a JSON-RPC endpoint (`eth_getLogs`)."""
+
+    def __init__(self, rpc_url: str, timeout: int = 30):
+        self.rpc_url = rpc_url
+        self.timeout = timeout
+        self._request_id = 0
+
+    def _request(self, method: str, params: list):
+        self._request_id += 1
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._request_id,
+            "method": method,
+            "params": params,
+        }
+        request = urllib.request.Request(
+            self.rpc_url,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = json.loads(response.read())
+
+        if "error" in body:
+            raise RuntimeError(f"{method} failed: {body['error']}")
+        return body["result"]
+
+    def block_number(self) -> int:
+        return int(self._request("eth_blockNumber", []), 16)
+
+    def get_logs(
+        self,
+        from_block: int,
+        to_block: int,
+        addresses: Optional[list[str]],
+        topics: list[str],
+    ) -> list[Log]:
+        params = {
+            "fromBlock": hex(from_block),
+            "toBlock": hex(to_block),
+            "topics": [topics],
+        }
+        if addresses is not None:
+            params["address"] = addresses
+
+        return [
+            Log(
+                address=to_checksum_address(log["address"]),
+                topics=[topic.lower() for topic in log["topics"]],
+                data=bytes.fromhex(log["data"][2:]),
+                block_number=int(log["blockNumber"], 16),
+                log_index=int(log["logIndex"], 16),
+                tx=log["transactionHash"],
+            )
+            for log in self._request("eth_getLogs", [params])
+        ]
+
+
+class BoaLogSource:
+    """
+    Logs from a local titanoboa environment.
+
+    boa does not keep receipts, so the logs of every successful call and
+    deployment are recorded from the moment the source is created. Calls
+    are all executed in the current block, which is only indexed once it
+    is sealed (i.e. with `env.time_travel(blocks=1)`), like a pending block
+    on a live chain. Logs are recorded even if the state is later rolled
+    back (i.e. by `env.anchor()`).
+    """
+
+    def __init__(self, env=None):
+        import boa
+
+        self.env = env if env is not None else boa.env
+        self.logs: list[Log] = []
+        self._tx_count = 0
+
+        self._execute_code = self.env.execute_code
+        self._deploy = self.env.deploy
+        self.env.execute_code = self._recording_execute_code
+        self.env.deploy = self._recording_deploy
+
+    def detach(self):
+        """Stop recording logs."""
+        self.env.execute_code = self._execute_code
+        self.env.deploy = self._deploy
+
+    def _recording_execute_code(self, *args, **kwargs):
+        computation = self._execute_code(*args, **kwargs)
+        if not kwargs.get("simulate", False):
+            self._record(computation)
+        return computation
+
+    def _recording_deploy(self, *args, **kwargs):
+        address, computation = self._deploy(*args, **kwargs)
+        self._record(computation)
+        return address, computation
+
+    def _record(self, computation):
+        if computation.is_error:
+            return
+
+        self._tx_count += 1
+        block_number = self.env.evm.patch.block_number
+        log_index = sum(1 for log in self.logs if log.block_number == block_number)
+        for _, address, topics, data in computation.get_raw_log_entries():
+            self.logs.append(
+                Log(
+                    address=to_checksum_address(address),
+                    topics=["0x" + topic.to_bytes(32, "big").hex() for topic in topics],
+                    data=data,
+                    block_number=block_number,
+                    log_index=log_index,
+                    tx=str(self._tx_count),
+                )
+            )
+            log_index += 1
+
+    def block_number(self) -> int:
+        # the current block is still being built
+        return self.env.evm.patch.block_number - 1
+
+    def get_logs(
+        self,
+        from_block: int,
+        to_block: int,
+        addresses: Optional[list[str]],
+        topics: list[str],
+    ) -> list[Log]:
+        return [
+            log
+            for log in self.logs
+            if from_block <= log.block_number <= to_block
+            and (addresses is None or log.address in addresses)
+            and len(log.topics) != 0
+            and log.topics[0] in topics
+        ]
+
+
+class Indexer:
+    def __init__(
+        self,
+        db_path: str,
+        source,
+        addresses: Optional[Iterable[str]] = None,
+        start_block: int = 0,
+        batch_size: int = 2000,
+        confirmations: int = 0,
+    ):
+        """
+        Index the events of `addresses` (of every contract if None) into the
+        SQLite database at `db_path`, starting from `start_block`. Blocks are
+        fetched in ranges of `batch_size` and only once they have
+        `confirmations` blocks on top of them (to stay clear of reorgs).
+        """
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+        self.source = source
+        self.addresses = (
+            None if addresses is None else [to_checksum_address(a) for a in addresses]
+        )
+        self.start_block = start_block
+        self.batch_size = batch_size
+        self.confirmations = confirmations
+
+    @property
+    def checkpoint(self) -> int:
+        """Last block indexed."""
+        row = self.db.execute("SELECT block_number FROM checkpoint").fetchone()
+        return self.start_block - 1 if row is None else row[0]
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """Index new blocks up to `to_block` (the latest by default), return the events added."""
+        latest = self.source.block_number() - self.confirmations
+        to_block = latest if to_block is None else min(to_block, latest)
+
+        count = 0
+        from_block = self.checkpoint + 1
+        while from_block <= to_block:
+            end = min(from_block + self.batch_size - 1, to_block)
+            logs = self.source.get_logs(from_block, end, self.addresses, list(TOPICS))
+
+            # events and checkpoint are committed together
+            with self.db:
+                for log in logs:
+                    decoded = decode_log(log)
+                    if decoded is None:
+                        continue
+                    name, args = decoded
+                    self.db.execute(
+                        "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            log.block_number,
+                            log.log_index,
+                            log.tx,
+                            log.address,
+                            name,
+                            json.dumps(args),
+                        ),
+                    )
+                    count += 1
+                self.db.execute(
+                    "INSERT OR REPLACE INTO checkpoint VALUES (0, ?)", (end,)
+                )
+
+            from_block = end + 1
+        return count
+
+    def _events(self, address: str, events: list[str], block: Optional[int]):
+        block = self.checkpoint if block is None else block
+        rows = self.db.execute(
+            f"""
+            SELECT block_number, tx, event, args FROM events
+            WHERE address = ? AND event IN ({','.join('?' * len(events))})
+            AND block_number <= ?
+            ORDER BY block_number, log_index
+            """,
+            (to_checksum_address(address), *events, block),
+        )
+        for block_number, tx, event, args in rows:
+            yield block_number, tx, event, json.loads(args)
+
+    def delegations(
+        self, proxy: str, block: Optional[int] = None, timestamp: Optional[int] = None
+    ) -> list[Delegation]:
+        """Delegations of `proxy` as of `block`, only those active at `timestamp` if given."""
+        # delegate -> (tx of the last selector delegation, delegations)
+        state: dict[str, tuple[Optional[str], list[Delegation]]] = {}
+        events = ["DelegationSet", "SelectorDelegationSet", "DelegationKilled"]
+        for block_number, tx, event, args in self._events(proxy, events, block):
+            delegate = args["delegate"]
+            if event == "DelegationKilled":
+                state.pop(delegate, None)
+                continue
+
+            delegation = Delegation(
+                delegate=delegate,
+                checker=args["checker"],
+                end_ts=args["end_ts"],
+                selector=args.get("selector"),
+                block_number=block_number,
+            )
+            if event == "DelegationSet":
+                state[delegate] = (None, [delegation])
+                continue
+
+            # selector delegations set in one call replace all the previous ones
+            previous_tx, previous = state.get(delegate, (None, []))
+            if previous_tx != tx:
+                previous = []
+            state[delegate] = (tx, previous + [delegation])
+
+        return [
+            delegation
+            for _, delegations in state.values()
+            for delegation in delegations
+            if timestamp is None or delegation.end_ts > timestamp
+        ]
+
+    def cooldowns(
+        self, contract: str, block: Optional[int] = None
+    ) -> dict[str, Cooldown]:
+        """Cooldowns of `contract` as of `block`, resets are only seen if they were logged."""
+        state: dict[str, Cooldown] = {}
+        for _, _, event, args in self._events(
+            contract, ["CooldownSet", "CooldownReset"], block
+        ):
+            key = args["key"]
+            if event == "CooldownSet":
+                state[key] = Cooldown(
+                    key=key, start=args["start"], duration=args["duration"]
+                )
+            elif key in state:
+                state[key].start = args["new_start"]
+        return state
+
+    def intervals(
+        self, contract: str, block: Optional[int] = None
+    ) -> dict[str, Interval]:
+        return {
+            args["key"]: Interval(key=args["key"], lb=args["lb"], ub=args["ub"])
+            for _, _, _, args in self._events(contract, ["IntervalSet"], block)
+        }
+
+    def whitelists(
+        self, contract: str, block: Optional[int] = None
+    ) -> dict[str, list[str]]:
+        """Whitelisted addresses of every key, in the order they were added."""
+        state: dict[str, dict[str, None]] = {}
+        events = ["AddressWhitelisted", "AddressRemovedFromWhitelist"]
+        for _, _, event, args in self._events(contract, events, block):
+            addresses = state.setdefault(args["key"], {})
+            if event == "AddressWhitelisted":
+                addresses[args["addr"]] = None
+            else:
+                addresses.pop(args["addr"], None)
+        return {
+            key: list(addresses)
+            for key, addresses in state.items()
+            if len(addresses) != 0
+        }
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,65 @@
+"""
+Merkle trees for the `merkle_whitelist` permission module.
+
+Trees are laid out like OpenZeppelin's `StandardMerkleTree` for a single
+`address` value, so roots and proofs are interchangeable with the ones
+produced by `@openzeppelin/merkle-tree`.
+"""
+
+from vyper.utils import keccak256
+
+
+def _to_bytes(addr) -> bytes:
+    if isinstance(addr, bytes):
+        raw = addr
+    else:
+        raw = bytes.fromhex(str(addr).removeprefix("0x"))
+    if len(raw) != 20:
+        raise ValueError(f"invalid address: {addr}")
+    return raw
+
+
+def _hash_pair(a: bytes, b: bytes) -> bytes:
+    return keccak256(a + b) if a < b else keccak256(b + a)
+
+
+def leaf(addr) -> bytes:
+    """Leaf of `addr`, matches `merkle_whitelist.leaf`."""
+    return keccak256(keccak256(_to_bytes(addr).rjust(32, b"\x00")))
+
+
+class MerkleTree:
+    def __init__(self, addresses):
+        if len(addresses) == 0:
+            raise ValueError("no addresses provided")
+
+        leaves = sorted({leaf(addr) for addr in addresses})
+        if len(leaves) != len(addresses):
+            raise ValueError("duplicate addresses")
+
+        # complete binary tree stored as an array, leaves at the end in
+        # reverse order, children of node i are at 2i + 1 and 2i + 2
+        self._tree = [b""] * (2 * len(leaves) - 1)
+        for i, node in enumerate(leaves):
+            self._tree[len(self._tree) - 1 - i] = node
+        for i in range(len(self._tree) - 1 - len(leaves), -1, -1):
+            self._tree[i] = _hash_pair(self._tree[2 * i + 1], self._tree[2 * i + 2])
+
+        first_leaf = len(self._tree) - len(leaves)
+        self._index = {self._tree[i]: i for i in range(first_leaf, len(self._tree))}
+
+    @property
+    def root(self) -> bytes:
+        return self._tree[0]
+
+    def proof(self, addr) -> list[bytes]:
+        index = self._index.get(leaf(addr))
+        if index is None:
+            raise KeyError(f"{addr} is not in the tree")
+
+        proof = []
+        while index > 0:
+            sibling = index + 1 if index % 2 == 1 else index - 1
+            proof.append(self._tree[sibling])
+            index = (index - 1) // 2
+        return proof
@@ -0,0 +1,97 @@
+# pragma version 0.4.3
+
+# Whitelist over a small universe of up to 256 known addresses (i.e. vaults
+# of a registry). Each address is registered once and gets a bit, every key
+# is a bitmap over the universe: any number of members are added or removed
+# with a single SSTORE and a check costs two SLOADs.
+
+from ownership_proxy.interfaces import IBitmapWhitelist
+
+MAX_UNIVERSE_SIZE: constant(uint256) = 256
+
+# registered addresses, the position of an address is its bit in the bitmaps
+universe: public(DynArray[address, MAX_UNIVERSE_SIZE])
+# 1-based position of each address in `universe`, 0 if not registered
+universe_index: HashMap[address, uint256]
+bitmaps: public(HashMap[bytes32, uint256])
+
+
+@internal
+def register(addr: address) -> uint256:
+    index: uint256 = self.universe_index[addr]
+    # registering is idempotent so universes can be extended blindly
+    if index != 0:
+        return index - 1
+
+    assert addr != empty(address), "empty address"
+    assert len(self.universe) < MAX_UNIVERSE_SIZE, "universe full"
+
+    self.universe.append(addr)
+    index = len(self.universe)
+    self.universe_index[addr] = index
+
+    log IBitmapWhitelist.AddressRegistered(addr=addr, index=index - 1)
+    return index - 1
+
+
+@internal
+def register_multiple(addrs: DynArray[address, MAX_UNIVERSE_SIZE]):
+    for addr: address in addrs:
+        self.register(addr)
+
+
+@internal
+@view
+def mask(addrs: DynArray[address, MAX_UNIVERSE_SIZE]) -> uint256:
+    m: uint256 = 0
+    for addr: address in addrs:
+        index: uint256 = self.universe_index[addr]
+        assert index != 0, "address not registered"
+        m |= 1 << (index - 1)
+    return m
+
+
+@internal
+def set_bitmap(key: bytes32, bitmap: uint256):
+    # bits past the end of the universe would whitelist future registrations
+    assert bitmap >> len(self.universe) == 0, "address not registered"
+
+    self.bitmaps[key] = bitmap
+
+    log IBitmapWhitelist.BitmapWhitelistSet(key=key, bitmap=bitmap)
+
+
+@internal
+def add_multiple(key: bytes32, addrs: DynArray[address, MAX_UNIVERSE_SIZE]):
+    assert len(addrs) > 0, "no addresses provided"
+    self.set_bitmap(key, self.bitmaps[key] | self.mask(addrs))
+
+
+@internal
+def remove_multiple(key: bytes32, addrs: DynArray[address, MAX_UNIVERSE_SIZE]):
+    assert len(addrs) > 0, "no addresses provided"
+    self.set_bitmap(key, self.bitmaps[key] & ~self.mask(addrs))
+
+
+@internal
+@view
+def contains(key: bytes32, addr: address) -> bool:
+    index: uint256 = self.universe_index[addr]
+    return index != 0 and (self.bitmaps[key] >> (index - 1)) & 1 != 0
+
+
+@internal
+@view
+def check(key: bytes32, addr: address):
+    assert self.contains(key, addr), "address not whitelisted"
+
+
+@external
+@view
+def members(key: bytes32) -> DynArray[address, MAX_UNIVERSE_SIZE]:
+    result: DynArray[address, MAX_UNIVERSE_SIZE] = []
+    bitmap: uint256 = self.bitmaps[key]
+    for i: uint256 in range(len(self.universe), bound=MAX_UNIVERSE_SIZE):
+        if (bitmap >> i) & 1 != 0:
+            result.append(self.universe[i])
+    return result
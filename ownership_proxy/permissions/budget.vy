@@ -0,0 +1,46 @@
+# pragma version 0.4.3
+
+# Per-transaction budgets: the amount consumed is kept in transient storage
+# (EIP-1153), so it resets at the end of every transaction without paying
+# for an SSTORE. Useful to cap the total of several calls batched in one
+# transaction (i.e. through `proxy__multicall`).
+# A budget with a limit of N where every call consumes 1 is a call counter.
+
+from ownership_proxy.interfaces import IBudget
+
+budget_limits: public(HashMap[bytes32, uint256])
+# limit = 0 can be a valid budget, so we need to track if a budget exists
+budget_exists: HashMap[bytes32, bool]
+budget_spent: transient(HashMap[bytes32, uint256])
+
+
+@internal
+def add(key: bytes32, limit: uint256, override: bool = False):
+    if self.budget_exists[key]:
+        assert override, "budget already exists"
+
+    self.budget_limits[key] = limit
+    self.budget_exists[key] = True
+
+    log IBudget.BudgetSet(key=key, limit=limit)
+
+
+@internal
+@view
+def remaining(key: bytes32) -> uint256:
+    # Amount that can still be consumed in the current transaction
+    limit: uint256 = self.budget_limits[key]
+    spent: uint256 = self.budget_spent[key]
+    if spent >= limit:
+        return 0
+    return limit - spent
+
+
+@internal
+def consume(key: bytes32, amount: uint256):
+    assert self.budget_exists[key], "budget does not exist"
+
+    spent: uint256 = self.budget_spent[key] + amount
+    assert spent <= self.budget_limits[key], "budget exceeded"
+
+    self.budget_spent[key] = spent
@@ -0,0 +1,37 @@
+# pragma version 0.4.3
+
+# Reads arguments straight from the calldata of the checked call, without
+# ABI-decoding it, so a checker doesn't have to mirror the target's signature.
+# Arguments are addressed by their head word: `index` 0 is the first word after
+# the selector. Dynamic arguments (Bytes, DynArray, String) only have their
+# offset in the head, so only static arguments can be checked this way.
+
+
+@internal
+@view
+def selector() -> bytes4:
+    assert len(msg.data) >= 4, "calldata too short"
+    return convert(slice(msg.data, 0, 4), bytes4)
+
+
+@internal
+@view
+def word(index: uint256) -> uint256:
+    offset: uint256 = 4 + 32 * index
+    assert len(msg.data) >= offset + 32, "calldata too short"
+    return convert(slice(msg.data, offset, 32), uint256)
+
+
+@internal
+@view
+def address_arg(index: uint256) -> address:
+    w: uint256 = self.word(index)
+    # a valid ABI encoding pads addresses with zeros
+    assert w >> 160 == 0, "invalid address"
+    return convert(convert(w, uint160), address)
+
+
+@internal
+@view
+def check_equals(index: uint256, expected: uint256):
+    assert self.word(index) == expected, "argument mismatch"
@@ -1,9 +1,38 @@
 # pragma version 0.4.3
 
 # TODO make module friendly
-from contracts.interfaces import ICooldown
+from ownership_proxy.interfaces import ICooldown
 
-cooldowns: public(HashMap[bytes32, ICooldown.Cooldown])
+# vyper does not pack structs, so cooldowns are packed manually:
+# start in the low 128 bits, duration in the high 128 bits
+cooldowns_packed: HashMap[bytes32, uint256]
+
+
+@internal
+@pure
+def _pack(cd: ICooldown.Cooldown) -> uint256:
+    return convert(cd.start, uint256) | (convert(cd.duration, uint256) << 128)
+
+
+@internal
+@pure
+def _unpack(packed: uint256) -> ICooldown.Cooldown:
+    return ICooldown.Cooldown(
+        start=convert(packed & convert(max_value(uint128), uint256), uint128),
+        duration=convert(packed >> 128, uint128),
+    )
+
+
+@internal
+@view
+def get(key: bytes32) -> ICooldown.Cooldown:
+    return self._unpack(self.cooldowns_packed[key])
+
+
+@external
+@view
+def cooldowns(key: bytes32) -> ICooldown.Cooldown:
+    return self.get(key)
 
 
 @internal
@@ -11,14 +40,15 @@ def add(key: bytes32, duration: uint256, override: bool = False):
     assert duration > 0, "duration must be positive"
     assert duration < 2**128, "duration too large"
 
-    cd: ICooldown.Cooldown = self.cooldowns[key]
-    if cd.start + cd.duration != 0:
+    if self.cooldowns_packed[key] != 0:
         assert override, "cooldown already exists"
 
 
     # Add the new cooldown
-    self.cooldowns[key] = ICooldown.Cooldown(
-        start=convert(block.timestamp, uint128), duration=convert(duration, uint128)
+    self.cooldowns_packed[key] = self._pack(
+        ICooldown.Cooldown(
+            start=convert(block.timestamp, uint128), duration=convert(duration, uint128)
+        )
     )
 
     log ICooldown.CooldownSet(key=key, start=block.timestamp, duration=duration)
@@ -36,12 +66,13 @@ def add_from_days(key: bytes32, duration_days: uint256, override: bool = False):
 
 @internal
 def check_and_reset(key: bytes32, log_reset: bool = False):
-    cd: ICooldown.Cooldown = self.cooldowns[key]
-    cd_end: uint256 = convert(cd.start + cd.duration, uint256)
+    cd: ICooldown.Cooldown = self.get(key)
+    cd_end: uint256 = convert(cd.start, uint256) + convert(cd.duration, uint256)
     assert block.timestamp >= cd_end, "cooldown not expired"
 
     # Reset the cooldown
-    self.cooldowns[key].start = convert(block.timestamp, uint128)
+    cd.start = convert(block.timestamp, uint128)
+    self.cooldowns_packed[key] = self._pack(cd)
 
     # Might be useful in some cases
     if log_reset:
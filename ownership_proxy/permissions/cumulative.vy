@@ -0,0 +1,118 @@
+# pragma version 0.4.3
+
+# Cumulative caps: the total amount consumed in each period (i.e. 1 day) is
+# capped, however it is split between calls. Periods are back to back from
+# the time the cap is added, and the amount spent is reset lazily by the
+# first call of a new period, so no keeper has to reset it.
+# Unlike the ratelimit bucket, which refills continuously, a cap is fully
+# available again at the start of every period: up to twice the cap can be
+# consumed around the boundary between two periods.
+
+from ownership_proxy.interfaces import ICumulative
+
+from ownership_proxy.permissions import packing
+
+# packed manually in the layout of the packing module (shared with ratelimit):
+# spent (96 bits) | cap (96 bits) | period (24 bits) | period_start (40 bits)
+cumulatives_packed: HashMap[bytes32, uint256]
+
+
+@internal
+@pure
+def _pack(cc: ICumulative.CumulativeCap) -> uint256:
+    return packing.pack(cc.spent, cc.cap, cc.period, cc.period_start)
+
+
+@internal
+@pure
+def _unpack(packed: uint256) -> ICumulative.CumulativeCap:
+    spent: uint96 = 0
+    cap: uint96 = 0
+    period: uint24 = 0
+    period_start: uint40 = 0
+    spent, cap, period, period_start = packing.unpack(packed)
+    return ICumulative.CumulativeCap(
+        spent=spent, cap=cap, period=period, period_start=period_start
+    )
+
+
+@internal
+@view
+def _roll(cc: ICumulative.CumulativeCap) -> ICumulative.CumulativeCap:
+    start: uint256 = convert(cc.period_start, uint256)
+    period: uint256 = convert(cc.period, uint256)
+    if block.timestamp < start + period:
+        return cc
+
+    # skip to the period containing the current block, empty
+    return ICumulative.CumulativeCap(
+        spent=0,
+        cap=cc.cap,
+        period=cc.period,
+        period_start=convert(start + (block.timestamp - start) // period * period, uint40),
+    )
+
+
+@internal
+@view
+def get(key: bytes32) -> ICumulative.CumulativeCap:
+    return self._unpack(self.cumulatives_packed[key])
+
+
+@external
+@view
+def cumulatives(key: bytes32) -> ICumulative.CumulativeCap:
+    return self.get(key)
+
+
+@internal
+def add(key: bytes32, cap: uint256, period: uint256, override: bool = False):
+    assert cap > 0, "cap must be positive"
+    assert cap <= packing.UINT96_MASK, "cap too large"
+    assert period > 0, "period must be positive"
+    assert period <= packing.UINT24_MASK, "period too large"
+
+    if self.cumulatives_packed[key] != 0:
+        assert override, "cumulative cap already exists"
+
+
+    # The first period starts now
+    self.cumulatives_packed[key] = self._pack(
+        ICumulative.CumulativeCap(
+            spent=0,
+            cap=convert(cap, uint96),
+            period=convert(period, uint24),
+            period_start=convert(block.timestamp, uint40),
+        )
+    )
+
+    log ICumulative.CumulativeCapSet(key=key, cap=cap, period=period)
+
+
+@internal
+def add_per_day(key: bytes32, cap: uint256, override: bool = False):
+    self.add(key, cap, 86400, override)
+
+
+@internal
+@view
+def remaining(key: bytes32) -> uint256:
+    # Amount that could be consumed right now
+    packed: uint256 = self.cumulatives_packed[key]
+    if packed == 0:
+        return 0
+    cc: ICumulative.CumulativeCap = self._roll(self._unpack(packed))
+    return convert(cc.cap, uint256) - convert(cc.spent, uint256)
+
+
+@internal
+def check_and_consume(key: bytes32, amount: uint256):
+    packed: uint256 = self.cumulatives_packed[key]
+    assert packed != 0, "cumulative cap does not exist"
+
+    cc: ICumulative.CumulativeCap = self._roll(self._unpack(packed))
+    spent: uint256 = convert(cc.spent, uint256) + amount
+    assert spent <= convert(cc.cap, uint256), "cumulative cap exceeded"
+
+    cc.spent = convert(spent, uint96)
+    self.cumulatives_packed[key] = self._pack(cc)
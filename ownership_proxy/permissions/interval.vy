@@ -1,7 +1,7 @@
 # pragma version 0.4.3
 
 # TODO make module friendly
-from contracts.interfaces import IInterval
+from ownership_proxy.interfaces import IInterval
 
 implements: IInterval
 
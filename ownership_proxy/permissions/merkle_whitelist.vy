@@ -0,0 +1,44 @@
+# pragma version 0.4.3
+
+# Whitelist committed to as a single merkle root per key: setting it is O(1)
+# regardless of the size of the list and checks cost O(log n).
+# Trees follow OpenZeppelin's StandardMerkleTree for a single `address`
+# value, they can be built with `ownership_proxy.merkle` or OZ's js library.
+
+from snekmate.utils import merkle_proof_verification
+
+from ownership_proxy.interfaces import IMerkleWhitelist
+
+MAX_PROOF_DEPTH: constant(uint256) = 32
+
+merkle_roots: public(HashMap[bytes32, bytes32])
+
+
+@internal
+def set_root(key: bytes32, root: bytes32, override: bool = False):
+    assert root != empty(bytes32), "empty root"
+
+    if self.merkle_roots[key] != empty(bytes32):
+        assert override, "merkle root already set"
+
+    self.merkle_roots[key] = root
+
+    log IMerkleWhitelist.MerkleRootSet(key=key, root=root)
+
+
+@internal
+@pure
+def leaf(addr: address) -> bytes32:
+    # double hashing prevents second preimage attacks with internal nodes
+    return keccak256(keccak256(abi_encode(addr)))
+
+
+@internal
+@view
+def check(key: bytes32, addr: address, proof: DynArray[bytes32, MAX_PROOF_DEPTH]):
+    root: bytes32 = self.merkle_roots[key]
+    assert root != empty(bytes32), "merkle root not set"
+
+    assert merkle_proof_verification._verify(proof, root, self.leaf(addr)), (
+        "address not whitelisted"
+    )
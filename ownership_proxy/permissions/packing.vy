@@ -0,0 +1,31 @@
+# pragma version 0.4.3
+
+# Slot layout shared by the ratelimit and cumulative modules, which both keep
+# an amount, its bound, a period and a timestamp in a single slot (vyper does
+# not pack structs):
+# amount (96 bits) | bound (96 bits) | period (24 bits) | timestamp (40 bits)
+
+UINT96_MASK: constant(uint256) = 2**96 - 1
+UINT24_MASK: constant(uint256) = 2**24 - 1
+
+
+@internal
+@pure
+def pack(amount: uint96, bound: uint96, period: uint24, timestamp: uint40) -> uint256:
+    return (
+        convert(amount, uint256)
+        | (convert(bound, uint256) << 96)
+        | (convert(period, uint256) << 192)
+        | (convert(timestamp, uint256) << 216)
+    )
+
+
+@internal
+@pure
+def unpack(packed: uint256) -> (uint96, uint96, uint24, uint40):
+    return (
+        convert(packed & UINT96_MASK, uint96),
+        convert((packed >> 96) & UINT96_MASK, uint96),
+        convert((packed >> 192) & UINT24_MASK, uint24),
+        convert(packed >> 216, uint40),
+    )
@@ -0,0 +1,119 @@
+# pragma version 0.4.3
+
+# Token bucket: up to `capacity` units can be consumed, and the bucket
+# refills linearly, reaching full capacity again after `period` seconds.
+# i.e. capacity = X, period = 1 day allows "up to X units per day".
+
+from ownership_proxy.interfaces import IRateLimit
+
+from ownership_proxy.permissions import packing
+
+# packed manually in the layout of the packing module (shared with cumulative):
+# level (96 bits) | capacity (96 bits) | period (24 bits) | last_update (40 bits)
+ratelimits_packed: HashMap[bytes32, uint256]
+
+
+@internal
+@pure
+def _pack(rl: IRateLimit.RateLimit) -> uint256:
+    return packing.pack(rl.level, rl.capacity, rl.period, rl.last_update)
+
+
+@internal
+@pure
+def _unpack(packed: uint256) -> IRateLimit.RateLimit:
+    level: uint96 = 0
+    capacity: uint96 = 0
+    period: uint24 = 0
+    last_update: uint40 = 0
+    level, capacity, period, last_update = packing.unpack(packed)
+    return IRateLimit.RateLimit(
+        level=level, capacity=capacity, period=period, last_update=last_update
+    )
+
+
+@internal
+@view
+def _refill(rl: IRateLimit.RateLimit) -> IRateLimit.RateLimit:
+    last_update: uint256 = convert(rl.last_update, uint256)
+    capacity: uint256 = convert(rl.capacity, uint256)
+    period: uint256 = convert(rl.period, uint256)
+    added: uint256 = (block.timestamp - last_update) * capacity // period
+    level: uint256 = convert(rl.level, uint256) + added
+
+    if level >= capacity:
+        level = capacity
+        last_update = block.timestamp
+    else:
+        # only the time of the whole units added is used up (rounded up so
+        # it is never credited twice), the remainder keeps accruing
+        last_update += (added * period + capacity - 1) // capacity
+
+    return IRateLimit.RateLimit(
+        level=convert(level, uint96),
+        capacity=rl.capacity,
+        period=rl.period,
+        last_update=convert(last_update, uint40),
+    )
+
+
+@internal
+@view
+def get(key: bytes32) -> IRateLimit.RateLimit:
+    return self._unpack(self.ratelimits_packed[key])
+
+
+@external
+@view
+def ratelimits(key: bytes32) -> IRateLimit.RateLimit:
+    return self.get(key)
+
+
+@internal
+def add(key: bytes32, capacity: uint256, period: uint256, override: bool = False):
+    assert capacity > 0, "capacity must be positive"
+    assert capacity <= packing.UINT96_MASK, "capacity too large"
+    assert period > 0, "period must be positive"
+    assert period <= packing.UINT24_MASK, "period too large"
+
+    if self.ratelimits_packed[key] != 0:
+        assert override, "rate limit already exists"
+
+    # New buckets start full
+    self.ratelimits_packed[key] = self._pack(
+        IRateLimit.RateLimit(
+            level=convert(capacity, uint96),
+            capacity=convert(capacity, uint96),
+            period=convert(period, uint24),
+            last_update=convert(block.timestamp, uint40),
+        )
+    )
+
+    log IRateLimit.RateLimitSet(key=key, capacity=capacity, period=period)
+
+
+@internal
+def add_per_day(key: bytes32, capacity: uint256, override: bool = False):
+    self.add(key, capacity, 86400, override)
+
+
+@internal
+@view
+def available(key: bytes32) -> uint256:
+    # Amount that could be consumed right now
+    packed: uint256 = self.ratelimits_packed[key]
+    if packed == 0:
+        return 0
+    return convert(self._refill(self._unpack(packed)).level, uint256)
+
+
+@internal
+def check_and_consume(key: bytes32, amount: uint256):
+    packed: uint256 = self.ratelimits_packed[key]
+    assert packed != 0, "rate limit does not exist"
+
+    rl: IRateLimit.RateLimit = self._refill(self._unpack(packed))
+    assert amount <= convert(rl.level, uint256), "rate limit exceeded"
+
+    rl.level = convert(convert(rl.level, uint256) - amount, uint96)
+    self.ratelimits_packed[key] = self._pack(rl)
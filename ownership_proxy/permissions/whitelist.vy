@@ -1,22 +1,32 @@
 # pragma version 0.4.3
 
 # TODO make module friendly
-from contracts.interfaces import IWhitelist
+from ownership_proxy.interfaces import IWhitelist
 
-whitelist: HashMap[bytes32, HashMap[address, bool]]
+# members per key, bounded so that whitelists can be enumerated
+MAX_WHITELIST_SIZE: constant(uint256) = 1000
+
+# members of each whitelist, in no particular order
 whitelist_array: HashMap[bytes32, DynArray[address, MAX_WHITELIST_SIZE]]
+# 1-based position of each member in `whitelist_array`, 0 if not whitelisted
+whitelist_index: HashMap[bytes32, HashMap[address, uint256]]
 
-MAX_WHITELIST_SIZE: constant(uint256) = 1000
+
+@internal
+@view
+def contains(key: bytes32, addr: address) -> bool:
+    return self.whitelist_index[key][addr] != 0
 
 
 @internal
 def add(key: bytes32, addr: address, override: bool = False):
-    if self.whitelist[key][addr]:
+    if self.whitelist_index[key][addr] != 0:
         assert override, "address already whitelisted"
-
-
-    # Add the address to the whitelist
-    self.whitelist[key][addr] = True
+    else:
+        # Add the address to the whitelist
+        assert len(self.whitelist_array[key]) < MAX_WHITELIST_SIZE, "whitelist full"
+        self.whitelist_array[key].append(addr)
+        self.whitelist_index[key][addr] = len(self.whitelist_array[key])
 
     log IWhitelist.AddressWhitelisted(key=key, addr=addr)
 
@@ -33,15 +43,49 @@ def add_multiple(
 
 @internal
 def remove(key: bytes32, addr: address):
-    assert self.whitelist[key][addr], "address not whitelisted"
+    index: uint256 = self.whitelist_index[key][addr]
+    assert index != 0, "address not whitelisted"
 
-    # Remove the address from the whitelist
-    self.whitelist[key][addr] = False
+    # Swap the last member into the freed position and pop
+    last: address = self.whitelist_array[key].pop()
+    if last != addr:
+        self.whitelist_array[key][index - 1] = last
+        self.whitelist_index[key][last] = index
+    self.whitelist_index[key][addr] = 0
 
     log IWhitelist.AddressRemovedFromWhitelist(key=key, addr=addr)
 
 
 @internal
+@view
 def check(key: bytes32, addr: address):
     # Check if the address is whitelisted for the given key
-    assert self.whitelist[key][addr], "address not whitelisted"
+    assert self.whitelist_index[key][addr] != 0, "address not whitelisted"
+
+
+@external
+@view
+def count(key: bytes32) -> uint256:
+    return len(self.whitelist_array[key])
+
+
+@external
+@view
+def at(key: bytes32, i: uint256) -> address:
+    assert i < len(self.whitelist_array[key]), "index out of bounds"
+    return self.whitelist_array[key][i]
+
+
+@external
+@view
+def slice(key: bytes32, start: uint256, n: uint256) -> DynArray[address, MAX_WHITELIST_SIZE]:
+    # Truncated to the end of the whitelist, so pages can be requested blindly
+    members: DynArray[address, MAX_WHITELIST_SIZE] = []
+    size: uint256 = len(self.whitelist_array[key])
+    if start >= size:
+        return members
+
+    end: uint256 = min(start + min(n, MAX_WHITELIST_SIZE), size)
+    for i: uint256 in range(start, end, bound=MAX_WHITELIST_SIZE):
+        members.append(self.whitelist_array[key][i])
+    return members
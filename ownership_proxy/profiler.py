@@ -0,0 +1,378 @@
+"""
+Gas profiling of delegated calls.
+
+Runs a call through a proxy with a per-PC gas meter and reports where the gas
+goes: per call frame (the proxy, the checker and the target), per source line
+and per storage access, with the cold/warm status of every slot and the
+storage variable and HashMap keys (i.e. permission keys) it belongs to.
+Reports can be dumped as JSON or as folded stacks for flamegraph tools
+(`flamegraph.pl`, speedscope, ...).
+
+Source lines and storage variables are only known for contracts registered in
+the environment (i.e. deployed or loaded with boa), other frames are reported
+as a whole. Profiling relies on the opcode interpreter, so it is not
+available in boa's fast mode.
+"""
+
+import contextlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import boa
+from boa.contracts.vyper.ast_utils import get_fn_ancestor_from_node
+from boa.environment import Env
+from boa.vm.gas_meters import ProfilingGasMeter
+from eth_utils import to_checksum_address, to_int
+from vyper.utils import method_id
+
+from ownership_proxy.simulator import decode_revert_reason, intrinsic_gas
+
+SLOAD = 0x54
+SSTORE = 0x55
+
+# struct members and DynArray items are stored at an offset from the hashed
+# slot of their HashMap entry
+MAX_SLOT_OFFSET = 1024
+
+
+@dataclass
+class Frame:
+    # proxy, checker or target (calls made by the checker or the target
+    # belong to them)
+    role: str
+    # address whose storage is used, and whose code runs (they differ for
+    # clones, which DELEGATECALL their implementation)
+    address: str
+    code_address: str
+    # source path of the code, None if it isn't registered in the environment
+    contract: Optional[str]
+    depth: int
+    parent: Optional[int]
+    success: bool
+    # including calls to other frames
+    gas_used: int
+    self_gas: int
+    sloads: int = 0
+    sstores: int = 0
+
+
+@dataclass
+class LineGas:
+    frame: int
+    path: str
+    lineno: int
+    function: Optional[str]
+    gas: int
+
+
+@dataclass
+class StorageAccess:
+    frame: int
+    op: str
+    slot: int
+    cold: bool
+    # storage variable and HashMap keys (outermost first) the slot belongs
+    # to, None if it can't be resolved
+    variable: Optional[str]
+    keys: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CallProfile:
+    calldata: bytes
+    success: bool
+    reason: Optional[str]
+    # execution gas, without the intrinsic cost of the transaction or refunds
+    gas_used: int
+    intrinsic_gas: int
+    gas_refund: int
+    frames: list[Frame]
+    lines: list[LineGas]
+    storage: list[StorageAccess]
+
+    def gas_by_role(self) -> dict[str, int]:
+        """Gas spent by the proxy, the checker and the target themselves."""
+        result = {}
+        for frame in self.frames:
+            result[frame.role] = result.get(frame.role, 0) + frame.self_gas
+        return result
+
+    def permission_keys(self) -> list[dict]:
+        """Storage accesses grouped by contract, variable and outermost key."""
+        groups = {}
+        for access in self.storage:
+            frame = self.frames[access.frame]
+            key = access.keys[0] if access.keys else None
+            group = groups.setdefault(
+                (frame.address, access.variable, key),
+                {
+                    "role": frame.role,
+                    "address": frame.address,
+                    "variable": access.variable,
+                    "key": key,
+                    "sloads": 0,
+                    "sstores": 0,
+                    "cold": 0,
+                    "warm": 0,
+                },
+            )
+            group["sloads" if access.op == "SLOAD" else "sstores"] += 1
+            group["cold" if access.cold else "warm"] += 1
+        return list(groups.values())
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        report = asdict(self)
+        report["calldata"] = "0x" + self.calldata.hex()
+        report["gas_by_role"] = self.gas_by_role()
+        report["permission_keys"] = self.permission_keys()
+        return json.dumps(report, indent=indent)
+
+    def folded(self) -> str:
+        """Self gas per stack (call frames, then source line), one `stack gas` per line."""
+        stacks = []
+        for i, frame in enumerate(self.frames):
+            path = []
+            parent = i
+            while parent is not None:
+                f = self.frames[parent]
+                path.append(f"{f.role} {f.contract or f.code_address}")
+                parent = f.parent
+            stack = ";".join(reversed(path))
+
+            unattributed = frame.self_gas
+            for line in self.lines:
+                if line.frame != i:
+                    continue
+                unattributed -= line.gas
+                if line.gas > 0:
+                    stacks.append(
+                        f"{stack};{line.function or '?'} ({line.path}:{line.lineno}) {line.gas}"
+                    )
+            if unattributed > 0:
+                stacks.append(f"{stack} {unattributed}")
+
+        return "\n".join(stacks) + "\n"
+
+
+@contextlib.contextmanager
+def cold_access(env: Env):
+    """Make every account and storage slot cold, as at the start of a transaction."""
+    # `env.reset_gas_used()` drops the access journal altogether, which
+    # breaks the snapshots boa takes around each test, so swap it out instead
+    account_db = env.evm.vm.state._account_db
+    accessed = account_db._journal_accessed_state
+    account_db._reset_access_counters()
+    try:
+        yield
+    finally:
+        account_db._journal_accessed_state = accessed
+
+
+class _StorageTracer:
+    # wraps SLOAD/SSTORE to record the slot and whether it was cold
+
+    def __init__(self, opcode_fn, op, accesses):
+        self.opcode_fn = opcode_fn
+        self.mnemonic = op
+        self.accesses = accesses
+
+    def __call__(self, computation):
+        slot = to_int(computation._stack.values[-1])
+        cold = not computation.state.is_storage_warm(
+            computation.msg.storage_address, slot
+        )
+        self.accesses.append((computation, self.mnemonic, slot, cold))
+
+        self.opcode_fn(computation=computation)
+
+
+@contextlib.contextmanager
+def _trace_storage(env: Env, accesses: list):
+    computation_class = env.evm.vm.state.computation_class
+    opcodes = computation_class.opcodes
+    # computations copy the class opcodes on creation
+    computation_class.opcodes = {
+        **opcodes,
+        SLOAD: _StorageTracer(opcodes[SLOAD], "SLOAD", accesses),
+        SSTORE: _StorageTracer(opcodes[SSTORE], "SSTORE", accesses),
+    }
+    try:
+        yield
+    finally:
+        computation_class.opcodes = opcodes
+
+
+def _relpath(path):
+    try:
+        return os.path.relpath(path)
+    except ValueError:
+        return path
+
+
+def _storage_variables(contract) -> dict[int, tuple[str, int]]:
+    # base slot -> (dotted name, number of slots), module variables included
+    result = {}
+
+    def walk(layout, prefix):
+        for name, item in layout.items():
+            if "slot" in item and "type" in item:
+                result[item["slot"]] = (prefix + name, item["n_slots"])
+            else:
+                walk(item, prefix + name + ".")
+
+    walk(contract.compiler_data.storage_layout.get("storage_layout", {}), "")
+    return result
+
+
+def _resolve_slot(slot, variables, preimages, depth=0):
+    for base, (name, n_slots) in variables.items():
+        if base <= slot < base + n_slots:
+            return name, []
+
+    # HashMap entries are stored at keccak256(parent slot . key)
+    if depth < 8:
+        for offset in range(min(slot, MAX_SLOT_OFFSET) + 1):
+            preimage = preimages.get(slot - offset)
+            if preimage is None:
+                continue
+            parent = int.from_bytes(preimage[:32], "big")
+            name, keys = _resolve_slot(parent, variables, preimages, depth + 1)
+            return name, keys + ["0x" + preimage[32:].hex()]
+
+    return None, []
+
+
+class GasProfiler:
+    def __init__(self, proxy_address, env: Optional[Env] = None):
+        self.proxy_address = to_checksum_address(proxy_address)
+        self.env = env if env is not None else boa.env
+
+    def _target(self) -> str:
+        computation = self.env.execute_code(
+            to_address=self.proxy_address, data=method_id("proxy__target()")
+        )
+        return to_checksum_address(computation.output[12:32])
+
+    def profile(
+        self, delegate, calldata: bytes, timestamp: Optional[int] = None, value: int = 0
+    ) -> CallProfile:
+        """
+        Profile `delegate` sending `calldata` to the proxy, with cold storage
+        as at the start of a transaction. The environment is left untouched.
+        """
+        accesses = []
+        with self.env.anchor():
+            if timestamp is not None:
+                self.env.evm.patch.timestamp = timestamp
+            target = self._target()
+
+            with (
+                self.env.gas_meter_class(ProfilingGasMeter),
+                _trace_storage(self.env, accesses),
+                cold_access(self.env),
+            ):
+                computation = self.env.execute_code(
+                    to_address=self.proxy_address,
+                    sender=delegate,
+                    data=calldata,
+                    value=value,
+                )
+
+        frames, lines, computations = [], [], {}
+        self._walk(computation, target, None, frames, lines, computations)
+
+        # preimages of the slots hashed during the call (and before)
+        preimages = {
+            int.from_bytes(k, "big"): v for k, v in self.env.sha3_trace.items()
+        }
+        storage = []
+        for c, op, slot, cold in accesses:
+            i = computations[id(c)]
+            frame = frames[i]
+            if op == "SLOAD":
+                frame.sloads += 1
+            else:
+                frame.sstores += 1
+
+            variable, keys = None, []
+            contract = self.env.lookup_contract(c.msg.code_address)
+            if hasattr(contract, "compiler_data"):
+                variable, keys = _resolve_slot(
+                    slot, _storage_variables(contract), preimages
+                )
+            storage.append(StorageAccess(i, op, slot, cold, variable, keys))
+
+        return CallProfile(
+            calldata=calldata,
+            success=not computation.is_error,
+            reason=decode_revert_reason(computation.output)
+            if computation.is_error
+            else None,
+            gas_used=computation.get_gas_used(),
+            intrinsic_gas=intrinsic_gas(calldata),
+            gas_refund=computation.get_gas_refund(),
+            frames=frames,
+            lines=lines,
+            storage=storage,
+        )
+
+    def _walk(self, computation, target, parent, frames, lines, computations):
+        code_address = to_checksum_address(computation.msg.code_address)
+        if parent is None:
+            role = "proxy"
+        elif frames[parent].role == "proxy":
+            role = "target" if code_address == target else "checker"
+        else:
+            role = frames[parent].role
+
+        contract = self.env.lookup_contract(computation.msg.code_address)
+        source_map = getattr(contract, "source_map", None)
+
+        # gas charged at each PC, calls to other frames excluded (they are
+        # charged to the PC of the CALL)
+        gas_by_pc = dict(computation._gas_meter._gas_used_of)
+        for pc, child in zip(computation._child_pcs, computation.children):
+            gas_by_pc[pc - 1] = gas_by_pc.get(pc - 1, 0) - child.get_gas_used()
+
+        i = len(frames)
+        computations[id(computation)] = i
+        frames.append(
+            Frame(
+                role=role,
+                address=to_checksum_address(computation.msg.storage_address),
+                code_address=code_address,
+                contract=_relpath(contract.compiler_data.contract_path)
+                if source_map is not None
+                else None,
+                depth=0 if parent is None else frames[parent].depth + 1,
+                parent=parent,
+                success=not computation.is_error,
+                gas_used=computation.get_gas_used(),
+                self_gas=sum(gas_by_pc.values()),
+            )
+        )
+
+        if source_map is not None:
+            # PCs without a source node belong to the last node executed
+            by_line = {}
+            node, seen = None, set()
+            for pc in computation.code._trace:
+                node = source_map["pc_raw_ast_map"].get(pc, node)
+                if pc in seen or node is None:
+                    continue
+                seen.add(pc)
+                fn = get_fn_ancestor_from_node(node)
+                line = (
+                    node.module_node.resolved_path,
+                    node.lineno,
+                    fn.name if fn else None,
+                )
+                by_line[line] = by_line.get(line, 0) + gas_by_pc.get(pc, 0)
+
+            for (path, lineno, fn_name), gas in by_line.items():
+                lines.append(LineGas(i, _relpath(path), lineno, fn_name, gas))
+
+        for child in computation.children:
+            self._walk(child, target, i, frames, lines, computations)
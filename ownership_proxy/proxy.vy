@@ -14,6 +14,10 @@ exports: (
     access_control.supportsInterface
 )
 
+from snekmate.utils import ecdsa
+from snekmate.utils import eip712_domain_separator
+initializes: eip712_domain_separator
+
 from ownership_proxy.interfaces import IProxy
 
 implements: IProxy
@@ -21,55 +25,417 @@ implements: IProxy
 DAO_ROLE: constant(bytes32) = keccak256("DAO_ROLE")
 EMERGENCY_ADMIN_ROLE: constant(bytes32) = keccak256("EMERGENCY_ADMIN_ROLE")
 
-# TODO figure our right size 
-MAX_OUTSIZE: constant(uint256) = 32 * 10000
+# the CALL pays memory expansion for its whole output buffer whatever the
+# target returns, so forwarded calls use a small buffer by default and the
+# large one only if the proxy is deployed with `_large_returndata`
+MAX_OUTSIZE: constant(uint256) = 32 * 128
+MAX_LARGE_OUTSIZE: constant(uint256) = 32 * 10000
+
+MAX_FAST_SELECTORS: constant(uint256) = 8
+MAX_SELECTOR_DELEGATIONS: constant(uint256) = 8
+MAX_BATCH_SIZE: constant(uint256) = 100
+MAX_MULTICALL_SIZE: constant(uint256) = 20
+MAX_MULTICALL_CALLDATA: constant(uint256) = 32 * 32
+MAX_MULTICALL_OUTSIZE: constant(uint256) = 32 * 32
+MAX_DELEGATES: constant(uint256) = 2**16
+MAX_SIGNED_CALLDATA: constant(uint256) = 32 * 32
+MAX_PREVIEW_CALLDATA: constant(uint256) = 32 * 32
+MAX_REASON: constant(uint256) = 128
+# enough for an Error(string) with a reason of MAX_REASON bytes
+MAX_REVERT_DATA: constant(uint256) = 4 + 32 * 2 + MAX_REASON
+# keccak256("Error(string)")[:4]
+ERROR_SELECTOR: constant(bytes4) = 0x08c379a0
+
+DELEGATED_CALL_TYPEHASH: constant(bytes32) = keccak256(
+    "DelegatedCall(address delegate,bytes data,uint256 nonce,uint256 deadline)"
+)
 
-delegations: HashMap[address, IProxy.DelegationMetadata]
+# vyper does not pack structs, so delegations are packed manually:
+# checker in the low 160 bits, end_ts in the next 64 bits, the number
+# of (fast or delegated) selectors in the next 8 bits, the 1-based
+# position of the delegate in `delegates` in the next 23 bits and the
+# selector mode flag in the top bit
+delegations: HashMap[address, uint256]
+# every delegate with a delegation (expired ones included until they are
+# killed or swept), in no particular order
+delegates: DynArray[address, MAX_DELEGATES]
+# fast selectors packed 32 bits each, only read if the delegation has any
+fast_selectors: HashMap[address, uint256]
+# in selector mode each selector has its own checker and end_ts (packed as
+# above) and unlisted selectors are rejected without calling any checker
+selector_delegations: HashMap[address, HashMap[bytes4, uint256]]
+# the selectors listed in selector mode, packed 32 bits each
+delegated_selectors: HashMap[address, uint256]
+# runtime code hashes of the checkers the DAO has reviewed, clones of the
+# same implementation (see `checker_factory.vy`) share the same hash
+checker_codehashes: HashMap[bytes32, bool]
+# nonces of signed calls are bits rather than a counter (bit `nonce % 256`
+# of word `nonce // 256`), so signed calls can be submitted in any order
+signed_nonces: HashMap[address, HashMap[uint256, uint256]]
 TARGET: immutable(address)
+LARGE_RETURNDATA: immutable(bool)
+
+ADDRESS_MASK: constant(uint256) = 2**160 - 1
+UINT64_MASK: constant(uint256) = 2**64 - 1
+SELECTOR_MASK: constant(uint256) = 2**32 - 1
+COUNT_MASK: constant(uint256) = 2**8 - 1
+INDEX_MASK: constant(uint256) = 2**23 - 1
+INDEX_SHIFT: constant(uint256) = 232
+SELECTOR_MODE: constant(uint256) = 1 << 255
+# codehash of accounts without code
+EMPTY_CODEHASH: constant(bytes32) = keccak256(b"")
 
 
 @deploy
-def __init__(_target: address, _dao: address):
+def __init__(_target: address, _dao: address, _large_returndata: bool):
     assert _target != empty(address), "empty target"
     assert _dao != empty(address), "empty dao"
 
     access_control.__init__()
+    eip712_domain_separator.__init__("Ownership Proxy", "1")
     access_control._revoke_role(access_control.DEFAULT_ADMIN_ROLE, msg.sender)
     access_control._grant_role(access_control.DEFAULT_ADMIN_ROLE, _dao)
     access_control._grant_role(DAO_ROLE, _dao)
     TARGET = _target
+    LARGE_RETURNDATA = _large_returndata
 
 
 @external
 @payable
 @raw_return
-def __default__() -> Bytes[MAX_OUTSIZE]:
-    metadata: IProxy.DelegationMetadata = self.delegations[msg.sender]
-
-    is_delegate: bool = metadata.end_ts > block.timestamp
+@nonreentrant
+def __default__() -> Bytes[MAX_LARGE_OUTSIZE + 1]:
+    packed: uint256 = self.delegations[msg.sender]
+    if packed & SELECTOR_MODE != 0:
+        packed = 0
+        if len(msg.data) >= 4:
+            selector: bytes4 = convert(slice(msg.data, 0, 4), bytes4)
+            packed = self.selector_delegations[msg.sender][selector]
+
+    is_delegate: bool = (packed >> 160) & UINT64_MASK > block.timestamp
     if is_delegate:
-        raw_call(metadata.checker, msg.data)
+        fast_selectors_count: uint256 = (packed >> 224) & COUNT_MASK
+        is_fast: bool = False
+        if fast_selectors_count != 0 and len(msg.data) >= 4:
+            is_fast = self._is_fast_selector(
+                self.fast_selectors[msg.sender],
+                fast_selectors_count,
+                convert(convert(slice(msg.data, 0, 4), bytes4), uint256),
+            )
+
+        # fast selectors are pre-approved by the DAO and skip the checker
+        if not is_fast:
+            raw_call(convert(convert(packed & ADDRESS_MASK, uint160), address), msg.data)
     else:
         access_control._check_role(DAO_ROLE, msg.sender)
 
-    result: Bytes[MAX_OUTSIZE] = b""
-    result = raw_call(TARGET, msg.data, value=msg.value, max_outsize=MAX_OUTSIZE)
-    return result
+    # one extra byte to tell truncated return data apart, the small buffer
+    # comes first so that its memory is laid out before the large one
+    if not LARGE_RETURNDATA:
+        result: Bytes[MAX_OUTSIZE + 1] = raw_call(
+            TARGET, msg.data, value=msg.value, max_outsize=MAX_OUTSIZE + 1
+        )
+        assert len(result) <= MAX_OUTSIZE, "return data too large"
+        return result
+
+    large_result: Bytes[MAX_LARGE_OUTSIZE + 1] = raw_call(
+        TARGET, msg.data, value=msg.value, max_outsize=MAX_LARGE_OUTSIZE + 1
+    )
+    assert len(large_result) <= MAX_LARGE_OUTSIZE, "return data too large"
+    return large_result
 
 
 @external
-def proxy__set_delegation(
+@nonreentrant
+def proxy__multicall(
+    _calls: DynArray[Bytes[MAX_MULTICALL_CALLDATA], MAX_MULTICALL_SIZE],
+) -> DynArray[Bytes[MAX_MULTICALL_OUTSIZE + 1], MAX_MULTICALL_SIZE]:
+    packed: uint256 = self.delegations[msg.sender]
+
+    # authorization is resolved once for the whole batch (or once per call
+    # in selector mode), every call still goes through the checker right
+    # before being forwarded
+    selector_mode: bool = packed & SELECTOR_MODE != 0
+    is_delegate: bool = (packed >> 160) & UINT64_MASK > block.timestamp
+    checker: address = empty(address)
+    fast_selectors_count: uint256 = 0
+    packed_selectors: uint256 = 0
+    if is_delegate:
+        checker = convert(convert(packed & ADDRESS_MASK, uint160), address)
+        fast_selectors_count = (packed >> 224) & COUNT_MASK
+        if fast_selectors_count != 0:
+            packed_selectors = self.fast_selectors[msg.sender]
+    elif not selector_mode:
+        access_control._check_role(DAO_ROLE, msg.sender)
+
+    # one extra byte per result to tell truncated return data apart
+    results: DynArray[Bytes[MAX_MULTICALL_OUTSIZE + 1], MAX_MULTICALL_SIZE] = []
+    for call: Bytes[MAX_MULTICALL_CALLDATA] in _calls:
+        if selector_mode:
+            call_packed: uint256 = 0
+            if len(call) >= 4:
+                selector: bytes4 = convert(slice(call, 0, 4), bytes4)
+                call_packed = self.selector_delegations[msg.sender][selector]
+            if (call_packed >> 160) & UINT64_MASK > block.timestamp:
+                raw_call(convert(convert(call_packed & ADDRESS_MASK, uint160), address), call)
+            else:
+                access_control._check_role(DAO_ROLE, msg.sender)
+        elif is_delegate:
+            is_fast: bool = False
+            if fast_selectors_count != 0 and len(call) >= 4:
+                is_fast = self._is_fast_selector(
+                    packed_selectors,
+                    fast_selectors_count,
+                    convert(convert(slice(call, 0, 4), bytes4), uint256),
+                )
+
+            if not is_fast:
+                raw_call(checker, call)
+
+        result: Bytes[MAX_MULTICALL_OUTSIZE + 1] = raw_call(
+            TARGET, call, max_outsize=MAX_MULTICALL_OUTSIZE + 1
+        )
+        assert len(result) <= MAX_MULTICALL_OUTSIZE, "return data too large"
+        results.append(result)
+
+    return results
+
+
+@external
+@nonreentrant
+def proxy__execute_signed(
     _delegate: address,
-    _metadata: IProxy.DelegationMetadata,
-    ):
-    access_control._check_role(DAO_ROLE, msg.sender)
+    _calldata: Bytes[MAX_SIGNED_CALLDATA],
+    _nonce: uint256,
+    _deadline: uint256,
+    _signature: Bytes[65],
+) -> Bytes[MAX_LARGE_OUTSIZE + 1]:
+    # anyone can relay a call signed (EIP-712) by a delegate, it goes
+    # through the delegation of the signer as if they had sent it
+    assert block.timestamp <= _deadline, "signature expired"
+    digest: bytes32 = eip712_domain_separator._hash_typed_data_v4(
+        keccak256(
+            abi_encode(DELEGATED_CALL_TYPEHASH, _delegate, keccak256(_calldata), _nonce, _deadline)
+        )
+    )
+    signer: address = ecdsa._recover_sig(digest, _signature)
+    assert signer != empty(address) and signer == _delegate, "invalid signature"
+
+    word: uint256 = _nonce >> 8
+    bit: uint256 = 1 << (_nonce & 255)
+    bitmap: uint256 = self.signed_nonces[_delegate][word]
+    assert bitmap & bit == 0, "nonce already used"
+    self.signed_nonces[_delegate][word] = bitmap | bit
+
+    # same flow as `__default__`, without the DAO fallback (i.e. the DAO
+    # doesn't sign)
+    packed: uint256 = self.delegations[_delegate]
+    if packed & SELECTOR_MODE != 0:
+        packed = 0
+        if len(_calldata) >= 4:
+            selector: bytes4 = convert(slice(_calldata, 0, 4), bytes4)
+            packed = self.selector_delegations[_delegate][selector]
+    assert (packed >> 160) & UINT64_MASK > block.timestamp, "not a delegate"
+
+    fast_selectors_count: uint256 = (packed >> 224) & COUNT_MASK
+    is_fast: bool = False
+    if fast_selectors_count != 0 and len(_calldata) >= 4:
+        is_fast = self._is_fast_selector(
+            self.fast_selectors[_delegate],
+            fast_selectors_count,
+            convert(convert(slice(_calldata, 0, 4), bytes4), uint256),
+        )
+    if not is_fast:
+        raw_call(convert(convert(packed & ADDRESS_MASK, uint160), address), _calldata)
+
+    log IProxy.SignedCallExecuted(delegate=_delegate, nonce=_nonce)
+
+    # same return data bound as `__default__`
+    if not LARGE_RETURNDATA:
+        result: Bytes[MAX_OUTSIZE + 1] = raw_call(TARGET, _calldata, max_outsize=MAX_OUTSIZE + 1)
+        assert len(result) <= MAX_OUTSIZE, "return data too large"
+        return result
+
+    large_result: Bytes[MAX_LARGE_OUTSIZE + 1] = raw_call(
+        TARGET, _calldata, max_outsize=MAX_LARGE_OUTSIZE + 1
+    )
+    assert len(large_result) <= MAX_LARGE_OUTSIZE, "return data too large"
+    return large_result
+
+
+@external
+def proxy__invalidate_nonces(_word: uint256, _mask: uint256):
+    # lets a delegate cancel calls they signed but that weren't relayed yet
+    self.signed_nonces[msg.sender][_word] |= _mask
+
+    log IProxy.NoncesInvalidated(delegate=msg.sender, word=_word, mask=_mask)
+
+
+@external
+def proxy__preview(
+    _delegate: address,
+    _calldata: Bytes[MAX_PREVIEW_CALLDATA],
+) -> (bool, String[MAX_REASON], uint256):
+    # whether `_delegate` sending `_calldata` would be authorized right now,
+    # the revert reason if not and the gas of the checker call, without
+    # calling the target. Meant for `eth_call`: the checker runs in a self
+    # call that always reverts, so state changes of stateful checkers (i.e.
+    # cooldown resets) are undone even if this is sent in a transaction
+    success: bool = False
+    response: Bytes[32 * 4 + MAX_REASON] = b""
+    success, response = raw_call(
+        self,
+        abi_encode(
+            _delegate,
+            _calldata,
+            method_id=method_id("proxy__preview_and_revert(address,bytes)"),
+        ),
+        max_outsize=32 * 4 + MAX_REASON,
+        revert_on_failure=False,
+    )
+    # anything shorter than the encoding of an empty reason is not the
+    # payload of `proxy__preview_and_revert` (i.e. it ran out of gas)
+    if len(response) < 32 * 4:
+        return False, "", 0
+    return abi_decode(response, (bool, String[MAX_REASON], uint256))
+
+
+@external
+def proxy__preview_and_revert(_delegate: address, _calldata: Bytes[MAX_PREVIEW_CALLDATA]):
+    assert msg.sender == self, "only self"
+
+    # same flow as `__default__`
+    packed: uint256 = self.delegations[_delegate]
+    if packed & SELECTOR_MODE != 0:
+        packed = 0
+        if len(_calldata) >= 4:
+            selector: bytes4 = convert(slice(_calldata, 0, 4), bytes4)
+            packed = self.selector_delegations[_delegate][selector]
+
+    allowed: bool = True
+    reason: String[MAX_REASON] = ""
+    checker_gas: uint256 = 0
+    if (packed >> 160) & UINT64_MASK > block.timestamp:
+        fast_selectors_count: uint256 = (packed >> 224) & COUNT_MASK
+        is_fast: bool = False
+        if fast_selectors_count != 0 and len(_calldata) >= 4:
+            is_fast = self._is_fast_selector(
+                self.fast_selectors[_delegate],
+                fast_selectors_count,
+                convert(convert(slice(_calldata, 0, 4), bytes4), uint256),
+            )
+
+        if not is_fast:
+            success: bool = False
+            response: Bytes[MAX_REVERT_DATA] = b""
+            gas_start: uint256 = msg.gas
+            success, response = raw_call(
+                convert(convert(packed & ADDRESS_MASK, uint160), address),
+                _calldata,
+                max_outsize=MAX_REVERT_DATA,
+                revert_on_failure=False,
+            )
+            checker_gas = gas_start - msg.gas
+            if not success:
+                allowed = False
+                reason = self._revert_reason(response)
+    elif not access_control.hasRole[DAO_ROLE][_delegate]:
+        allowed = False
+        reason = "access_control: account is missing role"
+
+    raw_revert(abi_encode(allowed, reason, checker_gas))
+
+
+@internal
+@pure
+def _revert_reason(_response: Bytes[MAX_REVERT_DATA]) -> String[MAX_REASON]:
+    # the reason of an Error(string), truncated to MAX_REASON bytes, other
+    # revert data (i.e. custom errors and panics) has none
+    if len(_response) < 68 or convert(slice(_response, 0, 4), bytes4) != ERROR_SELECTOR:
+        return ""
+    length: uint256 = min(extract32(_response, 36, output_type=uint256), len(_response) - 68)
+    return convert(slice(_response, 68, length), String[MAX_REASON])
+
+
+@internal
+@pure
+def _is_fast_selector(_packed_selectors: uint256, _count: uint256, _selector: uint256) -> bool:
+    for i: uint256 in range(_count, bound=MAX_FAST_SELECTORS):
+        if (_packed_selectors >> (32 * i)) & SELECTOR_MASK == _selector:
+            return True
+    return False
+
+
+@internal
+@pure
+def _pack(_metadata: IProxy.DelegationMetadata) -> (uint256, uint256):
+    packed_selectors: uint256 = 0
+    for i: uint256 in range(len(_metadata.fast_selectors), bound=MAX_FAST_SELECTORS):
+        packed_selectors |= convert(_metadata.fast_selectors[i], uint256) << (32 * i)
+
+    packed: uint256 = (
+        convert(_metadata.checker, uint256)
+        | (_metadata.end_ts << 160)
+        | (len(_metadata.fast_selectors) << 224)
+    )
+    return packed, packed_selectors
+
+
+@internal
+@pure
+def _unpack(_packed: uint256, _packed_selectors: uint256) -> IProxy.DelegationMetadata:
+    fast_selectors: DynArray[bytes4, MAX_FAST_SELECTORS] = []
+    for i: uint256 in range((_packed >> 224) & COUNT_MASK, bound=MAX_FAST_SELECTORS):
+        fast_selectors.append(
+            convert(convert((_packed_selectors >> (32 * i)) & SELECTOR_MASK, uint32), bytes4)
+        )
+
+    return IProxy.DelegationMetadata(
+        end_ts=(_packed >> 160) & UINT64_MASK,
+        checker=convert(convert(_packed & ADDRESS_MASK, uint160), address),
+        fast_selectors=fast_selectors,
+    )
+
+
+@internal
+@view
+def _validate_checker(_checker: address, _end_ts: uint256):
+    assert _checker != empty(address), "empty checker"
+    assert _end_ts > block.timestamp, "invalid delegation duration"
+    assert _end_ts <= convert(max_value(uint64), uint256), "end_ts too large"
+    codehash: bytes32 = _checker.codehash
+    assert codehash != empty(bytes32), "invalid checker"
+    assert self.checker_codehashes[codehash], "checker not approved"
+
+
+@internal
+def _clear_selector_delegations(_delegate: address, _packed: uint256):
+    # selector delegations outlive the flag, so they are cleared one by one
+    # before the delegation is replaced or killed
+    packed_selectors: uint256 = self.delegated_selectors[_delegate]
+    for i: uint256 in range((_packed >> 224) & COUNT_MASK, bound=MAX_SELECTOR_DELEGATIONS):
+        selector: bytes4 = convert(
+            convert((packed_selectors >> (32 * i)) & SELECTOR_MASK, uint32), bytes4
+        )
+        self.selector_delegations[_delegate][selector] = 0
+    self.delegated_selectors[_delegate] = 0
 
+
+@internal
+def _set_delegation(_delegate: address, _metadata: IProxy.DelegationMetadata):
     assert _delegate != empty(address), "empty delegate"
-    assert _metadata.checker != empty(address), "empty checker"
-    assert _metadata.end_ts > block.timestamp, "invalid delegation duration"
-    assert _metadata.checker.codehash != empty(bytes32), "invalid checker"
+    self._validate_checker(_metadata.checker, _metadata.end_ts)
+
+    previous: uint256 = self.delegations[_delegate]
+    if previous & SELECTOR_MODE != 0:
+        self._clear_selector_delegations(_delegate, previous)
 
-    self.delegations[_delegate] = _metadata
+    packed: uint256 = 0
+    packed_selectors: uint256 = 0
+    packed, packed_selectors = self._pack(_metadata)
+    self.delegations[_delegate] = packed | self._index(_delegate, previous)
+    if len(_metadata.fast_selectors) != 0:
+        self.fast_selectors[_delegate] = packed_selectors
 
     log IProxy.DelegationSet(
         delegate=_delegate,
@@ -78,9 +444,134 @@ def proxy__set_delegation(
     )
 
 
+@external
+def proxy__set_delegation(
+    _delegate: address,
+    _metadata: IProxy.DelegationMetadata,
+    ):
+    access_control._check_role(DAO_ROLE, msg.sender)
+    self._set_delegation(_delegate, _metadata)
+
+
+@external
+def proxy__set_delegations(
+    _delegates: DynArray[address, MAX_BATCH_SIZE],
+    _metadatas: DynArray[IProxy.DelegationMetadata, MAX_BATCH_SIZE],
+    ):
+    access_control._check_role(DAO_ROLE, msg.sender)
+    assert len(_delegates) == len(_metadatas), "length mismatch"
+
+    for i: uint256 in range(len(_delegates), bound=MAX_BATCH_SIZE):
+        self._set_delegation(_delegates[i], _metadatas[i])
+
+
+@external
+def proxy__set_checker_codehash(_codehash: bytes32, _approved: bool):
+    access_control._check_role(DAO_ROLE, msg.sender)
+    assert _codehash != empty(bytes32) and _codehash != EMPTY_CODEHASH, "invalid codehash"
+
+    # revoking a codehash does not affect delegations that are already set
+    self.checker_codehashes[_codehash] = _approved
+
+    log IProxy.CheckerCodehashSet(codehash=_codehash, approved=_approved)
+
+
+@external
+def proxy__set_selector_delegations(
+    _delegate: address,
+    _delegations: DynArray[IProxy.SelectorDelegation, MAX_SELECTOR_DELEGATIONS],
+    ):
+    access_control._check_role(DAO_ROLE, msg.sender)
+    assert _delegate != empty(address), "empty delegate"
+    assert len(_delegations) != 0, "no selector delegations"
+
+    # replaces any previous delegation of `_delegate`
+    previous: uint256 = self.delegations[_delegate]
+    if previous & SELECTOR_MODE != 0:
+        self._clear_selector_delegations(_delegate, previous)
+    elif (previous >> 224) & COUNT_MASK != 0:
+        self.fast_selectors[_delegate] = 0
+
+    packed_selectors: uint256 = 0
+    for i: uint256 in range(len(_delegations), bound=MAX_SELECTOR_DELEGATIONS):
+        delegation: IProxy.SelectorDelegation = _delegations[i]
+        self._validate_checker(delegation.checker, delegation.end_ts)
+        assert (
+            self.selector_delegations[_delegate][delegation.selector] == 0
+        ), "duplicate selector"
+
+        self.selector_delegations[_delegate][delegation.selector] = (
+            convert(delegation.checker, uint256) | (delegation.end_ts << 160)
+        )
+        packed_selectors |= convert(delegation.selector, uint256) << (32 * i)
+
+        log IProxy.SelectorDelegationSet(
+            delegate=_delegate,
+            selector=delegation.selector,
+            end_ts=delegation.end_ts,
+            checker=delegation.checker
+        )
+
+    self.delegations[_delegate] = (
+        SELECTOR_MODE | (len(_delegations) << 224) | self._index(_delegate, previous)
+    )
+    self.delegated_selectors[_delegate] = packed_selectors
+
+
+@internal
+def _index(_delegate: address, _packed: uint256) -> uint256:
+    # adds new delegates to `delegates`, returns the position bits to keep
+    # in their packed delegation
+    index: uint256 = (_packed >> INDEX_SHIFT) & INDEX_MASK
+    if index == 0:
+        self.delegates.append(_delegate)
+        index = len(self.delegates)
+    return index << INDEX_SHIFT
+
+
+@internal
+def _unindex(_packed: uint256):
+    index: uint256 = (_packed >> INDEX_SHIFT) & INDEX_MASK
+    if index == 0:
+        return
+
+    # swap the last delegate into the freed position and pop
+    last: address = self.delegates.pop()
+    if index <= len(self.delegates):
+        self.delegates[index - 1] = last
+        last_packed: uint256 = self.delegations[last]
+        self.delegations[last] = (
+            (last_packed & ~(INDEX_MASK << INDEX_SHIFT)) | (index << INDEX_SHIFT)
+        )
+
+
+@internal
+@view
+def _is_expired(_delegate: address, _packed: uint256) -> bool:
+    if _packed & SELECTOR_MODE == 0:
+        return (_packed >> 160) & UINT64_MASK <= block.timestamp
+
+    # in selector mode the delegate is expired once all its selectors are
+    packed_selectors: uint256 = self.delegated_selectors[_delegate]
+    for i: uint256 in range((_packed >> 224) & COUNT_MASK, bound=MAX_SELECTOR_DELEGATIONS):
+        selector: bytes4 = convert(
+            convert((packed_selectors >> (32 * i)) & SELECTOR_MASK, uint32), bytes4
+        )
+        packed_delegation: uint256 = self.selector_delegations[_delegate][selector]
+        if (packed_delegation >> 160) & UINT64_MASK > block.timestamp:
+            return False
+    return True
+
+
 @internal
 def _kill_delegation(_delegate: address):
-    self.delegations[_delegate] = empty(IProxy.DelegationMetadata)
+    packed: uint256 = self.delegations[_delegate]
+    if packed & SELECTOR_MODE != 0:
+        self._clear_selector_delegations(_delegate, packed)
+    elif (packed >> 224) & COUNT_MASK != 0:
+        self.fast_selectors[_delegate] = 0
+    self._unindex(packed)
+    self.delegations[_delegate] = 0
 
     log IProxy.DelegationKilled(delegate=_delegate)
 
@@ -98,10 +589,132 @@ def proxy__emergency_kill_delegation(_delegate: address):
     self._kill_delegation(_delegate)
 
 
+@external
+def proxy__kill_delegations(_delegates: DynArray[address, MAX_BATCH_SIZE]):
+    access_control._check_role(DAO_ROLE, msg.sender)
+    for delegate: address in _delegates:
+        self._kill_delegation(delegate)
+
+
+@external
+def proxy__emergency_kill_delegations(_delegates: DynArray[address, MAX_BATCH_SIZE]):
+    access_control._check_role(EMERGENCY_ADMIN_ROLE, msg.sender)
+    for delegate: address in _delegates:
+        self._kill_delegation(delegate)
+
+
+@external
+def proxy__sweep_expired(_delegates: DynArray[address, MAX_BATCH_SIZE]) -> uint256:
+    # anyone can clear expired delegations (and get the storage refunds),
+    # delegates that aren't expired (or have no delegation) are skipped so
+    # that concurrent sweeps don't revert
+    swept: uint256 = 0
+    for delegate: address in _delegates:
+        packed: uint256 = self.delegations[delegate]
+        if packed == 0 or not self._is_expired(delegate, packed):
+            continue
+
+        self._kill_delegation(delegate)
+        swept += 1
+    return swept
+
+
 @external
 @view
 def proxy__delegations(_delegate: address) -> IProxy.DelegationMetadata:
-    return self.delegations[_delegate]
+    packed: uint256 = self.delegations[_delegate]
+    # delegates in selector mode have no delegate-wide metadata
+    if packed & SELECTOR_MODE != 0:
+        return empty(IProxy.DelegationMetadata)
+
+    packed_selectors: uint256 = 0
+    if (packed >> 224) & COUNT_MASK != 0:
+        packed_selectors = self.fast_selectors[_delegate]
+    return self._unpack(packed, packed_selectors)
+
+
+@external
+@view
+def proxy__selector_delegations(
+    _delegate: address,
+) -> DynArray[IProxy.SelectorDelegation, MAX_SELECTOR_DELEGATIONS]:
+    packed: uint256 = self.delegations[_delegate]
+    delegations: DynArray[IProxy.SelectorDelegation, MAX_SELECTOR_DELEGATIONS] = []
+    if packed & SELECTOR_MODE == 0:
+        return delegations
+
+    packed_selectors: uint256 = self.delegated_selectors[_delegate]
+    for i: uint256 in range((packed >> 224) & COUNT_MASK, bound=MAX_SELECTOR_DELEGATIONS):
+        selector: bytes4 = convert(
+            convert((packed_selectors >> (32 * i)) & SELECTOR_MASK, uint32), bytes4
+        )
+        packed_delegation: uint256 = self.selector_delegations[_delegate][selector]
+        delegations.append(
+            IProxy.SelectorDelegation(
+                selector=selector,
+                end_ts=(packed_delegation >> 160) & UINT64_MASK,
+                checker=convert(convert(packed_delegation & ADDRESS_MASK, uint160), address),
+            )
+        )
+    return delegations
+
+
+@external
+@view
+def proxy__delegate_count() -> uint256:
+    return len(self.delegates)
+
+
+@external
+@view
+def proxy__delegates(_start: uint256, _n: uint256) -> DynArray[address, MAX_BATCH_SIZE]:
+    # truncated to the end of the index, so pages can be requested blindly
+    page: DynArray[address, MAX_BATCH_SIZE] = []
+    size: uint256 = len(self.delegates)
+    if _start >= size:
+        return page
+
+    end: uint256 = min(_start + min(_n, MAX_BATCH_SIZE), size)
+    for i: uint256 in range(_start, end, bound=MAX_BATCH_SIZE):
+        page.append(self.delegates[i])
+    return page
+
+
+@external
+@view
+def proxy__expired_delegates(
+    _start: uint256, _n: uint256
+) -> DynArray[address, MAX_BATCH_SIZE]:
+    # the expired delegates among `_n` delegates from `_start`, to be swept
+    expired: DynArray[address, MAX_BATCH_SIZE] = []
+    size: uint256 = len(self.delegates)
+    if _start >= size:
+        return expired
+
+    end: uint256 = min(_start + min(_n, MAX_BATCH_SIZE), size)
+    for i: uint256 in range(_start, end, bound=MAX_BATCH_SIZE):
+        delegate: address = self.delegates[i]
+        if self._is_expired(delegate, self.delegations[delegate]):
+            expired.append(delegate)
+    return expired
+
+
+@external
+@view
+def proxy__nonce_bitmap(_delegate: address, _word: uint256) -> uint256:
+    return self.signed_nonces[_delegate][_word]
+
+
+@external
+@view
+def proxy__domain_separator() -> bytes32:
+    return eip712_domain_separator._domain_separator_v4()
+
+
+@external
+@view
+def proxy__checker_codehashes(_codehash: bytes32) -> bool:
+    return self.checker_codehashes[_codehash]
 
 
 @external
@@ -110,6 +723,12 @@ def proxy__target() -> address:
     return TARGET
 
 
+@external
+@view
+def proxy__large_returndata() -> bool:
+    return LARGE_RETURNDATA
+
+
 @external
 @pure
 def proxy__DAO_ROLE() -> bytes32:
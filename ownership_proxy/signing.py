@@ -0,0 +1,166 @@
+"""
+EIP-712 signing of delegated calls.
+
+A delegate signs `DelegatedCall(delegate, data, nonce, deadline)` and anyone
+(i.e. a relayer submitting the calls of many delegates) sends it to the proxy
+with `proxy__execute_signed`, which runs it through the delegation of the
+signer. Nonces are the bits of a per delegate bitmap rather than a counter,
+so signed calls can be relayed in any order, and calls that weren't relayed
+yet are cancelled with `proxy__invalidate_nonces`.
+
+Hashing only needs eth_abi, signing also needs eth_account (a dependency of
+titanoboa).
+"""
+
+from dataclasses import dataclass
+
+from eth_abi import encode
+from eth_utils import to_checksum_address
+from vyper.utils import keccak256
+
+DOMAIN_NAME = "Ownership Proxy"
+DOMAIN_VERSION = "1"
+
+EIP712_DOMAIN_TYPE = [
+    {"name": "name", "type": "string"},
+    {"name": "version", "type": "string"},
+    {"name": "chainId", "type": "uint256"},
+    {"name": "verifyingContract", "type": "address"},
+]
+DELEGATED_CALL_TYPE = [
+    {"name": "delegate", "type": "address"},
+    {"name": "data", "type": "bytes"},
+    {"name": "nonce", "type": "uint256"},
+    {"name": "deadline", "type": "uint256"},
+]
+
+DOMAIN_TYPEHASH = keccak256(
+    b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+DELEGATED_CALL_TYPEHASH = keccak256(
+    b"DelegatedCall(address delegate,bytes data,uint256 nonce,uint256 deadline)"
+)
+
+# bound of the calldata of signed calls
+MAX_SIGNED_CALLDATA = 32 * 32
+
+
+@dataclass
+class SignedCall:
+    delegate: str
+    data: bytes
+    nonce: int
+    deadline: int
+    signature: bytes
+
+    def args(self) -> tuple:
+        """Arguments of `proxy__execute_signed`."""
+        return self.delegate, self.data, self.nonce, self.deadline, self.signature
+
+
+def typed_data(
+    proxy_address, chain_id: int, delegate, data: bytes, nonce: int, deadline: int
+):
+    """The message to sign, as expected by `eth_signTypedData_v4` and eth_account."""
+    return {
+        "types": {
+            "EIP712Domain": EIP712_DOMAIN_TYPE,
+            "DelegatedCall": DELEGATED_CALL_TYPE,
+        },
+        "primaryType": "DelegatedCall",
+        "domain": {
+            "name": DOMAIN_NAME,
+            "version": DOMAIN_VERSION,
+            "chainId": chain_id,
+            "verifyingContract": to_checksum_address(proxy_address),
+        },
+        "message": {
+            "delegate": to_checksum_address(delegate),
+            "data": bytes(data),
+            "nonce": nonce,
+            "deadline": deadline,
+        },
+    }
+
+
+def domain_separator(proxy_address, chain_id: int) -> bytes:
+    return keccak256(
+        encode(
+            ["bytes32", "bytes32", "bytes32", "uint256", "address"],
+            [
+                DOMAIN_TYPEHASH,
+                keccak256(DOMAIN_NAME.encode()),
+                keccak256(DOMAIN_VERSION.encode()),
+                chain_id,
+                to_checksum_address(proxy_address),
+            ],
+        )
+    )
+
+
+def digest(
+    proxy_address, chain_id: int, delegate, data: bytes, nonce: int, deadline: int
+):
+    """The hash the delegate signs, as computed by the proxy."""
+    struct_hash = keccak256(
+        encode(
+            ["bytes32", "address", "bytes32", "uint256", "uint256"],
+            [
+                DELEGATED_CALL_TYPEHASH,
+                to_checksum_address(delegate),
+                keccak256(data),
+                nonce,
+                deadline,
+            ],
+        )
+    )
+    return keccak256(
+        b"\x19\x01" + domain_separator(proxy_address, chain_id) + struct_hash
+    )
+
+
+def sign_delegated_call(
+    private_key, proxy_address, chain_id: int, data: bytes, nonce: int, deadline: int
+) -> SignedCall:
+    """Sign `data` for the proxy at `proxy_address` with the key of the delegate."""
+    from eth_account import Account
+    from eth_account.messages import encode_typed_data
+
+    if len(data) > MAX_SIGNED_CALLDATA:
+        raise ValueError(
+            f"calldata too large: {len(data)} > {MAX_SIGNED_CALLDATA} bytes"
+        )
+
+    account = Account.from_key(private_key)
+    message = typed_data(
+        proxy_address, chain_id, account.address, data, nonce, deadline
+    )
+    signed = account.sign_message(encode_typed_data(full_message=message))
+    return SignedCall(
+        account.address, bytes(data), nonce, deadline, bytes(signed.signature)
+    )
+
+
+def nonce_masks(nonces) -> dict[int, int]:
+    """Bitmap words and masks covering `nonces`, i.e. to invalidate them."""
+    masks = {}
+    for nonce in nonces:
+        masks[nonce >> 8] = masks.get(nonce >> 8, 0) | (1 << (nonce & 255))
+    return masks
+
+
+def unused_nonces(proxy, delegate, n: int, word: int = 0) -> list[int]:
+    """
+    `n` nonces that `delegate` hasn't used yet on `proxy` (a boa contract),
+    from bitmap word `word` on.
+    """
+    nonces = []
+    while len(nonces) < n:
+        bitmap = proxy.proxy__nonce_bitmap(delegate, word)
+        for bit in range(256):
+            if not bitmap >> bit & 1:
+                nonces.append((word << 8) | bit)
+                if len(nonces) == n:
+                    break
+        word += 1
+    return nonces
@@ -0,0 +1,134 @@
+"""
+Off-chain simulation of delegated calls.
+
+Runs calls through a proxy (and its checker and target) in a titanoboa
+environment, either local or forked from a live chain, to find out whether
+they would pass before paying for a transaction.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import boa
+from boa.environment import Env
+
+# keccak256("Error(string)")[:4] and keccak256("Panic(uint256)")[:4]
+ERROR_SELECTOR = bytes.fromhex("08c379a0")
+PANIC_SELECTOR = bytes.fromhex("4e487b71")
+
+TX_BASE_GAS = 21000
+CALLDATA_ZERO_BYTE_GAS = 4
+CALLDATA_NONZERO_BYTE_GAS = 16
+
+
+@dataclass
+class SimulationResult:
+    calldata: bytes
+    success: bool
+    # decoded revert reason, None if the call succeeded or reverted without data
+    reason: Optional[str]
+    # execution gas plus the intrinsic cost of the transaction
+    gas_used: int
+    output: bytes
+
+
+def decode_revert_reason(data: bytes) -> Optional[str]:
+    if len(data) == 0:
+        return None
+
+    if data[:4] == ERROR_SELECTOR and len(data) >= 68:
+        length = int.from_bytes(data[36:68], "big")
+        return data[68 : 68 + length].decode(errors="replace")
+
+    if data[:4] == PANIC_SELECTOR and len(data) >= 36:
+        return f"panic: {hex(int.from_bytes(data[4:36], 'big'))}"
+
+    return "0x" + data.hex()
+
+
+def intrinsic_gas(calldata: bytes) -> int:
+    zero_bytes = calldata.count(0)
+    return (
+        TX_BASE_GAS
+        + zero_bytes * CALLDATA_ZERO_BYTE_GAS
+        + (len(calldata) - zero_bytes) * CALLDATA_NONZERO_BYTE_GAS
+    )
+
+
+class DelegationSimulator:
+    def __init__(self, proxy_address, env: Optional[Env] = None):
+        self.proxy_address = proxy_address
+        self.env = env if env is not None else boa.env
+
+    @classmethod
+    def from_rpc(cls, proxy_address, rpc_url: str, block_identifier="latest"):
+        """Simulate against a fork of a live chain, without touching the network state."""
+        env = Env()
+        env.fork(rpc_url, block_identifier=block_identifier, deprecated=False)
+        return cls(proxy_address, env)
+
+    def _execute(self, delegate, calldata: bytes, value: int) -> SimulationResult:
+        # every call is a transaction of its own, transient storage (EIP-1153)
+        # doesn't carry over from the previous one
+        self.env.evm.vm.state.clear_transient_storage()
+        computation = self.env.execute_code(
+            to_address=self.proxy_address, sender=delegate, data=calldata, value=value
+        )
+
+        gas_used = computation.get_gas_used() + intrinsic_gas(calldata)
+        if computation.is_error:
+            return SimulationResult(
+                calldata=calldata,
+                success=False,
+                reason=decode_revert_reason(computation.output),
+                gas_used=gas_used,
+                output=computation.output,
+            )
+
+        return SimulationResult(
+            calldata=calldata,
+            success=True,
+            reason=None,
+            gas_used=gas_used,
+            output=computation.output,
+        )
+
+    def simulate(
+        self, delegate, calldata: bytes, timestamp: Optional[int] = None, value: int = 0
+    ) -> SimulationResult:
+        """Predict the outcome of `delegate` sending `calldata` to the proxy at `timestamp`."""
+        return self.simulate_batch(delegate, [calldata], timestamp, value)[0]
+
+    def simulate_batch(
+        self,
+        delegate,
+        calls: list[bytes],
+        timestamp: Optional[int] = None,
+        value: int = 0,
+        sequential: bool = False,
+    ) -> list[SimulationResult]:
+        """
+        Simulate several candidate calls from `delegate`.
+
+        By default every call starts from the current state, so they can be
+        compared to pick which ones to submit. With `sequential=True` the
+        calls are applied one after the other (i.e. as if they were included
+        in that order in the same block) and each sees the effects of the
+        previous successful ones (i.e. cooldown resets), except for transient
+        storage, which is cleared between transactions.
+        The environment is left untouched in both cases.
+        """
+        results = []
+        with self.env.anchor():
+            if timestamp is not None:
+                self.env.evm.patch.timestamp = timestamp
+
+            for calldata in calls:
+                if sequential:
+                    results.append(self._execute(delegate, calldata, value))
+                    continue
+
+                with self.env.anchor():
+                    results.append(self._execute(delegate, calldata, value))
+
+        return results
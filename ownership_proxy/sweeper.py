@@ -0,0 +1,51 @@
+"""
+Keeper for expired delegations.
+
+Finds the expired delegates of a proxy through its delegate index, one view
+call per page of delegates, and clears them with the permissionless
+`proxy__sweep_expired`, in batches. Clearing storage is refunded (up to a
+fifth of the gas of the transaction), so the fewer and fuller the
+transactions, the cheaper the sweep.
+"""
+
+from ownership_proxy.abi import proxy_contract
+
+# bound of the proxy's batch arguments and pages
+MAX_BATCH_SIZE = 100
+
+
+class ExpirySweeper:
+    def __init__(self, proxy, min_batch: int = 1, page_size: int = MAX_BATCH_SIZE):
+        """
+        `proxy` is a boa contract exposing the proxy interface, sweeps are
+        sent from boa's environment (i.e. its account in network mode).
+        Sweeps with fewer than `min_batch` expired delegates are skipped.
+        """
+        assert 0 < page_size <= MAX_BATCH_SIZE, "invalid page size"
+        self.proxy = proxy
+        self.min_batch = min_batch
+        self.page_size = page_size
+
+    @classmethod
+    def at(cls, proxy_address, **kwargs):
+        return cls(proxy_contract(proxy_address), **kwargs)
+
+    def find_expired(self) -> list[str]:
+        expired = []
+        count = self.proxy.proxy__delegate_count()
+        for start in range(0, count, self.page_size):
+            expired.extend(self.proxy.proxy__expired_delegates(start, self.page_size))
+        return expired
+
+    def sweep(self, **kwargs) -> int:
+        """Sweep every expired delegate, returns how many were swept."""
+        expired = self.find_expired()
+        if len(expired) < self.min_batch:
+            return 0
+
+        swept = 0
+        for start in range(0, len(expired), MAX_BATCH_SIZE):
+            swept += self.proxy.proxy__sweep_expired(
+                expired[start : start + MAX_BATCH_SIZE], **kwargs
+            )
+        return swept
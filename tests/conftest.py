@@ -1,37 +1,86 @@
-import pytest
+import os
+
 import boa
+import pytest
+from hypothesis import settings
 
-from tests.utils.deployers import PASSTHROUGH_CHECKER_DEPLOYER
+# compiled artifacts are cached on disk by boa, keyed by the hash of the
+# sources (imports included), point this to a persistent directory on CI
+if "BOA_CACHE_DIR" in os.environ:
+    boa.set_cache_dir(os.environ["BOA_CACHE_DIR"])
 
+settings.register_profile("deep", max_examples=2000, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
 
-@pytest.fixture
+from ownership_proxy.abi import proxy_contract  # noqa: E402
+from tests.utils.deployers import (  # noqa: E402
+    ACCEPT_ALL_CHECKER_DEPLOYER,
+    CALLER_DEPLOYER,
+    DENY_ALL_CHECKER_DEPLOYER,
+    DUMMY_FACTORY_DEPLOYER,
+    PASSTHROUGH_CHECKER_DEPLOYER,
+    PROXY_DEPLOYER,
+)
+from tests.utils.checkers import approve_checker  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-gas-snapshot",
+        action="store_true",
+        default=False,
+        help="overwrite tests/gas/snapshot.json with the measured gas values",
+    )
+
+
+# boa snapshots the state around every test, so contracts deployed once per
+# session start fresh in each test
+
+
+@pytest.fixture(scope="session")
 def dummy():
-    return boa.load("tests/mocks/dummy_factory.vy")
+    return DUMMY_FACTORY_DEPLOYER.deploy()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dao():
     return boa.env.generate_address("dao")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def proxy(dummy, dao):
-    return boa.load("contracts/proxy.vy", dummy.address, dao)
+    return PROXY_DEPLOYER.deploy(dummy.address, dao, False)
 
 
 @pytest.fixture
 def proxy_as_dummy(proxy, dummy):
-    # TODO make a helper to generate this by ABI fusion (so it doesn't trigger a warning)
-    return dummy.at(proxy.address)
+    yield proxy_contract(proxy.address, dummy)
+    # `at` registers the fused ABI for the proxy address, restore the source
+    # level contract (i.e. for revert traces)
+    boa.env.register_contract(proxy.address, proxy)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def caller():
-    return boa.load("tests/mocks/caller.vy")
+    return CALLER_DEPLOYER.deploy()
 
 
+@pytest.fixture
+def passthrough_checker(proxy, dao):
+    checker = PASSTHROUGH_CHECKER_DEPLOYER.deploy()
+    approve_checker(proxy, checker, dao)
+    return checker
+
 
 @pytest.fixture
-def passthrough_checker():
-    return PASSTHROUGH_CHECKER_DEPLOYER.deploy()
+def accept_all_checker(proxy, dao):
+    checker = ACCEPT_ALL_CHECKER_DEPLOYER.deploy()
+    approve_checker(proxy, checker, dao)
+    return checker
 
+
+@pytest.fixture
+def deny_all_checker(proxy, dao):
+    checker = DENY_ALL_CHECKER_DEPLOYER.deploy()
+    approve_checker(proxy, checker, dao)
+    return checker
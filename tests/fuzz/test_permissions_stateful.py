@@ -0,0 +1,257 @@
+"""
+Differential fuzzing of the cooldown, interval and whitelist modules against
+a Python reference model.
+
+Every rule sends a batch of operations to the harness in a single EVM call
+(each one is a non-reverting self call), so most of the time is spent in
+the EVM rather than in boa's per-call overhead. The outcome of every
+operation and the resulting state are compared with the model.
+"""
+
+import time
+
+import boa
+from hypothesis import settings, strategies as st
+from hypothesis.stateful import (
+    RuleBasedStateMachine,
+    invariant,
+    rule,
+    run_state_machine_as_test,
+)
+
+HARNESS = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import cooldown
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
+
+initializes: cooldown
+initializes: interval
+initializes: whitelist
+
+from ownership_proxy.interfaces import ICooldown
+from ownership_proxy.interfaces import IInterval
+
+MAX_MEMBERS: constant(uint256) = 5
+
+struct KeyState:
+    cooldown: ICooldown.Cooldown
+    interval: IInterval.Interval
+    interval_exists: bool
+    members: DynArray[address, MAX_MEMBERS]
+
+@external
+def cooldown_add(key: bytes32, duration: uint256, override: bool):
+    assert msg.sender == self
+    cooldown.add(key, duration, override)
+
+@external
+def cooldown_check_and_reset(key: bytes32):
+    assert msg.sender == self
+    cooldown.check_and_reset(key)
+
+@external
+def interval_add(key: bytes32, lb: uint256, ub: uint256, override: bool):
+    assert msg.sender == self
+    interval.add(key, lb, ub, override)
+
+@external
+@view
+def interval_check(key: bytes32, val: uint256):
+    interval.check(key, val)
+
+@external
+def whitelist_add(key: bytes32, addr: address, override: bool):
+    assert msg.sender == self
+    whitelist.add(key, addr, override)
+
+@external
+def whitelist_remove(key: bytes32, addr: address):
+    assert msg.sender == self
+    whitelist.remove(key, addr)
+
+@external
+@view
+def whitelist_check(key: bytes32, addr: address):
+    whitelist.check(key, addr)
+
+@external
+@view
+def state(keys: DynArray[bytes32, 3]) -> DynArray[KeyState, 3]:
+    # the whole state in a single call, the invariant runs after every step
+    result: DynArray[KeyState, 3] = []
+    for key: bytes32 in keys:
+        members: DynArray[address, MAX_MEMBERS] = []
+        for i: uint256 in range(len(whitelist.whitelist_array[key]), bound=MAX_MEMBERS):
+            members.append(whitelist.whitelist_array[key][i])
+
+        result.append(
+            KeyState(
+                cooldown=cooldown.get(key),
+                interval=interval.intervals[key],
+                interval_exists=interval.interval_exists[key],
+                members=members,
+            )
+        )
+    return result
+
+@external
+def batch(calls: DynArray[Bytes[160], 32]) -> DynArray[bool, 32]:
+    results: DynArray[bool, 32] = []
+    for c: Bytes[160] in calls:
+        results.append(raw_call(self, c, revert_on_failure=False))
+    return results
+"""
+
+KEYS = [boa.eval(f'keccak256("KEY_{i}")') for i in range(3)]
+ADDRESSES = [boa.env.generate_address(f"fuzz_{i}") for i in range(5)]
+
+keys = st.sampled_from(KEYS)
+addresses = st.sampled_from(ADDRESSES)
+# around the bounds checked by the modules
+uint128s = st.one_of(
+    st.integers(min_value=0, max_value=10**6),
+    st.integers(min_value=2**128 - 2, max_value=2**128 + 1),
+)
+values = st.integers(min_value=0, max_value=1000)
+
+ops_strategy = st.one_of(
+    st.tuples(st.just("cooldown_add"), keys, uint128s, st.booleans()),
+    st.tuples(st.just("cooldown_check_and_reset"), keys),
+    st.tuples(st.just("interval_add"), keys, values, values, st.booleans()),
+    st.tuples(st.just("interval_check"), keys, values),
+    st.tuples(st.just("whitelist_add"), keys, addresses, st.booleans()),
+    st.tuples(st.just("whitelist_remove"), keys, addresses),
+    st.tuples(st.just("whitelist_check"), keys, addresses),
+)
+
+
+class PermissionsModel:
+    """Reference implementation of the modules, operations return whether they succeed."""
+
+    def __init__(self):
+        self.cooldowns = {}  # key -> (start, duration)
+        self.intervals = {}  # key -> (lb, ub)
+        self.whitelists = {}  # key -> members, in storage order
+
+    def cooldown_add(self, now, key, duration, override):
+        if duration == 0 or duration >= 2**128:
+            return False
+        # existence is tracked by the packed slot being non zero
+        if self.cooldowns.get(key, (0, 0)) != (0, 0) and not override:
+            return False
+        self.cooldowns[key] = (now, duration)
+        return True
+
+    def cooldown_check_and_reset(self, now, key):
+        start, duration = self.cooldowns.get(key, (0, 0))
+        if now < start + duration:
+            return False
+        self.cooldowns[key] = (now, duration)
+        return True
+
+    def interval_add(self, now, key, lb, ub, override):
+        if key in self.intervals and not override:
+            return False
+        if lb > ub:
+            return False
+        self.intervals[key] = (lb, ub)
+        return True
+
+    def interval_check(self, now, key, value):
+        if key not in self.intervals:
+            return False
+        lb, ub = self.intervals[key]
+        return lb <= value <= ub
+
+    def whitelist_add(self, now, key, addr, override):
+        members = self.whitelists.setdefault(key, [])
+        if addr in members:
+            return override
+        members.append(addr)
+        return True
+
+    def whitelist_remove(self, now, key, addr):
+        members = self.whitelists.setdefault(key, [])
+        if addr not in members:
+            return False
+        # swap and pop
+        index = members.index(addr)
+        last = members.pop()
+        if last != addr:
+            members[index] = last
+        return True
+
+    def whitelist_check(self, now, key, addr):
+        return addr in self.whitelists.get(key, [])
+
+
+class PermissionsMachine(RuleBasedStateMachine):
+    harness = None
+    examples = 0
+    operations = 0
+
+    def __init__(self):
+        super().__init__()
+        type(self).examples += 1
+        # every example starts from the freshly deployed harness
+        self._anchor = boa.env.anchor()
+        self._anchor.__enter__()
+        self.model = PermissionsModel()
+
+    def teardown(self):
+        self._anchor.__exit__(None, None, None)
+
+    @rule(ops=st.lists(ops_strategy, min_size=1, max_size=32))
+    def run_batch(self, ops):
+        now = boa.env.timestamp
+        calldata = [
+            getattr(self.harness, name).prepare_calldata(*args) for name, *args in ops
+        ]
+
+        results = self.harness.batch(calldata, sender=self.harness.address)
+
+        expected = [getattr(self.model, name)(now, *args) for name, *args in ops]
+        assert results == expected, list(zip(ops, results, expected))
+        type(self).operations += len(ops)
+
+    @rule(seconds=st.one_of(st.integers(1, 100), st.integers(10**6, 10**7)))
+    def time_travel(self, seconds):
+        boa.env.time_travel(seconds=seconds)
+
+    @invariant()
+    def state_matches(self):
+        expected = [
+            (
+                self.model.cooldowns.get(key, (0, 0)),
+                self.model.intervals.get(key, (0, 0)),
+                key in self.model.intervals,
+                self.model.whitelists.get(key, []),
+            )
+            for key in KEYS
+        ]
+        assert self.harness.state(KEYS) == expected
+
+
+def test_permissions_match_model(capsys):
+    PermissionsMachine.harness = boa.loads(HARNESS)
+    PermissionsMachine.examples = PermissionsMachine.operations = 0
+
+    # every example runs hundreds of operations, the default profile only
+    # smoke tests the harness and HYPOTHESIS_PROFILE=deep runs it for real
+    examples = max(settings.default.max_examples // 5, 1)
+
+    start = time.perf_counter()
+    run_state_machine_as_test(
+        PermissionsMachine,
+        settings=settings(max_examples=examples, stateful_step_count=10, deadline=None),
+    )
+    elapsed = time.perf_counter() - start
+
+    with capsys.disabled():
+        print(
+            f"\n{PermissionsMachine.examples} examples, {PermissionsMachine.operations} operations"
+            f" in {elapsed:.1f}s ({PermissionsMachine.examples / elapsed:.1f} examples/s,"
+            f" {PermissionsMachine.operations / elapsed:.0f} operations/s)"
+        )
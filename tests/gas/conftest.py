@@ -0,0 +1,20 @@
+import os
+
+import boa
+import pytest
+
+from tests.utils.gas import GasSnapshot
+
+
+@pytest.fixture(scope="session")
+def gas_snapshot(request):
+    snapshot = GasSnapshot(update=request.config.getoption("--update-gas-snapshot"))
+    yield snapshot
+    # concurrent xdist workers would race on the file, run without `-n` to record
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        snapshot.write()
+
+
+@pytest.fixture
+def delegate():
+    return boa.env.generate_address("delegate")
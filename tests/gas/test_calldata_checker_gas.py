@@ -0,0 +1,60 @@
+import boa
+
+from tests.utils.deployers import CALLDATA_CHECKER_DEPLOYER, CHECKER_FACTORY_DEPLOYER
+from tests.utils.gas import measure_raw
+
+WHITELISTED = "0x1234567890123456789012345678901234567890"
+
+# Predicate flag values
+INTERVAL = 2
+WHITELIST = 4
+
+# the same checks compiled for the target, arguments are ABI-decoded
+HANDWRITTEN_CHECKER = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
+
+initializes: interval
+initializes: whitelist
+
+FOO_INTERVAL: constant(bytes32) = keccak256("FOO_INTERVAL")
+FOO_WHITELIST: constant(bytes32) = keccak256("FOO_WHITELIST")
+
+@deploy
+def __init__():
+    interval.add(FOO_INTERVAL, 100, 200)
+    whitelist.add(FOO_WHITELIST, 0x1234567890123456789012345678901234567890)
+
+@external
+def foo(addy: address, amount: uint256):
+    interval.check(FOO_INTERVAL, amount)
+    whitelist.check(FOO_WHITELIST, addy)
+"""
+
+
+def test_gas_calldata_checker(gas_snapshot):
+    handwritten = boa.loads(HANDWRITTEN_CHECKER)
+    calldata = handwritten.foo.prepare_calldata(WHITELISTED, 150)
+
+    factory = CHECKER_FACTORY_DEPLOYER.deploy()
+    implementation = CALLDATA_CHECKER_DEPLOYER.deploy()
+    config = [
+        (
+            calldata[:4],
+            [(0, WHITELIST, 0, 0, [WHITELISTED]), (1, INTERVAL, 100, 200, [])],
+        )
+    ]
+    generic = factory.deploy_checker(
+        implementation.address, implementation.initialize.prepare_calldata(config)
+    )
+
+    sender = boa.env.generate_address()
+    gas_snapshot.check(
+        "calldata_checker.check[handwritten]",
+        measure_raw(handwritten.address, calldata, sender),
+    )
+    gas_snapshot.check(
+        "calldata_checker.check[clone]", measure_raw(generic, calldata, sender)
+    )
@@ -0,0 +1,19 @@
+from tests.utils.deployers import (
+    CHECKER_FACTORY_DEPLOYER,
+    INITIALIZABLE_CHECKER_DEPLOYER,
+)
+from tests.utils.gas import measure
+
+WHITELISTED = "0x1234567890123456789012345678901234567890"
+
+
+def test_gas_deploy_checker_clone(gas_snapshot):
+    factory = CHECKER_FACTORY_DEPLOYER.deploy()
+    implementation = INITIALIZABLE_CHECKER_DEPLOYER.deploy()
+    init_data = implementation.initialize.prepare_calldata(
+        86400, 100, 200, [WHITELISTED]
+    )
+
+    gas_used = measure(factory.deploy_checker, implementation.address, init_data)
+
+    gas_snapshot.check("checker_factory.deploy_checker", gas_used)
@@ -0,0 +1,287 @@
+import boa
+import pytest
+
+from ownership_proxy.merkle import MerkleTree
+from tests.utils.gas import measure, measure_revert
+
+KEY = boa.eval('keccak256("GAS_KEY")')
+WHITELIST_SIZE = 10
+MERKLE_WHITELIST_SIZE = 1000
+
+
+@pytest.fixture
+def permissions_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import cooldown
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
+
+initializes: cooldown
+initializes: interval
+initializes: whitelist
+
+@external
+def cooldown_add(key: bytes32, duration: uint256):
+    cooldown.add(key, duration)
+
+@external
+def cooldown_check_and_reset(key: bytes32):
+    cooldown.check_and_reset(key)
+
+@external
+def interval_add(key: bytes32, lb: uint256, ub: uint256):
+    interval.add(key, lb, ub)
+
+@external
+def interval_check(key: bytes32, val: uint256):
+    interval.check(key, val)
+
+@external
+def whitelist_add_multiple(key: bytes32, addrs: DynArray[address, 1000]):
+    whitelist.add_multiple(key, addrs)
+
+@external
+def whitelist_check(key: bytes32, addr: address):
+    whitelist.check(key, addr)
+"""
+    return boa.loads(source)
+
+
+def test_gas_cooldown_check_and_reset(permissions_contract, gas_snapshot):
+    permissions_contract.cooldown_add(KEY, 3600)
+    boa.env.time_travel(seconds=3600)
+
+    gas_used = measure(permissions_contract.cooldown_check_and_reset, KEY)
+    gas_snapshot.check("cooldown.check_and_reset", gas_used)
+
+
+def test_gas_interval_check(permissions_contract, gas_snapshot):
+    permissions_contract.interval_add(KEY, 100, 200)
+
+    gas_used = measure(permissions_contract.interval_check, KEY, 150)
+    gas_snapshot.check("interval.check", gas_used)
+
+
+def test_gas_whitelist_check(permissions_contract, gas_snapshot):
+    addr = boa.env.generate_address()
+    permissions_contract.whitelist_add_multiple(KEY, [addr])
+
+    gas_used = measure(permissions_contract.whitelist_check, KEY, addr)
+    gas_snapshot.check("whitelist.check", gas_used)
+
+
+def test_gas_whitelist_add_multiple(permissions_contract, gas_snapshot):
+    addrs = [boa.env.generate_address() for _ in range(WHITELIST_SIZE)]
+
+    gas_used = measure(permissions_contract.whitelist_add_multiple, KEY, addrs)
+    gas_snapshot.check(f"whitelist.add_multiple[{WHITELIST_SIZE}]", gas_used)
+
+
+@pytest.fixture
+def bitmap_whitelist_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import bitmap_whitelist
+
+initializes: bitmap_whitelist
+
+@external
+def register_multiple(addrs: DynArray[address, 256]):
+    bitmap_whitelist.register_multiple(addrs)
+
+@external
+def add_multiple(key: bytes32, addrs: DynArray[address, 256]):
+    bitmap_whitelist.add_multiple(key, addrs)
+
+@external
+def check(key: bytes32, addr: address):
+    bitmap_whitelist.check(key, addr)
+"""
+    return boa.loads(source)
+
+
+def test_gas_bitmap_whitelist_add_multiple(bitmap_whitelist_contract, gas_snapshot):
+    addrs = [boa.env.generate_address() for _ in range(WHITELIST_SIZE)]
+    bitmap_whitelist_contract.register_multiple(addrs)
+
+    gas_used = measure(bitmap_whitelist_contract.add_multiple, KEY, addrs)
+    gas_snapshot.check(f"bitmap_whitelist.add_multiple[{WHITELIST_SIZE}]", gas_used)
+
+
+def test_gas_bitmap_whitelist_check(bitmap_whitelist_contract, gas_snapshot):
+    addrs = [boa.env.generate_address() for _ in range(WHITELIST_SIZE)]
+    bitmap_whitelist_contract.register_multiple(addrs)
+    bitmap_whitelist_contract.add_multiple(KEY, addrs)
+
+    gas_used = measure(bitmap_whitelist_contract.check, KEY, addrs[-1])
+    gas_snapshot.check("bitmap_whitelist.check", gas_used)
+
+
+@pytest.fixture
+def merkle_whitelist_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import merkle_whitelist
+
+initializes: merkle_whitelist
+
+@external
+def set_root(key: bytes32, root: bytes32):
+    merkle_whitelist.set_root(key, root)
+
+@external
+def check(key: bytes32, addr: address, proof: DynArray[bytes32, 32]):
+    merkle_whitelist.check(key, addr, proof)
+"""
+    return boa.loads(source)
+
+
+def test_gas_merkle_whitelist_set_root(merkle_whitelist_contract, gas_snapshot):
+    root = MerkleTree(
+        [boa.env.generate_address() for _ in range(MERKLE_WHITELIST_SIZE)]
+    ).root
+
+    gas_used = measure(merkle_whitelist_contract.set_root, KEY, root)
+    gas_snapshot.check("merkle_whitelist.set_root", gas_used)
+
+
+def test_gas_merkle_whitelist_check(merkle_whitelist_contract, gas_snapshot):
+    addrs = [boa.env.generate_address() for _ in range(MERKLE_WHITELIST_SIZE)]
+    tree = MerkleTree(addrs)
+    merkle_whitelist_contract.set_root(KEY, tree.root)
+
+    gas_used = measure(
+        merkle_whitelist_contract.check, KEY, addrs[0], tree.proof(addrs[0])
+    )
+    gas_snapshot.check(f"merkle_whitelist.check[{MERKLE_WHITELIST_SIZE}]", gas_used)
+
+
+def test_gas_budget_consume(gas_snapshot):
+    contract = boa.loads("""
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import budget
+
+initializes: budget
+
+@external
+def add(key: bytes32, limit: uint256):
+    budget.add(key, limit)
+
+@external
+def consume(key: bytes32, amount: uint256):
+    budget.consume(key, amount)
+""")
+    contract.add(KEY, 1000)
+
+    gas_used = measure(contract.consume, KEY, 10)
+    gas_snapshot.check("budget.consume", gas_used)
+
+
+def test_gas_ratelimit_check_and_consume(gas_snapshot):
+    contract = boa.loads("""
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import ratelimit
+
+initializes: ratelimit
+
+@external
+def add(key: bytes32, capacity: uint256, period: uint256):
+    ratelimit.add(key, capacity, period)
+
+@external
+def check_and_consume(key: bytes32, amount: uint256):
+    ratelimit.check_and_consume(key, amount)
+""")
+    contract.add(KEY, 1000, 86400)
+    boa.env.time_travel(seconds=3600)
+
+    gas_used = measure(contract.check_and_consume, KEY, 10)
+    gas_snapshot.check("ratelimit.check_and_consume", gas_used)
+
+
+def test_gas_cumulative_check_and_consume(gas_snapshot):
+    contract = boa.loads("""
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import cumulative
+
+initializes: cumulative
+
+@external
+def add(key: bytes32, cap: uint256, period: uint256):
+    cumulative.add(key, cap, period)
+
+@external
+def check_and_consume(key: bytes32, amount: uint256):
+    cumulative.check_and_consume(key, amount)
+""")
+    contract.add(KEY, 1000, 86400)
+    # the first call of a new period resets the amount spent
+    boa.env.time_travel(seconds=86400 + 3600)
+
+    gas_used = measure(contract.check_and_consume, KEY, 10)
+    gas_snapshot.check("cumulative.check_and_consume", gas_used)
+
+
+@pytest.fixture
+def checks_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import checks
+from ownership_proxy.permissions import cooldown
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
+
+initializes: cooldown
+initializes: interval
+initializes: whitelist
+initializes: checks[cooldown := cooldown, interval := interval, whitelist := whitelist]
+
+@external
+def setup(key: bytes32, addr: address):
+    cooldown.add(key, 3600)
+    interval.add(key, 100, 200)
+    whitelist.add(key, addr)
+
+@external
+def run(key: bytes32, addr: address, val: uint256):
+    checks.run([checks.cooled_down(key), checks.within(key, val), checks.whitelisted(key, addr)])
+
+@external
+def run_in_order(key: bytes32, addr: address, val: uint256):
+    cooldown.check_and_reset(key)
+    interval.check(key, val)
+    whitelist.check(key, addr)
+"""
+    return boa.loads(source)
+
+
+def test_gas_checks_run(checks_contract, gas_snapshot):
+    addr = boa.env.generate_address()
+    checks_contract.setup(KEY, addr)
+    boa.env.time_travel(seconds=3600)
+
+    gas_snapshot.check("checks.run", measure(checks_contract.run, KEY, addr, 150))
+
+
+def test_gas_checks_run_fail_fast(checks_contract, gas_snapshot):
+    checks_contract.setup(KEY, boa.env.generate_address())
+    boa.env.time_travel(seconds=3600)
+    other = boa.env.generate_address()
+
+    # failing on the whitelist, with the checks in the declared order or cheapest first
+    gas_snapshot.check(
+        "checks.run[not whitelisted,declared order]",
+        measure_revert(checks_contract.run_in_order, KEY, other, 150),
+    )
+    gas_snapshot.check(
+        "checks.run[not whitelisted]",
+        measure_revert(checks_contract.run, KEY, other, 150),
+    )
@@ -0,0 +1,163 @@
+import boa
+from eth_account import Account
+
+from ownership_proxy.signing import sign_delegated_call
+from tests.utils.gas import measure, measure_raw
+
+BATCH_SIZE = 10
+SOME_FUNC = boa.eval('method_id("some_func()")')
+
+
+def test_gas_default_dao_path(proxy, dao, gas_snapshot):
+    gas_snapshot.check(
+        "proxy.__default__.dao", measure_raw(proxy.address, SOME_FUNC, dao)
+    )
+
+
+def test_gas_default_delegate_path(
+    proxy, dao, delegate, accept_all_checker, gas_snapshot
+):
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+
+    gas_snapshot.check(
+        "proxy.__default__.delegate", measure_raw(proxy.address, SOME_FUNC, delegate)
+    )
+
+
+def test_gas_default_selector_delegate_path(
+    proxy, dao, delegate, accept_all_checker, gas_snapshot
+):
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [(SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address)],
+        sender=dao,
+    )
+
+    gas_snapshot.check(
+        "proxy.__default__.selector_delegate",
+        measure_raw(proxy.address, SOME_FUNC, delegate),
+    )
+
+
+def test_gas_default_expired_delegation_path(
+    proxy, dao, delegate, accept_all_checker, gas_snapshot
+):
+    """Expired delegate that also holds the DAO role falls back to the role check"""
+    proxy.grantRole(proxy.proxy__DAO_ROLE(), delegate, sender=dao)
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+    boa.env.time_travel(seconds=1000)
+
+    gas_snapshot.check(
+        "proxy.__default__.expired_delegation",
+        measure_raw(proxy.address, SOME_FUNC, delegate),
+    )
+
+
+def test_gas_set_delegation(proxy, dao, delegate, accept_all_checker, gas_snapshot):
+    gas_used = measure(
+        proxy.proxy__set_delegation,
+        delegate,
+        (boa.env.timestamp + 1000, accept_all_checker.address, []),
+        sender=dao,
+    )
+
+    gas_snapshot.check("proxy.proxy__set_delegation", gas_used)
+
+
+def test_gas_default_delegate_fast_selector_path(
+    proxy, dao, delegate, accept_all_checker, gas_snapshot
+):
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + 1000, accept_all_checker.address, [SOME_FUNC]),
+        sender=dao,
+    )
+
+    gas_snapshot.check(
+        "proxy.__default__.delegate_fast_selector",
+        measure_raw(proxy.address, SOME_FUNC, delegate),
+    )
+
+
+def test_gas_set_delegations(proxy, dao, accept_all_checker, gas_snapshot):
+    delegates = [boa.env.generate_address() for _ in range(BATCH_SIZE)]
+    metadatas = [
+        (boa.env.timestamp + 1000, accept_all_checker.address, [])
+    ] * BATCH_SIZE
+
+    gas_used = measure(proxy.proxy__set_delegations, delegates, metadatas, sender=dao)
+    gas_snapshot.check(f"proxy.proxy__set_delegations[{BATCH_SIZE}]", gas_used)
+
+
+def test_gas_kill_delegations(proxy, dao, accept_all_checker, gas_snapshot):
+    delegates = [boa.env.generate_address() for _ in range(BATCH_SIZE)]
+    metadatas = [
+        (boa.env.timestamp + 1000, accept_all_checker.address, [])
+    ] * BATCH_SIZE
+    proxy.proxy__set_delegations(delegates, metadatas, sender=dao)
+
+    # priced against the delegations as committed storage (see `measure`)
+    gas_used = measure(proxy.proxy__kill_delegations, delegates, sender=dao)
+    gas_snapshot.check(f"proxy.proxy__kill_delegations[{BATCH_SIZE}]", gas_used)
+
+
+def test_gas_sweep_expired(proxy, dao, accept_all_checker, gas_snapshot):
+    delegates = [boa.env.generate_address() for _ in range(BATCH_SIZE)]
+    metadatas = [
+        (boa.env.timestamp + 1000, accept_all_checker.address, [])
+    ] * BATCH_SIZE
+    proxy.proxy__set_delegations(delegates, metadatas, sender=dao)
+    boa.env.time_travel(seconds=1000)
+
+    # `measure` prices the clears against the delegations as committed storage,
+    # as if they had been set in earlier transactions
+    gas_used = measure(proxy.proxy__sweep_expired, delegates)
+    gas_snapshot.check(f"proxy.proxy__sweep_expired[{BATCH_SIZE}]", gas_used)
+
+
+def test_gas_multicall_delegate(proxy, dao, delegate, accept_all_checker, gas_snapshot):
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+
+    gas_used = measure(
+        proxy.proxy__multicall, [SOME_FUNC] * BATCH_SIZE, sender=delegate
+    )
+    gas_snapshot.check(f"proxy.proxy__multicall.delegate[{BATCH_SIZE}]", gas_used)
+
+
+def test_gas_execute_signed(proxy, dao, accept_all_checker, gas_snapshot):
+    account = Account.create()
+    proxy.proxy__set_delegation(
+        account.address,
+        (boa.env.timestamp + 1000, accept_all_checker.address, []),
+        sender=dao,
+    )
+    chain_id, deadline = boa.env.evm.patch.chain_id, boa.env.timestamp
+    first, second = (
+        sign_delegated_call(
+            account.key, proxy.address, chain_id, SOME_FUNC, nonce, deadline
+        )
+        for nonce in range(2)
+    )
+
+    gas_used = measure(proxy.proxy__execute_signed, *first.args())
+    gas_snapshot.check("proxy.proxy__execute_signed", gas_used)
+
+    # later nonces of the same bitmap word update a non zero slot, committed by
+    # the first call (see `measure`)
+    gas_used = measure(proxy.proxy__execute_signed, *second.args())
+    gas_snapshot.check("proxy.proxy__execute_signed[same word]", gas_used)
+
+
+def test_gas_preview(proxy, dao, delegate, accept_all_checker, gas_snapshot):
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+
+    gas_used = measure(proxy.proxy__preview, delegate, SOME_FUNC)
+    gas_snapshot.check("proxy.proxy__preview", gas_used)
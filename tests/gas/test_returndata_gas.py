@@ -0,0 +1,24 @@
+import pytest
+
+from tests.utils.deployers import PROXY_DEPLOYER, RETURNDATA_TARGET_DEPLOYER
+from tests.utils.gas import measure_raw
+
+# bytes of return data, the last one only fits the large buffer
+RETURN_SIZES = [64, 1024, 4096, 16384]
+
+
+@pytest.mark.parametrize("large_returndata", [False, True])
+@pytest.mark.parametrize("size", RETURN_SIZES)
+def test_gas_default_returndata(dao, gas_snapshot, large_returndata, size):
+    if not large_returndata and size > 32 * 128:
+        pytest.skip("does not fit the default buffer")
+
+    target = RETURNDATA_TARGET_DEPLOYER.deploy()
+    proxy = PROXY_DEPLOYER.deploy(target.address, dao, large_returndata)
+    calldata = target.words.prepare_calldata((size - 64) // 32)
+
+    mode = "large" if large_returndata else "default"
+    gas_snapshot.check(
+        f"proxy.__default__.returndata[{mode},{size}]",
+        measure_raw(proxy.address, calldata, dao),
+    )
@@ -0,0 +1,8 @@
+# pragma version 0.4.3
+
+# Cheapest possible checker, used to isolate the proxy's own overhead
+
+
+@external
+def __default__():
+    pass
@@ -0,0 +1,18 @@
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import budget
+
+initializes: budget
+
+SOME_FUNC_BUDGET: constant(bytes32) = keccak256("SOME_FUNC_BUDGET")
+
+
+@deploy
+def __init__(max_calls: uint256):
+    budget.add(SOME_FUNC_BUDGET, max_calls)
+
+
+@external
+def some_func() -> uint256:
+    budget.consume(SOME_FUNC_BUDGET, 1)
+    return 0
@@ -0,0 +1,8 @@
+# pragma version 0.4.3
+
+# Checker that rejects every call
+
+
+@external
+def __default__():
+    raise "denied"
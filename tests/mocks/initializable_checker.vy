@@ -0,0 +1,50 @@
+# pragma version 0.4.3
+
+# Same checks as `mock_checker.vy`, configured per delegate when cloned
+# through the checker factory
+
+from ownership_proxy.permissions import cooldown
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
+
+initializes: cooldown
+initializes: interval
+initializes: whitelist
+
+FOO_INTERVAL: constant(bytes32) = keccak256("FOO_INTERVAL")
+FOO_COOLDOWN: constant(bytes32) = keccak256("FOO_COOLDOWN")
+FOO_WHITELIST: constant(bytes32) = keccak256("FOO_WHITELIST")
+
+MAX_WHITELIST: constant(uint256) = 10
+
+initialized: public(bool)
+
+
+@deploy
+def __init__():
+    # only clones are configured, the implementation stays locked
+    self.initialized = True
+
+
+@external
+def initialize(
+    _cooldown: uint256,
+    _lb: uint256,
+    _ub: uint256,
+    _whitelist: DynArray[address, MAX_WHITELIST],
+):
+    assert not self.initialized, "already initialized"
+    self.initialized = True
+
+    cooldown.add(FOO_COOLDOWN, _cooldown)
+    interval.add(FOO_INTERVAL, _lb, _ub)
+    for addr: address in _whitelist:
+        whitelist.add(FOO_WHITELIST, addr)
+
+
+@external
+def foo(addy: address, amount: uint256):
+    # cheapest first, the cooldown reset is only paid for by calls that pass
+    whitelist.check(FOO_WHITELIST, addy)
+    interval.check(FOO_INTERVAL, amount)
+    cooldown.check_and_reset(FOO_COOLDOWN)
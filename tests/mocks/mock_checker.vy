@@ -1,8 +1,8 @@
 # pragma version 0.4.3
 
-from contracts.permissions import cooldown
-from contracts.permissions import interval
-from contracts.permissions import whitelist
+from ownership_proxy.permissions import cooldown
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
 
 initializes: cooldown
 initializes: interval
@@ -25,6 +25,7 @@ def __init__():
 
 @external
 def foo(addy: address, amount: uint256):
-    cooldown.check_and_reset(FOO_COOLDOWN)
-    interval.check(FOO_INTERVAL, amount)
+    # cheapest first, the cooldown reset is only paid for by calls that pass
     whitelist.check(FOO_WHITELIST, addy)
+    interval.check(FOO_INTERVAL, amount)
+    cooldown.check_and_reset(FOO_COOLDOWN)
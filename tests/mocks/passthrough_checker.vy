@@ -1,5 +1,5 @@
 # pragma version 0.4.3
-from contracts import proxy
+from ownership_proxy import proxy
 
 CALLDATA_SLICE: constant(uint256) = 2 * 256
 
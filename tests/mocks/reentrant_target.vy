@@ -0,0 +1,13 @@
+# pragma version 0.4.3
+
+# Target that calls back into the proxy that forwarded the call
+
+
+@external
+def reenter() -> uint256:
+    return convert(raw_call(msg.sender, method_id("some_func()"), max_outsize=32), uint256)
+
+
+@external
+def some_func() -> uint256:
+    return 42
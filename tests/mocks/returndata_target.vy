@@ -0,0 +1,12 @@
+# pragma version 0.4.3
+
+MAX_WORDS: constant(uint256) = 1000
+
+
+@external
+def words(n: uint256) -> DynArray[uint256, MAX_WORDS]:
+    # abi encoded in 64 + 32 * n bytes
+    result: DynArray[uint256, MAX_WORDS] = []
+    for i: uint256 in range(n, bound=MAX_WORDS):
+        result.append(i)
+    return result
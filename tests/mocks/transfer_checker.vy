@@ -0,0 +1,42 @@
+# pragma version 0.4.3
+
+# Checker of the README example ("Using the Permissions Library")
+
+from ownership_proxy.permissions import checks
+from ownership_proxy.permissions import cooldown
+from ownership_proxy.permissions import whitelist
+from ownership_proxy.permissions import interval
+
+initializes: cooldown
+initializes: interval
+initializes: whitelist
+initializes: checks[cooldown := cooldown, interval := interval, whitelist := whitelist]
+
+# Define permission keys - these become queryable identifiers
+TRANSFER_COOLDOWN: constant(bytes32) = keccak256("TRANSFER_COOLDOWN")
+TRANSFER_AMOUNT_RANGE: constant(bytes32) = keccak256("TRANSFER_AMOUNT_RANGE")
+TRANSFER_RECIPIENT_WHITELIST: constant(bytes32) = keccak256("TRANSFER_RECIPIENT_WHITELIST")
+
+
+@deploy
+def __init__():
+    cooldown.add_from_hours(TRANSFER_COOLDOWN, 24)
+
+    interval.add(TRANSFER_AMOUNT_RANGE, 100, 10000)
+
+    whitelist.add_multiple(TRANSFER_RECIPIENT_WHITELIST, [
+        0x1234567890123456789012345678901234567890,  # Treasury
+        0x0987654321098765432109876543210987654321   # Partner
+    ])
+
+
+# Only this function allowed - all others denied by default
+@external
+def transfer(recipient: address, amount: uint256):
+    # Use permissions library for ALL checks, run cheapest first whatever the
+    # order they are declared in (see the Checks module below)
+    checks.run([
+        checks.cooled_down(TRANSFER_COOLDOWN),
+        checks.within(TRANSFER_AMOUNT_RANGE, amount),
+        checks.whitelisted(TRANSFER_RECIPIENT_WHITELIST, recipient),
+    ])
@@ -0,0 +1,90 @@
+import json
+import warnings
+
+import boa
+import pytest
+
+from ownership_proxy import abi
+from ownership_proxy.abi import fuse_abis, proxy_abi, proxy_contract
+from tests.utils.deployers import PROXY_DEPLOYER
+
+
+@pytest.fixture(autouse=True)
+def restore_proxy(proxy):
+    yield
+    # handles register their ABI for the proxy address
+    boa.env.register_contract(proxy.address, proxy)
+
+
+def _function(name, *types):
+    return {
+        "type": "function",
+        "name": name,
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": f"arg{i}", "type": t} for i, t in enumerate(types)],
+        "outputs": [],
+    }
+
+
+def test_calls_proxy_and_target(proxy, dummy, dao):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        handle = proxy_contract(proxy.address, dummy)
+
+    assert handle.proxy__target() == dummy.address
+    assert handle.some_func(sender=dao) == dummy.some_func()
+
+
+def test_decodes_proxy_events(proxy, dummy, dao, accept_all_checker):
+    handle = proxy_contract(proxy.address, dummy)
+    delegate = boa.env.generate_address()
+
+    handle.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+
+    (log,) = handle.get_logs()
+    assert type(log).__name__ == "DelegationSet"
+    assert log.delegate == delegate
+
+
+def test_proxy_only(proxy):
+    handle = proxy_contract(proxy.address)
+
+    assert handle.proxy__target() == proxy.proxy__target()
+    assert not hasattr(handle, "some_func")
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        _function("proxy__target"),
+        # exported by the proxy but not part of its interface
+        _function("hasRole", "bytes32", "address"),
+    ],
+)
+def test_selector_collision(dummy, function):
+    with pytest.raises(ValueError, match="selector collision"):
+        fuse_abis(dummy.abi + [function])
+
+
+def test_fused_abi(dummy):
+    fused = fuse_abis(json.dumps(dummy.abi))
+
+    names = {item.get("name") for item in fused if item["type"] == "function"}
+    assert {"some_func", "something_fancier", "proxy__target", "grantRole"} <= names
+    assert not any(item["type"] == "constructor" for item in fused)
+    assert len(fused) == len(proxy_abi()) + len(dummy.abi)
+    # plain JSON, usable by any ABI tooling
+    boa.loads_abi(json.dumps(fused))
+
+
+def test_cached(proxy, dummy, dao):
+    proxy_contract(proxy.address, dummy)
+    misses = abi._fuse.cache_info().misses, abi._factory.cache_info().misses
+
+    other = PROXY_DEPLOYER.deploy(dummy.address, dao, False)
+    proxy_contract(other.address, dummy.abi)
+    fuse_abis(dummy)
+
+    assert (abi._fuse.cache_info().misses, abi._factory.cache_info().misses) == misses
@@ -0,0 +1,214 @@
+import json
+
+import boa
+import pytest
+from boa.contracts.abi.abi_contract import ABIFunction
+from vyper.compiler.output import build_abi_output
+
+from tests.utils.deployers import CALLDATA_CHECKER_DEPLOYER, CHECKER_FACTORY_DEPLOYER
+
+# Predicate flag values
+ANY = 1
+INTERVAL = 2
+WHITELIST = 4
+
+WHITELISTED = "0x1234567890123456789012345678901234567890"
+
+# the calls checked by the checker, as a delegated target would receive them
+TARGET = boa.loads_abi(
+    json.dumps(
+        [
+            {
+                "type": "function",
+                "name": name,
+                "inputs": [
+                    {"name": f"arg{i}", "type": t} for i, t in enumerate(inputs)
+                ],
+                "outputs": [],
+                "stateMutability": "nonpayable",
+            }
+            for name, inputs in [
+                ("transfer", ["address", "uint256"]),
+                ("pause", []),
+                ("set_fee", ["uint256"]),
+            ]
+        ]
+    ),
+    name="Target",
+)
+
+
+def selector(name, *types):
+    return boa.eval(f'method_id("{name}({",".join(types)})", output_type=bytes4)')
+
+
+def _own_selectors():
+    abi = build_abi_output(CALLDATA_CHECKER_DEPLOYER.compiler_data)
+    return [
+        ABIFunction(item, "").method_id for item in abi if item["type"] == "function"
+    ]
+
+
+TRANSFER = selector("transfer", "address", "uint256")
+PAUSE = selector("pause")
+SET_FEE = selector("set_fee", "uint256")
+
+CONFIG = [
+    (TRANSFER, [(0, WHITELIST, 0, 0, [WHITELISTED]), (1, INTERVAL, 100, 200, [])]),
+    (PAUSE, [(0, ANY, 0, 0, [])]),
+    (SET_FEE, [(0, INTERVAL, 5, 5, [])]),
+]
+
+
+@pytest.fixture(scope="module")
+def factory():
+    return CHECKER_FACTORY_DEPLOYER.deploy()
+
+
+@pytest.fixture(scope="module")
+def implementation():
+    return CALLDATA_CHECKER_DEPLOYER.deploy()
+
+
+def _deploy_clone(factory, implementation, config=CONFIG):
+    init_data = implementation.initialize.prepare_calldata(config)
+    address = factory.deploy_checker(implementation.address, init_data)
+    return CALLDATA_CHECKER_DEPLOYER.at(address)
+
+
+@pytest.fixture(scope="module")
+def checker(factory, implementation):
+    return _deploy_clone(factory, implementation)
+
+
+@pytest.fixture(scope="module")
+def checked(checker):
+    return TARGET.at(checker.address)
+
+
+def test_checks_all_rules(checked):
+    checked.transfer(WHITELISTED, 150)
+
+    with boa.reverts("address not whitelisted"):
+        checked.transfer(boa.env.generate_address(), 150)
+
+    with boa.reverts("value out of interval"):
+        checked.transfer(WHITELISTED, 201)
+
+
+def test_any_predicate(checked):
+    checked.pause()
+
+
+def test_equality(checked):
+    checked.set_fee(5)
+
+    with boa.reverts("value out of interval"):
+        checked.set_fee(6)
+
+
+def test_selector_not_allowed(checker):
+    # `initialize` is not one of the configured selectors
+    with boa.reverts("already initialized"):
+        checker.initialize(CONFIG)
+
+    with boa.reverts("selector not allowed"):
+        boa.loads_abi(
+            json.dumps(
+                [
+                    {
+                        "type": "function",
+                        "name": "unknown",
+                        "inputs": [],
+                        "outputs": [],
+                        "stateMutability": "nonpayable",
+                    }
+                ]
+            )
+        ).at(checker.address).unknown()
+
+
+def test_rules(checker):
+    assert checker.checker__rules(TRANSFER) == [
+        (0, WHITELIST, 0, 0, [WHITELISTED]),
+        (1, INTERVAL, 100, 200, []),
+    ]
+    assert checker.checker__rules(PAUSE) == [(0, ANY, 0, 0, [])]
+    assert checker.checker__rules(selector("unknown")) == []
+
+
+def test_rule_keys(checker):
+    key = checker.checker__rule_key(TRANSFER, 1)
+    assert key == boa.eval(f"keccak256(concat({'0x' + TRANSFER.hex()}, 0x01))")
+    assert key != checker.checker__rule_key(TRANSFER, 0)
+    assert key != checker.checker__rule_key(SET_FEE, 1)
+
+
+def test_getters(checker):
+    assert checker.checker__initialized()
+    assert checker.checker__packed_rules(PAUSE) == ANY << 8
+    assert checker.checker__packed_rules(selector("unknown")) == 0
+
+
+def test_selector_rules_set_event(factory, implementation):
+    _deploy_clone(factory, implementation, [CONFIG[0]])
+
+    event = [e for e in factory.get_logs() if type(e).__name__ == "SelectorRulesSet"][0]
+    assert event.selector == TRANSFER
+    assert event.rules == (WHITELIST << 8) | (1 | INTERVAL << 8) << 16
+
+
+def test_implementation_is_locked(implementation):
+    with boa.reverts("already initialized"):
+        implementation.initialize(CONFIG)
+
+
+@pytest.mark.parametrize(
+    "config, error",
+    [
+        ([], "no selectors"),
+        ([(PAUSE, [])], "no rules"),
+        ([CONFIG[1], CONFIG[1]], "duplicate selector"),
+        (
+            [(SET_FEE, [(0, INTERVAL, 1, 2, []), (0, WHITELIST, 0, 0, [WHITELISTED])])],
+            "duplicate argument",
+        ),
+        ([(SET_FEE, [(0, INTERVAL, 2, 1, [])])], "inverted range: lb > ub"),
+        ([(SET_FEE, [(0, WHITELIST, 0, 0, [])])], "no addresses provided"),
+    ],
+)
+def test_initialize_invalid_config(factory, implementation, config, error):
+    with boa.reverts(error):
+        _deploy_clone(factory, implementation, config)
+
+
+@pytest.mark.parametrize("reserved", _own_selectors())
+def test_initialize_reserved_selector(factory, implementation, reserved):
+    # calls to the checker's own functions never reach the rules
+    with boa.reverts("reserved selector"):
+        _deploy_clone(factory, implementation, [(reserved, [(0, ANY, 0, 0, [])])])
+
+
+def test_as_delegation_checker(proxy, proxy_as_dummy, dao, factory, implementation):
+    something_fancier = selector("something_fancier", "address")
+    checker = _deploy_clone(
+        factory,
+        implementation,
+        [(something_fancier, [(0, WHITELIST, 0, 0, [WHITELISTED])])],
+    )
+    proxy.proxy__set_checker_codehash(
+        factory.clone_codehash(implementation.address), True, sender=dao
+    )
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, checker.address, []), sender=dao
+    )
+
+    with boa.env.prank(delegate):
+        assert proxy_as_dummy.something_fancier(WHITELISTED) == WHITELISTED
+
+        with boa.reverts("address not whitelisted"):
+            proxy_as_dummy.something_fancier(boa.env.generate_address())
+
+        with boa.reverts("selector not allowed"):
+            proxy_as_dummy.some_func()
@@ -0,0 +1,120 @@
+import boa
+import pytest
+
+from tests.utils.checkers import codehash
+from tests.utils.deployers import (
+    CHECKER_FACTORY_DEPLOYER,
+    INITIALIZABLE_CHECKER_DEPLOYER,
+)
+
+DAY = 86400
+WHITELISTED = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture(scope="module")
+def factory():
+    return CHECKER_FACTORY_DEPLOYER.deploy()
+
+
+@pytest.fixture(scope="module")
+def implementation():
+    return INITIALIZABLE_CHECKER_DEPLOYER.deploy()
+
+
+def _init_data(
+    implementation, cooldown=2 * DAY, lb=100, ub=200, whitelist=(WHITELISTED,)
+):
+    return implementation.initialize.prepare_calldata(cooldown, lb, ub, list(whitelist))
+
+
+def _deploy_clone(factory, implementation, **kwargs):
+    address = factory.deploy_checker(
+        implementation.address, _init_data(implementation, **kwargs)
+    )
+    return INITIALIZABLE_CHECKER_DEPLOYER.at(address)
+
+
+def test_clone_is_initialized(factory, implementation):
+    clone = _deploy_clone(factory, implementation, cooldown=DAY, lb=10, ub=20)
+    assert clone.initialized()
+
+    with boa.reverts("cooldown not expired"):
+        clone.foo(WHITELISTED, 15)
+
+    boa.env.time_travel(seconds=DAY)
+    clone.foo(WHITELISTED, 15)
+
+
+def test_clone_cannot_be_reinitialized(factory, implementation):
+    clone = _deploy_clone(factory, implementation)
+
+    with boa.reverts("already initialized"):
+        clone.initialize(1, 0, 0, [])
+
+
+def test_implementation_is_locked(implementation):
+    with boa.reverts("already initialized"):
+        implementation.initialize(1, 0, 0, [])
+
+
+def test_clone_codehash(factory, implementation):
+    first = _deploy_clone(factory, implementation)
+    second = _deploy_clone(factory, implementation, lb=0, ub=1)
+
+    expected = factory.clone_codehash(implementation.address)
+    assert codehash(first.address) == codehash(second.address) == expected
+
+
+def test_clones_have_independent_state(factory, implementation):
+    first = _deploy_clone(factory, implementation, lb=100, ub=200)
+    second = _deploy_clone(factory, implementation, lb=300, ub=400)
+    boa.env.time_travel(seconds=2 * DAY)
+
+    with boa.reverts("value out of interval"):
+        first.foo(WHITELISTED, 350)
+    second.foo(WHITELISTED, 350)
+
+
+def test_deploy_checker_event(factory, implementation):
+    deployer = boa.env.generate_address()
+
+    with boa.env.prank(deployer):
+        checker = factory.deploy_checker(
+            implementation.address, _init_data(implementation)
+        )
+
+    # the clone's own events are logged first, during initialization
+    event = factory.get_logs()[-1]
+    assert event.checker == checker
+    assert event.implementation == implementation.address
+    assert event.deployer == deployer
+
+
+def test_deploy_checker_invalid_implementation(factory, implementation):
+    with boa.reverts("invalid implementation"):
+        factory.deploy_checker(boa.env.generate_address(), _init_data(implementation))
+
+
+def test_deploy_checker_empty_init_data(factory, implementation):
+    with boa.reverts("empty init data"):
+        factory.deploy_checker(implementation.address, b"")
+
+
+def test_deploy_checker_init_failure(factory, implementation):
+    with boa.reverts():
+        factory.deploy_checker(
+            implementation.address, _init_data(implementation, lb=2, ub=1)
+        )
+
+
+def test_clone_as_delegation_checker(proxy, dao, factory, implementation):
+    clone = _deploy_clone(factory, implementation)
+    proxy.proxy__set_checker_codehash(
+        factory.clone_codehash(implementation.address), True, sender=dao
+    )
+
+    proxy.proxy__set_delegation(
+        boa.env.generate_address(),
+        (boa.env.timestamp + 1000, clone.address, []),
+        sender=dao,
+    )
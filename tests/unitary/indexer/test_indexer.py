@@ -0,0 +1,156 @@
+import boa
+import pytest
+
+from ownership_proxy.indexer import BoaLogSource, Cooldown, Indexer, Interval
+from tests.utils.checkers import approve_checker
+from tests.utils.deployers import MOCK_CHECKER_DEPLOYER
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+TUPLES = boa.eval('method_id("tuples()")')
+FOO_COOLDOWN = "0x" + boa.eval('keccak256("FOO_COOLDOWN")').hex()
+FOO_INTERVAL = "0x" + boa.eval('keccak256("FOO_INTERVAL")').hex()
+FOO_WHITELIST = "0x" + boa.eval('keccak256("FOO_WHITELIST")').hex()
+DAY = 86400
+
+
+@pytest.fixture
+def source():
+    source = BoaLogSource()
+    yield source
+    source.detach()
+
+
+@pytest.fixture
+def indexer(source, tmp_path):
+    indexer = Indexer(str(tmp_path / "index.db"), source)
+    yield indexer
+    indexer.close()
+
+
+def _seal_block():
+    boa.env.time_travel(blocks=1)
+    return boa.env.evm.patch.block_number - 1
+
+
+def test_delegations(proxy, dao, indexer, accept_all_checker, deny_all_checker):
+    first, second = boa.env.generate_address(), boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+    proxy.proxy__set_delegation(
+        first, (end_ts, accept_all_checker.address, []), sender=dao
+    )
+    proxy.proxy__set_delegation(
+        second, (end_ts + 1, deny_all_checker.address, []), sender=dao
+    )
+    set_block = _seal_block()
+
+    proxy.proxy__kill_delegation(first, sender=dao)
+    _seal_block()
+
+    assert indexer.sync() == 3
+
+    before_kill = indexer.delegations(proxy.address, block=set_block)
+    assert {(d.delegate, d.checker, d.end_ts) for d in before_kill} == {
+        (first, accept_all_checker.address, end_ts),
+        (second, deny_all_checker.address, end_ts + 1),
+    }
+
+    (delegation,) = indexer.delegations(proxy.address)
+    assert delegation.delegate == second
+    assert indexer.delegations(proxy.address, timestamp=end_ts + 1) == []
+
+
+def test_selector_delegations(
+    proxy, dao, indexer, accept_all_checker, deny_all_checker
+):
+    delegate = boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [
+            (SOME_FUNC, end_ts, accept_all_checker.address),
+            (TUPLES, end_ts, deny_all_checker.address),
+        ],
+        sender=dao,
+    )
+    first_block = _seal_block()
+    proxy.proxy__set_selector_delegations(
+        delegate, [(TUPLES, end_ts, accept_all_checker.address)], sender=dao
+    )
+    _seal_block()
+
+    indexer.sync()
+
+    selectors = {
+        d.selector for d in indexer.delegations(proxy.address, block=first_block)
+    }
+    assert selectors == {"0x" + SOME_FUNC.hex(), "0x" + TUPLES.hex()}
+    (delegation,) = indexer.delegations(proxy.address)
+    assert delegation.selector == "0x" + TUPLES.hex()
+    assert delegation.checker == accept_all_checker.address
+
+
+def test_permissions(proxy, dao, indexer):
+    checker = MOCK_CHECKER_DEPLOYER.deploy()
+    deployed_at = boa.env.timestamp
+    approve_checker(proxy, checker, dao)
+    _seal_block()
+
+    indexer.sync()
+
+    assert indexer.cooldowns(checker.address) == {
+        FOO_COOLDOWN: Cooldown(key=FOO_COOLDOWN, start=deployed_at, duration=2 * DAY)
+    }
+    assert indexer.intervals(checker.address) == {
+        FOO_INTERVAL: Interval(key=FOO_INTERVAL, lb=100, ub=200)
+    }
+    assert indexer.whitelists(checker.address) == {
+        FOO_WHITELIST: [
+            "0x1234567890123456789012345678901234567890",
+            "0x0987654321098765432109876543210987654321",
+        ]
+    }
+
+
+def test_sync_is_incremental(proxy, dao, indexer, accept_all_checker):
+    proxy.proxy__set_delegation(
+        boa.env.generate_address(),
+        (boa.env.timestamp + 1000, accept_all_checker.address, []),
+        sender=dao,
+    )
+    # the current block is not sealed yet
+    assert indexer.sync() == 0
+
+    block = _seal_block()
+    assert indexer.sync() == 1
+    assert indexer.checkpoint == block
+    assert indexer.sync() == 0
+
+
+def test_checkpoint_persisted(proxy, dao, source, tmp_path, accept_all_checker):
+    path = str(tmp_path / "index.db")
+    proxy.proxy__set_delegation(
+        boa.env.generate_address(),
+        (boa.env.timestamp + 1000, accept_all_checker.address, []),
+        sender=dao,
+    )
+    block = _seal_block()
+
+    indexer = Indexer(path, source, addresses=[proxy.address], batch_size=1)
+    indexer.sync()
+    indexer.close()
+
+    reopened = Indexer(path, source, addresses=[proxy.address])
+    assert reopened.checkpoint == block
+    assert len(reopened.delegations(proxy.address)) == 1
+    reopened.close()
+
+
+def test_addresses_filter(proxy, dao, source, tmp_path):
+    checker = MOCK_CHECKER_DEPLOYER.deploy()
+    _seal_block()
+
+    indexer = Indexer(str(tmp_path / "index.db"), source, addresses=[proxy.address])
+    indexer.sync()
+
+    assert indexer.intervals(checker.address) == {}
+    indexer.close()
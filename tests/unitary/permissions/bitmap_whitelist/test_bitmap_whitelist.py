@@ -0,0 +1,125 @@
+import boa
+import pytest
+
+KEY = boa.eval('keccak256("VAULTS")')
+OTHER_KEY = boa.eval('keccak256("OTHER_VAULTS")')
+
+
+@pytest.fixture(scope="module")
+def bitmap_whitelist_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import bitmap_whitelist
+
+initializes: bitmap_whitelist
+
+exports: (bitmap_whitelist.members, bitmap_whitelist.universe, bitmap_whitelist.bitmaps)
+
+@external
+def test_register_multiple(addrs: DynArray[address, 256]):
+    bitmap_whitelist.register_multiple(addrs)
+
+@external
+def test_set_bitmap(key: bytes32, bitmap: uint256):
+    bitmap_whitelist.set_bitmap(key, bitmap)
+
+@external
+def test_add_multiple(key: bytes32, addrs: DynArray[address, 256]):
+    bitmap_whitelist.add_multiple(key, addrs)
+
+@external
+def test_remove_multiple(key: bytes32, addrs: DynArray[address, 256]):
+    bitmap_whitelist.remove_multiple(key, addrs)
+
+@external
+@view
+def test_contains(key: bytes32, addr: address) -> bool:
+    return bitmap_whitelist.contains(key, addr)
+
+@external
+@view
+def test_check(key: bytes32, addr: address):
+    bitmap_whitelist.check(key, addr)
+"""
+    return boa.loads(source)
+
+
+@pytest.fixture
+def vaults(bitmap_whitelist_test_contract):
+    vaults = [boa.env.generate_address() for _ in range(8)]
+    bitmap_whitelist_test_contract.test_register_multiple(vaults)
+    return vaults
+
+
+def test_register(bitmap_whitelist_test_contract, vaults):
+    assert [bitmap_whitelist_test_contract.universe(i) for i in range(8)] == vaults
+
+    # registering again keeps the original positions
+    bitmap_whitelist_test_contract.test_register_multiple(vaults[::-1])
+    assert [bitmap_whitelist_test_contract.universe(i) for i in range(8)] == vaults
+
+
+def test_register_universe_full(bitmap_whitelist_test_contract):
+    bitmap_whitelist_test_contract.test_register_multiple(
+        [boa.env.generate_address() for _ in range(256)]
+    )
+
+    with boa.reverts("universe full"):
+        bitmap_whitelist_test_contract.test_register_multiple(
+            [boa.env.generate_address()]
+        )
+
+
+def test_add_and_remove_multiple(bitmap_whitelist_test_contract, vaults):
+    bitmap_whitelist_test_contract.test_add_multiple(KEY, vaults[:5])
+    bitmap_whitelist_test_contract.test_remove_multiple(KEY, vaults[1:3])
+
+    assert bitmap_whitelist_test_contract.bitmaps(KEY) == 0b11001
+    assert bitmap_whitelist_test_contract.members(KEY) == [
+        vaults[0],
+        vaults[3],
+        vaults[4],
+    ]
+    for vault in vaults:
+        expected = vault in (vaults[0], vaults[3], vaults[4])
+        assert bitmap_whitelist_test_contract.test_contains(KEY, vault) == expected
+    assert bitmap_whitelist_test_contract.members(OTHER_KEY) == []
+
+
+def test_add_multiple_event(bitmap_whitelist_test_contract, vaults):
+    bitmap_whitelist_test_contract.test_add_multiple(KEY, vaults[:2])
+
+    (event,) = bitmap_whitelist_test_contract.get_logs()
+    assert event.key == KEY
+    assert event.bitmap == 0b11
+
+
+def test_add_unregistered(bitmap_whitelist_test_contract, vaults):
+    with boa.reverts("address not registered"):
+        bitmap_whitelist_test_contract.test_add_multiple(
+            KEY, [boa.env.generate_address()]
+        )
+
+
+def test_add_empty(bitmap_whitelist_test_contract, vaults):
+    with boa.reverts("no addresses provided"):
+        bitmap_whitelist_test_contract.test_add_multiple(KEY, [])
+
+
+def test_set_bitmap(bitmap_whitelist_test_contract, vaults):
+    bitmap_whitelist_test_contract.test_set_bitmap(KEY, 0b10000001)
+    assert bitmap_whitelist_test_contract.members(KEY) == [vaults[0], vaults[7]]
+
+    with boa.reverts("address not registered"):
+        bitmap_whitelist_test_contract.test_set_bitmap(KEY, 1 << 8)
+
+
+def test_check(bitmap_whitelist_test_contract, vaults):
+    bitmap_whitelist_test_contract.test_add_multiple(KEY, [vaults[0]])
+
+    bitmap_whitelist_test_contract.test_check(KEY, vaults[0])
+    with boa.reverts("address not whitelisted"):
+        bitmap_whitelist_test_contract.test_check(KEY, vaults[1])
+    with boa.reverts("address not whitelisted"):
+        bitmap_whitelist_test_contract.test_check(KEY, boa.env.generate_address())
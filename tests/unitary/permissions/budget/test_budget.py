@@ -0,0 +1,87 @@
+import pytest
+import boa
+
+from tests.utils.transactions import end_transaction
+
+
+@pytest.fixture(scope="module")
+def budget_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import budget
+
+initializes: budget
+
+@external
+def test_add(key: bytes32, limit: uint256, override: bool = False):
+    budget.add(key, limit, override)
+
+@external
+def test_consume(key: bytes32, amount: uint256):
+    budget.consume(key, amount)
+
+@external
+def test_consume_many(key: bytes32, amounts: DynArray[uint256, 10]):
+    for amount: uint256 in amounts:
+        budget.consume(key, amount)
+
+@external
+@view
+def remaining(key: bytes32) -> uint256:
+    return budget.remaining(key)
+"""
+    return boa.loads(source)
+
+
+def test_add_existing_without_override_reverts(budget_test_contract):
+    key = boa.eval('keccak256("test_existing")')
+    budget_test_contract.test_add(key, 100)
+
+    with boa.reverts("budget already exists"):
+        budget_test_contract.test_add(key, 200)
+
+    budget_test_contract.test_add(key, 200, True)
+    assert budget_test_contract.remaining(key) == 200
+
+
+def test_consume_nonexistent_reverts(budget_test_contract):
+    key = boa.eval('keccak256("test_nonexistent")')
+
+    with boa.reverts("budget does not exist"):
+        budget_test_contract.test_consume(key, 0)
+
+
+def test_consume_within_transaction(budget_test_contract):
+    key = boa.eval('keccak256("test_within")')
+    budget_test_contract.test_add(key, 100)
+
+    budget_test_contract.test_consume_many(key, [30, 30, 40])
+
+    with boa.reverts("budget exceeded"):
+        budget_test_contract.test_consume_many(key, [60, 41])
+
+
+def test_budget_resets_every_transaction(budget_test_contract):
+    key = boa.eval('keccak256("test_reset")')
+    budget_test_contract.test_add(key, 100)
+    end_transaction()
+
+    budget_test_contract.test_consume(key, 100)
+    assert budget_test_contract.remaining(key) == 0
+    with boa.reverts("budget exceeded"):
+        budget_test_contract.test_consume(key, 1)
+
+    end_transaction()
+
+    assert budget_test_contract.remaining(key) == 100
+    budget_test_contract.test_consume(key, 100)
+
+
+def test_zero_budget(budget_test_contract):
+    key = boa.eval('keccak256("test_zero")')
+    budget_test_contract.test_add(key, 0)
+
+    budget_test_contract.test_consume(key, 0)
+    with boa.reverts("budget exceeded"):
+        budget_test_contract.test_consume(key, 1)
@@ -0,0 +1,68 @@
+import boa
+import pytest
+
+
+@pytest.fixture(scope="module")
+def calldata_test_contract():
+    # the module reads the calldata of these calls: `index` is word 0, the
+    # arguments after it are words 1 and 2
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import calldata
+
+@external
+@view
+def test_selector() -> bytes4:
+    return calldata.selector()
+
+@external
+@view
+def test_word(index: uint256, a: uint256, b: uint256) -> uint256:
+    return calldata.word(index)
+
+@external
+@view
+def test_address_arg(index: uint256, a: uint256, b: address) -> address:
+    return calldata.address_arg(index)
+
+@external
+@view
+def test_check_equals(index: uint256, a: uint256, expected: uint256):
+    calldata.check_equals(index, expected)
+"""
+    return boa.loads(source)
+
+
+def test_selector(calldata_test_contract):
+    selector = calldata_test_contract.test_selector.prepare_calldata()
+    assert calldata_test_contract.test_selector() == selector
+
+
+def test_word(calldata_test_contract):
+    assert calldata_test_contract.test_word(0, 10, 20) == 0
+    assert calldata_test_contract.test_word(1, 10, 20) == 10
+    assert calldata_test_contract.test_word(2, 10, 20) == 20
+
+
+def test_word_out_of_bounds(calldata_test_contract):
+    with boa.reverts("calldata too short"):
+        calldata_test_contract.test_word(3, 10, 20)
+
+
+def test_address_arg(calldata_test_contract):
+    addr = boa.env.generate_address()
+    assert calldata_test_contract.test_address_arg(2, 0, addr) == addr
+
+
+def test_address_arg_rejects_dirty_word(calldata_test_contract):
+    with boa.reverts("invalid address"):
+        calldata_test_contract.test_address_arg(1, 2**160, boa.env.generate_address())
+
+
+def test_check_equals(calldata_test_contract):
+    calldata_test_contract.test_check_equals(1, 42, 42)
+    calldata_test_contract.test_check_equals(2, 0, 2)
+
+    with boa.reverts("argument mismatch"):
+        calldata_test_contract.test_check_equals(1, 43, 42)
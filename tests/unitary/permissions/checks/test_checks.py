@@ -0,0 +1,97 @@
+import boa
+import pytest
+
+KEY = boa.eval('keccak256("KEY")')
+WHITELISTED = "0x1234567890123456789012345678901234567890"
+DAY = 86400
+
+# CheckKind flag values
+WHITELIST = 1
+INTERVAL = 2
+COOLDOWN = 4
+
+
+@pytest.fixture(scope="module")
+def checks_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.interfaces import IChecks
+from ownership_proxy.permissions import checks
+from ownership_proxy.permissions import cooldown
+from ownership_proxy.permissions import interval
+from ownership_proxy.permissions import whitelist
+
+initializes: cooldown
+initializes: interval
+initializes: whitelist
+initializes: checks[cooldown := cooldown, interval := interval, whitelist := whitelist]
+
+exports: cooldown.cooldowns
+
+KEY: constant(bytes32) = keccak256("KEY")
+
+@deploy
+def __init__():
+    cooldown.add(KEY, 86400)
+    interval.add(KEY, 100, 200)
+    whitelist.add(KEY, 0x1234567890123456789012345678901234567890)
+
+@external
+def test_run(addy: address, amount: uint256):
+    # declared most expensive first
+    checks.run([
+        checks.cooled_down(KEY),
+        checks.within(KEY, amount),
+        checks.whitelisted(KEY, addy),
+    ])
+
+@external
+def test_run_empty():
+    checks.run([])
+
+@external
+@view
+def test_constructors(addy: address, amount: uint256) -> DynArray[IChecks.Check, 3]:
+    return [checks.whitelisted(KEY, addy), checks.within(KEY, amount), checks.cooled_down(KEY)]
+"""
+    return boa.loads(source)
+
+
+def test_run(checks_test_contract):
+    boa.env.time_travel(seconds=DAY)
+
+    checks_test_contract.test_run(WHITELISTED, 150)
+
+    assert checks_test_contract.cooldowns(KEY).start == boa.env.timestamp
+
+
+def test_state_changing_checks_run_last(checks_test_contract):
+    # the cooldown would fail too, but isn't reached
+    with boa.reverts("address not whitelisted"):
+        checks_test_contract.test_run(boa.env.generate_address(), 150)
+
+    with boa.reverts("value out of interval"):
+        checks_test_contract.test_run(WHITELISTED, 250)
+
+    with boa.reverts("cooldown not expired"):
+        checks_test_contract.test_run(WHITELISTED, 150)
+
+
+def test_cheapest_view_checks_first(checks_test_contract):
+    boa.env.time_travel(seconds=DAY)
+
+    with boa.reverts("address not whitelisted"):
+        checks_test_contract.test_run(boa.env.generate_address(), 250)
+
+
+def test_run_empty(checks_test_contract):
+    checks_test_contract.test_run_empty()
+
+
+def test_constructors(checks_test_contract):
+    assert checks_test_contract.test_constructors(WHITELISTED, 150) == [
+        (WHITELIST, KEY, int(WHITELISTED, 16)),
+        (INTERVAL, KEY, 150),
+        (COOLDOWN, KEY, 0),
+    ]
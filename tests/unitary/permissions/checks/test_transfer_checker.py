@@ -0,0 +1,46 @@
+import boa
+import pytest
+
+from tests.utils.checkers import approve_checker
+from tests.utils.deployers import PROXY_DEPLOYER, TRANSFER_CHECKER_DEPLOYER
+
+TREASURY = "0x1234567890123456789012345678901234567890"
+DAY = 86400
+
+
+@pytest.fixture(scope="module")
+def token():
+    return boa.loads("""
+# pragma version 0.4.3
+
+@external
+def transfer(recipient: address, amount: uint256) -> bool:
+    return True
+""")
+
+
+@pytest.fixture
+def delegate():
+    return boa.env.generate_address()
+
+
+@pytest.fixture
+def proxy_as_token(token, dao, delegate):
+    proxy = PROXY_DEPLOYER.deploy(token.address, dao, False)
+    checker = TRANSFER_CHECKER_DEPLOYER.deploy()
+    approve_checker(proxy, checker, dao)
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 30 * DAY, checker.address, []), sender=dao
+    )
+    # the cooldown starts on deployment
+    boa.env.time_travel(seconds=DAY)
+    return token.at(proxy.address)
+
+
+def test_transfer_allowed(proxy_as_token, delegate):
+    assert proxy_as_token.transfer(TREASURY, 1000, sender=delegate)
+
+
+def test_transfer_denied(proxy_as_token, delegate):
+    with boa.reverts("address not whitelisted"):
+        proxy_as_token.transfer(boa.env.generate_address(), 1000, sender=delegate)
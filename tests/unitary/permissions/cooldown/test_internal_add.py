@@ -5,8 +5,8 @@ from hypothesis import given, strategies as st
 
 def get_cooldown(contract, key_str):
     """Helper to get cooldown storage values using eval"""
-    start = contract.eval(f'cooldown.cooldowns[keccak256("{key_str}")].start')
-    duration = contract.eval(f'cooldown.cooldowns[keccak256("{key_str}")].duration')
+    start = contract.eval(f'cooldown.get(keccak256("{key_str}")).start')
+    duration = contract.eval(f'cooldown.get(keccak256("{key_str}")).duration')
     return start, duration
 
 
@@ -15,7 +15,7 @@ def cooldown_test_contract():
     source = """
 # pragma version 0.4.3
 
-from contracts.permissions import cooldown
+from ownership_proxy.permissions import cooldown
 
 initializes: cooldown
 
@@ -26,7 +26,7 @@ def test_add(key: bytes32, duration: uint256, override: bool = False):
 @external
 @view
 def get_cooldown_raw(key: bytes32) -> (uint128, uint128):
-    return cooldown.cooldowns[key].start, cooldown.cooldowns[key].duration
+    return cooldown.get(key).start, cooldown.get(key).duration
 """
     return boa.loads(source)
 
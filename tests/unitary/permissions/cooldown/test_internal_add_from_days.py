@@ -8,7 +8,7 @@ def cooldown_test_contract():
     source = """
 # pragma version 0.4.3
 
-from contracts.permissions import cooldown
+from ownership_proxy.permissions import cooldown
 
 initializes: cooldown
 
@@ -19,7 +19,7 @@ def test_add_from_days(key: bytes32, duration_days: uint256, override: bool = Fa
 @external
 @view
 def get_cooldown(key: bytes32) -> (uint128, uint128):
-    return cooldown.cooldowns[key].start, cooldown.cooldowns[key].duration
+    return cooldown.get(key).start, cooldown.get(key).duration
 """
     return boa.loads(source)
 
@@ -0,0 +1,157 @@
+import pytest
+import boa
+from hypothesis import given, settings, strategies as st
+
+DAY = 86400
+
+
+@pytest.fixture(scope="module")
+def cumulative_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import cumulative
+
+initializes: cumulative
+
+exports: cumulative.cumulatives
+
+@external
+def test_add(key: bytes32, cap: uint256, period: uint256, override: bool = False):
+    cumulative.add(key, cap, period, override)
+
+@external
+def test_add_per_day(key: bytes32, cap: uint256):
+    cumulative.add_per_day(key, cap)
+
+@external
+def test_check_and_consume(key: bytes32, amount: uint256):
+    cumulative.check_and_consume(key, amount)
+
+@external
+@view
+def remaining(key: bytes32) -> uint256:
+    return cumulative.remaining(key)
+"""
+    return boa.loads(source)
+
+
+def test_add(cumulative_test_contract):
+    key = boa.eval('keccak256("test_add")')
+
+    cumulative_test_contract.test_add(key, 1000, 3600)
+
+    assert cumulative_test_contract.cumulatives(key) == (
+        0,
+        1000,
+        3600,
+        boa.env.timestamp,
+    )
+    assert cumulative_test_contract.remaining(key) == 1000
+
+
+def test_add_per_day(cumulative_test_contract):
+    key = boa.eval('keccak256("test_add_per_day")')
+
+    cumulative_test_contract.test_add_per_day(key, 1000)
+
+    assert cumulative_test_contract.cumulatives(key)[2] == DAY
+
+
+def test_add_existing_without_override_reverts(cumulative_test_contract):
+    key = boa.eval('keccak256("test_existing")')
+    cumulative_test_contract.test_add(key, 1000, 3600)
+    cumulative_test_contract.test_check_and_consume(key, 1000)
+
+    with boa.reverts("cumulative cap already exists"):
+        cumulative_test_contract.test_add(key, 2000, 3600)
+
+    # starts a new period
+    cumulative_test_contract.test_add(key, 2000, 3600, True)
+    assert cumulative_test_contract.remaining(key) == 2000
+
+
+@pytest.mark.parametrize(
+    "cap,period,reason",
+    [
+        (0, 3600, "cap must be positive"),
+        (2**96, 3600, "cap too large"),
+        (1000, 0, "period must be positive"),
+        (1000, 2**24, "period too large"),
+    ],
+)
+def test_add_invalid(cumulative_test_contract, cap, period, reason):
+    key = boa.eval('keccak256("test_invalid")')
+
+    with boa.reverts(reason):
+        cumulative_test_contract.test_add(key, cap, period)
+
+
+def test_consume_nonexistent_reverts(cumulative_test_contract):
+    key = boa.eval('keccak256("test_nonexistent")')
+
+    assert cumulative_test_contract.remaining(key) == 0
+    with boa.reverts("cumulative cap does not exist"):
+        cumulative_test_contract.test_check_and_consume(key, 0)
+
+
+def test_consume_up_to_cap(cumulative_test_contract):
+    key = boa.eval('keccak256("test_consume")')
+    cumulative_test_contract.test_add_per_day(key, 1000)
+
+    # no refill within the period, however the amount is split
+    for _ in range(4):
+        cumulative_test_contract.test_check_and_consume(key, 250)
+        boa.env.time_travel(seconds=DAY // 5)
+
+    assert cumulative_test_contract.remaining(key) == 0
+    with boa.reverts("cumulative cap exceeded"):
+        cumulative_test_contract.test_check_and_consume(key, 1)
+
+
+def test_rollover(cumulative_test_contract):
+    key = boa.eval('keccak256("test_rollover")')
+    cumulative_test_contract.test_add_per_day(key, 1000)
+    start = boa.env.timestamp
+    cumulative_test_contract.test_check_and_consume(key, 1000)
+
+    boa.env.time_travel(seconds=DAY - 1)
+    with boa.reverts("cumulative cap exceeded"):
+        cumulative_test_contract.test_check_and_consume(key, 1)
+
+    # several periods later, the current period stays aligned with the first one
+    boa.env.time_travel(seconds=2 * DAY + 100)
+    assert cumulative_test_contract.remaining(key) == 1000
+    cumulative_test_contract.test_check_and_consume(key, 400)
+
+    assert cumulative_test_contract.cumulatives(key) == (
+        400,
+        1000,
+        DAY,
+        start + 3 * DAY,
+    )
+    assert cumulative_test_contract.remaining(key) == 600
+
+
+@settings(deadline=None)
+@given(
+    cap=st.integers(min_value=1, max_value=2**96 - 1),
+    period=st.integers(min_value=1, max_value=2**24 - 1),
+    consumed=st.integers(min_value=0, max_value=2**96 - 1),
+    elapsed=st.integers(min_value=0, max_value=2**26),
+)
+def test_rollover_fuzz(cumulative_test_contract, cap, period, consumed, elapsed):
+    key = boa.eval(f'keccak256("fuzz_{cap}_{period}_{consumed}_{elapsed}")')
+    consumed = min(consumed, cap)
+    start = boa.env.timestamp
+    cumulative_test_contract.test_add(key, cap, period)
+    cumulative_test_contract.test_check_and_consume(key, consumed)
+
+    boa.env.time_travel(seconds=elapsed)
+
+    expected = cap - consumed if elapsed < period else cap
+    assert cumulative_test_contract.remaining(key) == expected
+    cumulative_test_contract.test_check_and_consume(key, expected)
+    assert cumulative_test_contract.remaining(key) == 0
+    period_start = cumulative_test_contract.cumulatives(key)[3]
+    assert period_start == start + elapsed // period * period
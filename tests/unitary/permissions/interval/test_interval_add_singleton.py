@@ -9,7 +9,7 @@ def interval():
     source = """
 # pragma version 0.4.3
 
-from contracts.permissions import interval
+from ownership_proxy.permissions import interval
 
 initializes: interval
 
@@ -8,7 +8,7 @@ def interval_test_contract():
     source = """
 # pragma version 0.4.3
 
-from contracts.permissions import interval
+from ownership_proxy.permissions import interval
 
 initializes: interval
 
@@ -0,0 +1,129 @@
+import pytest
+import boa
+from hypothesis import given, settings, strategies as st
+
+from ownership_proxy.merkle import MerkleTree, leaf
+
+
+@pytest.fixture(scope="module")
+def merkle_whitelist_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import merkle_whitelist
+
+initializes: merkle_whitelist
+
+@external
+def test_set_root(key: bytes32, root: bytes32, override: bool = False):
+    merkle_whitelist.set_root(key, root, override)
+
+@external
+@view
+def test_check(key: bytes32, addr: address, proof: DynArray[bytes32, 32]):
+    merkle_whitelist.check(key, addr, proof)
+
+@external
+@pure
+def test_leaf(addr: address) -> bytes32:
+    return merkle_whitelist.leaf(addr)
+
+@external
+@view
+def get_root(key: bytes32) -> bytes32:
+    return merkle_whitelist.merkle_roots[key]
+"""
+    return boa.loads(source)
+
+
+def test_leaf_matches_contract(merkle_whitelist_test_contract):
+    addr = boa.env.generate_address()
+
+    assert merkle_whitelist_test_contract.test_leaf(addr) == leaf(addr)
+
+
+def test_set_root(merkle_whitelist_test_contract):
+    key = boa.eval('keccak256("test_set_root")')
+    root = MerkleTree([boa.env.generate_address()]).root
+
+    merkle_whitelist_test_contract.test_set_root(key, root)
+
+    assert merkle_whitelist_test_contract.get_root(key) == root
+
+
+def test_set_root_existing_without_override_reverts(merkle_whitelist_test_contract):
+    key = boa.eval('keccak256("test_existing")')
+    merkle_whitelist_test_contract.test_set_root(key, b"\x01" * 32)
+
+    with boa.reverts("merkle root already set"):
+        merkle_whitelist_test_contract.test_set_root(key, b"\x02" * 32)
+
+    merkle_whitelist_test_contract.test_set_root(key, b"\x02" * 32, True)
+    assert merkle_whitelist_test_contract.get_root(key) == b"\x02" * 32
+
+
+def test_set_empty_root_reverts(merkle_whitelist_test_contract):
+    key = boa.eval('keccak256("test_empty")')
+
+    with boa.reverts("empty root"):
+        merkle_whitelist_test_contract.test_set_root(key, b"\x00" * 32)
+
+
+def test_check_without_root_reverts(merkle_whitelist_test_contract):
+    key = boa.eval('keccak256("test_no_root")')
+
+    with boa.reverts("merkle root not set"):
+        merkle_whitelist_test_contract.test_check(key, boa.env.generate_address(), [])
+
+
+def test_check_single_address(merkle_whitelist_test_contract):
+    key = boa.eval('keccak256("test_single")')
+    addr = boa.env.generate_address()
+    tree = MerkleTree([addr])
+    merkle_whitelist_test_contract.test_set_root(key, tree.root)
+
+    assert tree.proof(addr) == []
+    merkle_whitelist_test_contract.test_check(key, addr, [])
+
+
+def test_check_not_whitelisted_reverts(merkle_whitelist_test_contract):
+    key = boa.eval('keccak256("test_not_whitelisted")')
+    addrs = [boa.env.generate_address() for _ in range(5)]
+    tree = MerkleTree(addrs)
+    merkle_whitelist_test_contract.test_set_root(key, tree.root)
+
+    with boa.reverts("address not whitelisted"):
+        merkle_whitelist_test_contract.test_check(
+            key, boa.env.generate_address(), tree.proof(addrs[0])
+        )
+
+
+def test_check_root_override_revokes(merkle_whitelist_test_contract):
+    key = boa.eval('keccak256("test_revoke")')
+    addrs = [boa.env.generate_address() for _ in range(3)]
+    tree = MerkleTree(addrs)
+    merkle_whitelist_test_contract.test_set_root(key, tree.root)
+
+    merkle_whitelist_test_contract.test_set_root(key, MerkleTree(addrs[1:]).root, True)
+
+    with boa.reverts("address not whitelisted"):
+        merkle_whitelist_test_contract.test_check(key, addrs[0], tree.proof(addrs[0]))
+
+
+def test_tree_rejects_duplicates():
+    addr = boa.env.generate_address()
+
+    with pytest.raises(ValueError, match="duplicate"):
+        MerkleTree([addr, addr])
+
+
+@settings(max_examples=20, deadline=None)
+@given(num_addrs=st.integers(min_value=1, max_value=100))
+def test_check_fuzz(merkle_whitelist_test_contract, num_addrs):
+    key = boa.eval(f'keccak256("fuzz_{num_addrs}")')
+    addrs = [boa.env.generate_address() for _ in range(num_addrs)]
+    tree = MerkleTree(addrs)
+    merkle_whitelist_test_contract.test_set_root(key, tree.root, True)
+
+    for addr in addrs:
+        merkle_whitelist_test_contract.test_check(key, addr, tree.proof(addr))
@@ -0,0 +1,42 @@
+import boa
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+
+@pytest.fixture(scope="module")
+def packing_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import packing
+
+@external
+@pure
+def test_pack(amount: uint96, bound: uint96, period: uint24, timestamp: uint40) -> uint256:
+    return packing.pack(amount, bound, period, timestamp)
+
+@external
+@pure
+def test_unpack(packed: uint256) -> (uint96, uint96, uint24, uint40):
+    return packing.unpack(packed)
+"""
+    return boa.loads(source)
+
+
+@given(
+    amount=st.integers(0, 2**96 - 1),
+    bound=st.integers(0, 2**96 - 1),
+    period=st.integers(0, 2**24 - 1),
+    timestamp=st.integers(0, 2**40 - 1),
+)
+def test_roundtrip(packing_test_contract, amount, bound, period, timestamp):
+    packed = packing_test_contract.test_pack(amount, bound, period, timestamp)
+
+    assert packed == amount | bound << 96 | period << 192 | timestamp << 216
+    assert packing_test_contract.test_unpack(packed) == (
+        amount,
+        bound,
+        period,
+        timestamp,
+    )
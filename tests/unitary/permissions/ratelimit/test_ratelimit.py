@@ -0,0 +1,179 @@
+import pytest
+import boa
+from hypothesis import given, settings, strategies as st
+
+DAY = 86400
+
+
+@pytest.fixture(scope="module")
+def ratelimit_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import ratelimit
+
+initializes: ratelimit
+
+exports: ratelimit.ratelimits
+
+@external
+def test_add(key: bytes32, capacity: uint256, period: uint256, override: bool = False):
+    ratelimit.add(key, capacity, period, override)
+
+@external
+def test_add_per_day(key: bytes32, capacity: uint256):
+    ratelimit.add_per_day(key, capacity)
+
+@external
+def test_check_and_consume(key: bytes32, amount: uint256):
+    ratelimit.check_and_consume(key, amount)
+
+@external
+@view
+def available(key: bytes32) -> uint256:
+    return ratelimit.available(key)
+"""
+    return boa.loads(source)
+
+
+def test_add(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_add")')
+
+    ratelimit_test_contract.test_add(key, 1000, 3600)
+
+    assert ratelimit_test_contract.ratelimits(key) == (
+        1000,
+        1000,
+        3600,
+        boa.env.timestamp,
+    )
+    assert ratelimit_test_contract.available(key) == 1000
+
+
+def test_add_per_day(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_add_per_day")')
+
+    ratelimit_test_contract.test_add_per_day(key, 1000)
+
+    assert ratelimit_test_contract.ratelimits(key)[2] == DAY
+
+
+def test_add_existing_without_override_reverts(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_existing")')
+    ratelimit_test_contract.test_add(key, 1000, 3600)
+
+    with boa.reverts("rate limit already exists"):
+        ratelimit_test_contract.test_add(key, 2000, 3600)
+
+    ratelimit_test_contract.test_add(key, 2000, 3600, True)
+    assert ratelimit_test_contract.available(key) == 2000
+
+
+@pytest.mark.parametrize(
+    "capacity,period,reason",
+    [
+        (0, 3600, "capacity must be positive"),
+        (2**96, 3600, "capacity too large"),
+        (1000, 0, "period must be positive"),
+        (1000, 2**24, "period too large"),
+    ],
+)
+def test_add_invalid(ratelimit_test_contract, capacity, period, reason):
+    key = boa.eval('keccak256("test_invalid")')
+
+    with boa.reverts(reason):
+        ratelimit_test_contract.test_add(key, capacity, period)
+
+
+def test_consume_nonexistent_reverts(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_nonexistent")')
+
+    assert ratelimit_test_contract.available(key) == 0
+    with boa.reverts("rate limit does not exist"):
+        ratelimit_test_contract.test_check_and_consume(key, 0)
+
+
+def test_consume_up_to_capacity(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_consume")')
+    ratelimit_test_contract.test_add_per_day(key, 1000)
+
+    ratelimit_test_contract.test_check_and_consume(key, 400)
+    ratelimit_test_contract.test_check_and_consume(key, 600)
+
+    assert ratelimit_test_contract.available(key) == 0
+    with boa.reverts("rate limit exceeded"):
+        ratelimit_test_contract.test_check_and_consume(key, 1)
+
+
+def test_refill(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_refill")')
+    ratelimit_test_contract.test_add_per_day(key, 1000)
+    ratelimit_test_contract.test_check_and_consume(key, 1000)
+
+    boa.env.time_travel(seconds=DAY // 4)
+    assert ratelimit_test_contract.available(key) == 250
+
+    ratelimit_test_contract.test_check_and_consume(key, 250)
+    with boa.reverts("rate limit exceeded"):
+        ratelimit_test_contract.test_check_and_consume(key, 1)
+
+
+def test_refill_capped_at_capacity(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_capped")')
+    ratelimit_test_contract.test_add_per_day(key, 1000)
+    ratelimit_test_contract.test_check_and_consume(key, 100)
+
+    boa.env.time_travel(seconds=10 * DAY)
+
+    assert ratelimit_test_contract.available(key) == 1000
+    with boa.reverts("rate limit exceeded"):
+        ratelimit_test_contract.test_check_and_consume(key, 1001)
+
+
+def test_frequent_consumes(ratelimit_test_contract):
+    # the fraction of a unit refilled between calls carries over to the next one
+    key = boa.eval('keccak256("test_frequent_consumes")')
+    ratelimit_test_contract.test_add_per_day(key, 10)
+    ratelimit_test_contract.test_check_and_consume(key, 10)
+
+    allowed = 0
+    for _ in range(5 * 12):
+        boa.env.time_travel(seconds=2 * 3600)
+        if ratelimit_test_contract.available(key) >= 1:
+            ratelimit_test_contract.test_check_and_consume(key, 1)
+            allowed += 1
+
+    assert allowed == 5 * 10
+
+
+def test_frequent_pokes(ratelimit_test_contract):
+    key = boa.eval('keccak256("test_frequent_pokes")')
+    ratelimit_test_contract.test_add_per_day(key, 100)
+    ratelimit_test_contract.test_check_and_consume(key, 100)
+
+    # every poke refills less than a unit
+    for _ in range(DAY // 600):
+        boa.env.time_travel(seconds=600)
+        ratelimit_test_contract.test_check_and_consume(key, 0)
+
+    assert ratelimit_test_contract.available(key) == 100
+
+
+@settings(deadline=None)
+@given(
+    capacity=st.integers(min_value=1, max_value=2**96 - 1),
+    period=st.integers(min_value=1, max_value=2**24 - 1),
+    consumed=st.integers(min_value=0, max_value=2**96 - 1),
+    elapsed=st.integers(min_value=0, max_value=2**24),
+)
+def test_refill_fuzz(ratelimit_test_contract, capacity, period, consumed, elapsed):
+    key = boa.eval(f'keccak256("fuzz_{capacity}_{period}_{consumed}_{elapsed}")')
+    consumed = min(consumed, capacity)
+    ratelimit_test_contract.test_add(key, capacity, period)
+    ratelimit_test_contract.test_check_and_consume(key, consumed)
+
+    boa.env.time_travel(seconds=elapsed)
+
+    expected = min(capacity, capacity - consumed + elapsed * capacity // period)
+    assert ratelimit_test_contract.available(key) == expected
+    ratelimit_test_contract.test_check_and_consume(key, expected)
@@ -0,0 +1,132 @@
+import pytest
+import boa
+from hypothesis import given, settings, strategies as st
+
+
+@pytest.fixture(scope="module")
+def whitelist_test_contract():
+    source = """
+# pragma version 0.4.3
+
+from ownership_proxy.permissions import whitelist
+
+initializes: whitelist
+
+exports: (whitelist.count, whitelist.at, whitelist.slice)
+
+@external
+def test_add_multiple(key: bytes32, addrs: DynArray[address, 1000], override: bool = False):
+    whitelist.add_multiple(key, addrs, override)
+
+@external
+def test_remove(key: bytes32, addr: address):
+    whitelist.remove(key, addr)
+
+@external
+@view
+def is_whitelisted(key: bytes32, addr: address) -> bool:
+    return whitelist.contains(key, addr)
+"""
+    return boa.loads(source)
+
+
+def test_enumerate_empty(whitelist_test_contract):
+    key = boa.eval('keccak256("test_empty")')
+
+    assert whitelist_test_contract.count(key) == 0
+    assert whitelist_test_contract.slice(key, 0, 10) == []
+    with boa.reverts("index out of bounds"):
+        whitelist_test_contract.at(key, 0)
+
+
+def test_enumerate_after_add(whitelist_test_contract):
+    key = boa.eval('keccak256("test_add")')
+    addrs = [boa.env.generate_address() for _ in range(5)]
+
+    whitelist_test_contract.test_add_multiple(key, addrs)
+
+    assert whitelist_test_contract.count(key) == 5
+    assert [whitelist_test_contract.at(key, i) for i in range(5)] == addrs
+    assert whitelist_test_contract.slice(key, 0, 5) == addrs
+
+
+def test_override_does_not_duplicate(whitelist_test_contract):
+    key = boa.eval('keccak256("test_override")')
+    addr = boa.env.generate_address()
+
+    whitelist_test_contract.test_add_multiple(key, [addr, addr], True)
+
+    assert whitelist_test_contract.count(key) == 1
+
+
+def test_slice_pagination(whitelist_test_contract):
+    key = boa.eval('keccak256("test_slice")')
+    addrs = [boa.env.generate_address() for _ in range(7)]
+    whitelist_test_contract.test_add_multiple(key, addrs)
+
+    assert whitelist_test_contract.slice(key, 0, 3) == addrs[:3]
+    assert whitelist_test_contract.slice(key, 3, 3) == addrs[3:6]
+    # pages past the end are truncated
+    assert whitelist_test_contract.slice(key, 6, 3) == addrs[6:]
+    assert whitelist_test_contract.slice(key, 7, 3) == []
+    assert whitelist_test_contract.slice(key, 100, 3) == []
+
+
+def test_remove_swaps_last_member(whitelist_test_contract):
+    key = boa.eval('keccak256("test_remove")')
+    addrs = [boa.env.generate_address() for _ in range(4)]
+    whitelist_test_contract.test_add_multiple(key, addrs)
+
+    whitelist_test_contract.test_remove(key, addrs[1])
+
+    assert whitelist_test_contract.slice(key, 0, 10) == [addrs[0], addrs[3], addrs[2]]
+    # the moved member can still be removed
+    whitelist_test_contract.test_remove(key, addrs[3])
+    assert whitelist_test_contract.slice(key, 0, 10) == [addrs[0], addrs[2]]
+    assert not whitelist_test_contract.is_whitelisted(key, addrs[3])
+
+
+def test_remove_last_member(whitelist_test_contract):
+    key = boa.eval('keccak256("test_remove_last")')
+    addrs = [boa.env.generate_address() for _ in range(3)]
+    whitelist_test_contract.test_add_multiple(key, addrs)
+
+    whitelist_test_contract.test_remove(key, addrs[2])
+
+    assert whitelist_test_contract.slice(key, 0, 10) == addrs[:2]
+
+
+@settings(max_examples=20, deadline=None)
+@given(
+    num_addrs=st.integers(min_value=1, max_value=20),
+    removals=st.lists(st.integers(min_value=0, max_value=19), max_size=20),
+)
+def test_enumeration_fuzz(whitelist_test_contract, num_addrs, removals):
+    key = boa.eval(f'keccak256("fuzz_{num_addrs}_{removals}")')
+    addrs = [boa.env.generate_address() for _ in range(num_addrs)]
+    whitelist_test_contract.test_add_multiple(key, addrs)
+
+    remaining = set(addrs)
+    for i in removals:
+        addr = addrs[i % num_addrs]
+        if addr in remaining:
+            whitelist_test_contract.test_remove(key, addr)
+            remaining.remove(addr)
+
+    assert whitelist_test_contract.count(key) == len(remaining)
+    assert set(whitelist_test_contract.slice(key, 0, num_addrs)) == remaining
+
+
+def test_whitelist_full(whitelist_test_contract):
+    key = boa.eval('keccak256("test_full")')
+    addrs = [boa.env.generate_address() for _ in range(1000)]
+    whitelist_test_contract.test_add_multiple(key, addrs)
+
+    with boa.reverts("whitelist full"):
+        whitelist_test_contract.test_add_multiple(key, [boa.env.generate_address()])
+
+    # re-adding a member doesn't take a slot, freeing one makes room again
+    whitelist_test_contract.test_add_multiple(key, [addrs[0]], True)
+    whitelist_test_contract.test_remove(key, addrs[0])
+    whitelist_test_contract.test_add_multiple(key, [boa.env.generate_address()])
+    assert whitelist_test_contract.count(key) == 1000
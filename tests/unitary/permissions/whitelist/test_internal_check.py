@@ -7,7 +7,7 @@ def whitelist_test_contract():
     source = """
 # pragma version 0.4.3
 
-from contracts.permissions import whitelist
+from ownership_proxy.permissions import whitelist
 
 initializes: whitelist
 
@@ -7,7 +7,7 @@ def whitelist_test_contract():
     source = """
 # pragma version 0.4.3
 
-from contracts.permissions import whitelist
+from ownership_proxy.permissions import whitelist
 
 initializes: whitelist
 
@@ -22,7 +22,7 @@ def test_remove(key: bytes32, addr: address):
 @external
 @view
 def is_whitelisted(key: bytes32, addr: address) -> bool:
-    return whitelist.whitelist[key][addr]
+    return whitelist.contains(key, addr)
 """
     return boa.loads(source)
 
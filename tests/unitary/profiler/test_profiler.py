@@ -0,0 +1,157 @@
+import json
+
+import boa
+import pytest
+
+from ownership_proxy.profiler import GasProfiler
+from tests.utils.checkers import approve_checker
+from tests.utils.deployers import MOCK_CHECKER_DEPLOYER, PROXY_DEPLOYER
+
+FOO = boa.eval('method_id("foo(address,uint256)")')
+FOO_INTERVAL = "0x" + boa.eval('keccak256("FOO_INTERVAL")').hex()
+FOO_COOLDOWN = "0x" + boa.eval('keccak256("FOO_COOLDOWN")').hex()
+WHITELISTED = "0x1234567890123456789012345678901234567890"
+DAY = 86400
+
+
+@pytest.fixture(scope="module")
+def foo_target():
+    return boa.loads("""
+# pragma version 0.4.3
+
+@external
+def foo(addy: address, amount: uint256) -> uint256:
+    return amount
+""")
+
+
+@pytest.fixture(scope="module")
+def foo_proxy(foo_target, dao):
+    return PROXY_DEPLOYER.deploy(foo_target.address, dao, False)
+
+
+@pytest.fixture
+def checker(foo_proxy, dao):
+    checker = MOCK_CHECKER_DEPLOYER.deploy()
+    approve_checker(foo_proxy, checker, dao)
+    return checker
+
+
+@pytest.fixture
+def delegate(foo_proxy, checker, dao):
+    delegate = boa.env.generate_address()
+    foo_proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 30 * DAY, checker.address, []), sender=dao
+    )
+    return delegate
+
+
+def _foo(addy, amount):
+    return FOO + boa.util.abi.abi_encode("(address,uint256)", (addy, amount))
+
+
+@pytest.fixture
+def profile(foo_proxy, delegate):
+    boa.env.time_travel(seconds=2 * DAY)
+    return GasProfiler(foo_proxy.address).profile(delegate, _foo(WHITELISTED, 150))
+
+
+def test_frames(profile, foo_proxy, foo_target, checker):
+    assert profile.success
+    assert [(f.role, f.address, f.parent) for f in profile.frames] == [
+        ("proxy", foo_proxy.address, None),
+        ("checker", checker.address, 0),
+        ("target", foo_target.address, 0),
+    ]
+    assert profile.frames[0].contract == "ownership_proxy/proxy.vy"
+    assert profile.frames[1].contract == "tests/mocks/mock_checker.vy"
+
+
+def test_gas_adds_up(profile):
+    proxy_frame = profile.frames[0]
+    assert proxy_frame.gas_used == profile.gas_used
+    assert sum(f.self_gas for f in profile.frames) == profile.gas_used
+    assert sum(profile.gas_by_role().values()) == profile.gas_used
+    assert set(profile.gas_by_role()) == {"proxy", "checker", "target"}
+
+
+def test_storage_accesses(profile):
+    proxy_accesses = [a for a in profile.storage if a.frame == 0]
+    assert [(a.op, a.variable, a.cold) for a in proxy_accesses] == [
+        ("SLOAD", "delegations", True)
+    ]
+
+    keys = {
+        k["variable"]: k for k in profile.permission_keys() if k["role"] == "checker"
+    }
+    # lb and ub of the interval
+    assert keys["interval.intervals"]["key"] == FOO_INTERVAL
+    assert (
+        keys["interval.intervals"]["sloads"] == keys["interval.intervals"]["cold"] == 2
+    )
+    # the cooldown is read then reset
+    assert keys["cooldown.cooldowns_packed"]["key"] == FOO_COOLDOWN
+    assert keys["cooldown.cooldowns_packed"]["sstores"] == 1
+    assert keys["cooldown.cooldowns_packed"]["warm"] == 1
+
+    checker_frame = profile.frames[1]
+    assert (
+        checker_frame.sloads == len([a for a in profile.storage if a.op == "SLOAD"]) - 1
+    )
+    assert checker_frame.sstores == 1
+
+
+def test_nested_keys(profile):
+    (access,) = [
+        a for a in profile.storage if a.variable == "whitelist.whitelist_index"
+    ]
+    assert access.keys[1] == "0x" + WHITELISTED[2:].lower().rjust(64, "0")
+
+
+def test_lines(profile):
+    interval_lines = [
+        line for line in profile.lines if line.path.endswith("interval.vy")
+    ]
+    assert interval_lines
+    assert all(line.frame == 1 and line.function == "check" for line in interval_lines)
+    assert sum(line.gas for line in profile.lines) <= profile.gas_used
+
+
+def test_folded(profile):
+    stacks = [line.rsplit(" ", 1) for line in profile.folded().splitlines()]
+
+    assert sum(int(gas) for _, gas in stacks) == profile.gas_used
+    assert any(
+        stack.startswith(
+            "proxy ownership_proxy/proxy.vy;checker tests/mocks/mock_checker.vy;"
+        )
+        and "interval.vy" in stack
+        for stack, _ in stacks
+    )
+
+
+def test_json(profile):
+    report = json.loads(profile.to_json())
+
+    assert report["gas_used"] == profile.gas_used
+    assert report["calldata"] == "0x" + _foo(WHITELISTED, 150).hex()
+    assert report["gas_by_role"] == profile.gas_by_role()
+    assert len(report["frames"]) == 3
+
+
+def test_revert(foo_proxy, delegate):
+    # the cooldown set on deployment has not expired yet
+    profile = GasProfiler(foo_proxy.address).profile(delegate, _foo(WHITELISTED, 150))
+
+    assert not profile.success
+    assert profile.reason == "cooldown not expired"
+    assert not profile.frames[1].success
+
+
+def test_environment_untouched(foo_proxy, delegate):
+    profiler = GasProfiler(foo_proxy.address)
+    boa.env.time_travel(seconds=2 * DAY)
+
+    # the cooldown is only reset in the profiled call
+    assert profiler.profile(delegate, _foo(WHITELISTED, 150)).success
+    assert profiler.profile(delegate, _foo(WHITELISTED, 150)).success
@@ -0,0 +1,92 @@
+import boa
+
+from tests.utils.constants import ZERO_ADDRESS
+
+BATCH_SIZE = 5
+
+
+def _delegations(checker, n=BATCH_SIZE):
+    delegates = [boa.env.generate_address() for _ in range(n)]
+    metadatas = [(boa.env.timestamp + 1000 + i, checker.address, []) for i in range(n)]
+    return delegates, metadatas
+
+
+def test_set_delegations(proxy, dao, accept_all_checker):
+    delegates, metadatas = _delegations(accept_all_checker)
+
+    proxy.proxy__set_delegations(delegates, metadatas, sender=dao)
+    events = proxy.get_logs()
+
+    for delegate, metadata in zip(delegates, metadatas):
+        assert proxy.proxy__delegations(delegate) == metadata
+
+    assert len(events) == BATCH_SIZE
+    for event, delegate, (end_ts, checker, _) in zip(events, delegates, metadatas):
+        assert type(event).__name__ == "DelegationSet"
+        assert event.delegate == delegate
+        assert event.end_ts == end_ts
+        assert event.checker == checker
+
+
+def test_set_delegations_requires_dao_role(proxy, accept_all_checker):
+    delegates, metadatas = _delegations(accept_all_checker)
+
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__set_delegations(delegates, metadatas)
+
+
+def test_set_delegations_length_mismatch(proxy, dao, accept_all_checker):
+    delegates, metadatas = _delegations(accept_all_checker)
+
+    with boa.reverts("length mismatch"):
+        proxy.proxy__set_delegations(delegates, metadatas[:-1], sender=dao)
+
+
+def test_set_delegations_atomic(proxy, dao, accept_all_checker):
+    delegates, metadatas = _delegations(accept_all_checker)
+    delegates[-1] = ZERO_ADDRESS
+
+    with boa.reverts("empty delegate"):
+        proxy.proxy__set_delegations(delegates, metadatas, sender=dao)
+
+    assert proxy.proxy__delegations(delegates[0]) == (0, ZERO_ADDRESS, [])
+
+
+def test_kill_delegations(proxy, dao, accept_all_checker):
+    delegates, metadatas = _delegations(accept_all_checker)
+    proxy.proxy__set_delegations(delegates, metadatas, sender=dao)
+
+    proxy.proxy__kill_delegations(delegates[:-1], sender=dao)
+    events = proxy.get_logs()
+
+    for delegate in delegates[:-1]:
+        assert proxy.proxy__delegations(delegate) == (0, ZERO_ADDRESS, [])
+    assert proxy.proxy__delegations(delegates[-1]) == metadatas[-1]
+
+    assert [type(e).__name__ for e in events] == ["DelegationKilled"] * (BATCH_SIZE - 1)
+    assert [e.delegate for e in events] == delegates[:-1]
+
+
+def test_kill_delegations_requires_dao_role(proxy, accept_all_checker):
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__kill_delegations([boa.env.generate_address()])
+
+
+def test_emergency_kill_delegations(proxy, dao, accept_all_checker):
+    emergency_admin = boa.env.generate_address()
+    proxy.grantRole(proxy.proxy__EMERGENCY_ADMIN_ROLE(), emergency_admin, sender=dao)
+    delegates, metadatas = _delegations(accept_all_checker)
+    proxy.proxy__set_delegations(delegates, metadatas, sender=dao)
+
+    proxy.proxy__emergency_kill_delegations(delegates, sender=emergency_admin)
+
+    for delegate in delegates:
+        assert proxy.proxy__delegations(delegate) == (0, ZERO_ADDRESS, [])
+
+
+def test_emergency_kill_delegations_requires_emergency_admin_role(proxy, dao):
+    # the DAO does not hold the emergency admin role by default
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__emergency_kill_delegations(
+            [boa.env.generate_address()], sender=dao
+        )
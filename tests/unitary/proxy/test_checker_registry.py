@@ -0,0 +1,59 @@
+import boa
+
+from tests.utils.checkers import codehash
+from tests.utils.deployers import ACCEPT_ALL_CHECKER_DEPLOYER
+
+
+def test_set_checker_codehash(proxy, dao):
+    checker = ACCEPT_ALL_CHECKER_DEPLOYER.deploy()
+
+    proxy.proxy__set_checker_codehash(codehash(checker.address), True, sender=dao)
+    assert proxy.proxy__checker_codehashes(codehash(checker.address))
+
+    proxy.proxy__set_checker_codehash(codehash(checker.address), False, sender=dao)
+    assert not proxy.proxy__checker_codehashes(codehash(checker.address))
+
+
+def test_set_checker_codehash_requires_dao_role(proxy):
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__set_checker_codehash(b"\x01" * 32, True)
+
+
+def test_set_checker_codehash_invalid(proxy, dao):
+    with boa.reverts("invalid codehash"):
+        proxy.proxy__set_checker_codehash(b"\x00" * 32, True, sender=dao)
+
+    # accounts without code, i.e. EOAs
+    with boa.reverts("invalid codehash"):
+        proxy.proxy__set_checker_codehash(codehash(dao), True, sender=dao)
+
+
+def test_delegation_requires_approved_checker(proxy, dao):
+    checker = ACCEPT_ALL_CHECKER_DEPLOYER.deploy()
+    delegate = boa.env.generate_address()
+    metadata = (boa.env.timestamp + 1000, checker.address, [])
+
+    with boa.reverts("checker not approved"):
+        proxy.proxy__set_delegation(delegate, metadata, sender=dao)
+
+    proxy.proxy__set_checker_codehash(codehash(checker.address), True, sender=dao)
+    proxy.proxy__set_delegation(delegate, metadata, sender=dao)
+
+    # every deployment of the same code is approved at once
+    other = ACCEPT_ALL_CHECKER_DEPLOYER.deploy()
+    proxy.proxy__set_delegation(delegate, (metadata[0], other.address, []), sender=dao)
+
+
+def test_revoked_codehash_keeps_delegations(
+    proxy, proxy_as_dummy, dao, accept_all_checker
+):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+
+    proxy.proxy__set_checker_codehash(
+        codehash(accept_all_checker.address), False, sender=dao
+    )
+
+    assert proxy_as_dummy.some_func(sender=delegate) == 42
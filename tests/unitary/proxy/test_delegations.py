@@ -0,0 +1,47 @@
+import boa
+
+from tests.utils.constants import ZERO_ADDRESS
+
+MAX_END_TS = 2**64 - 1
+
+
+def test_delegations_roundtrip(proxy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+
+    proxy.proxy__set_delegation(
+        delegate, (end_ts, accept_all_checker.address, []), sender=dao
+    )
+
+    assert proxy.proxy__delegations(delegate) == (
+        end_ts,
+        accept_all_checker.address,
+        [],
+    )
+
+
+def test_delegations_max_end_ts(proxy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+
+    proxy.proxy__set_delegation(
+        delegate, (MAX_END_TS, accept_all_checker.address, []), sender=dao
+    )
+
+    assert proxy.proxy__delegations(delegate) == (
+        MAX_END_TS,
+        accept_all_checker.address,
+        [],
+    )
+
+
+def test_delegations_end_ts_too_large(proxy, dao, accept_all_checker):
+    with boa.reverts("end_ts too large"):
+        proxy.proxy__set_delegation(
+            boa.env.generate_address(),
+            (MAX_END_TS + 1, accept_all_checker.address, []),
+            sender=dao,
+        )
+
+
+def test_delegations_empty(proxy):
+    assert proxy.proxy__delegations(boa.env.generate_address()) == (0, ZERO_ADDRESS, [])
@@ -0,0 +1,183 @@
+import boa
+import pytest
+from eth_abi import decode
+from eth_account import Account
+
+from ownership_proxy.signing import sign_delegated_call
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+TUPLES = boa.eval('method_id("tuples()")')
+ONE_DAY = 86400
+
+
+@pytest.fixture
+def account():
+    return Account.create()
+
+
+@pytest.fixture
+def relayer():
+    return boa.env.generate_address("relayer")
+
+
+def _delegate(proxy, dao, account, checker, fast_selectors=()):
+    proxy.proxy__set_delegation(
+        account.address,
+        (boa.env.timestamp + ONE_DAY, checker.address, list(fast_selectors)),
+        sender=dao,
+    )
+
+
+def _sign(proxy, account, data, nonce=0, deadline=None):
+    if deadline is None:
+        deadline = boa.env.timestamp + 3600
+    chain_id = boa.env.evm.patch.chain_id
+    return sign_delegated_call(
+        account.key, proxy.address, chain_id, data, nonce, deadline
+    )
+
+
+def test_execute_signed(proxy, dao, account, relayer, accept_all_checker):
+    _delegate(proxy, dao, account, accept_all_checker)
+    signed = _sign(proxy, account, TUPLES, nonce=7)
+
+    result = proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+    (log,) = proxy.get_logs()
+    assert log.delegate == account.address and log.nonce == 7
+    assert decode(["uint256", "address"], result) == (69, proxy.address.lower())
+    assert proxy.proxy__nonce_bitmap(account.address, 0) == 1 << 7
+
+
+def test_nonces_any_order(proxy, dao, account, relayer, accept_all_checker):
+    _delegate(proxy, dao, account, accept_all_checker)
+    nonces = [300, 2, 255, 256]
+    signed = [_sign(proxy, account, SOME_FUNC, nonce=n) for n in nonces]
+
+    for s in reversed(signed):
+        proxy.proxy__execute_signed(*s.args(), sender=relayer)
+
+    assert proxy.proxy__nonce_bitmap(account.address, 0) == (1 << 2) | (1 << 255)
+    assert proxy.proxy__nonce_bitmap(account.address, 1) == (1 << 0) | (1 << 44)
+
+
+def test_replay(proxy, dao, account, relayer, accept_all_checker):
+    _delegate(proxy, dao, account, accept_all_checker)
+    signed = _sign(proxy, account, SOME_FUNC)
+    proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+    with boa.reverts("nonce already used"):
+        proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+
+def test_invalidate_nonces(proxy, dao, account, relayer, accept_all_checker):
+    _delegate(proxy, dao, account, accept_all_checker)
+    signed = _sign(proxy, account, SOME_FUNC, nonce=258)
+
+    proxy.proxy__invalidate_nonces(1, 1 << 2, sender=account.address)
+
+    with boa.reverts("nonce already used"):
+        proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+
+def test_expired_signature(proxy, dao, account, relayer, accept_all_checker):
+    _delegate(proxy, dao, account, accept_all_checker)
+    signed = _sign(proxy, account, SOME_FUNC, deadline=boa.env.timestamp + 10)
+    boa.env.time_travel(seconds=11)
+
+    with boa.reverts("signature expired"):
+        proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+
+def test_invalid_signature(proxy, dao, account, relayer, accept_all_checker):
+    _delegate(proxy, dao, account, accept_all_checker)
+    signed = _sign(proxy, account, SOME_FUNC)
+
+    # signed for another call
+    with boa.reverts("invalid signature"):
+        proxy.proxy__execute_signed(
+            signed.delegate,
+            TUPLES,
+            signed.nonce,
+            signed.deadline,
+            signed.signature,
+            sender=relayer,
+        )
+
+    # signed by someone else
+    other = _sign(proxy, Account.create(), SOME_FUNC)
+    with boa.reverts("invalid signature"):
+        proxy.proxy__execute_signed(
+            signed.delegate,
+            SOME_FUNC,
+            other.nonce,
+            other.deadline,
+            other.signature,
+            sender=relayer,
+        )
+
+    # signed for another proxy
+    elsewhere = sign_delegated_call(
+        account.key, dao, boa.env.evm.patch.chain_id, SOME_FUNC, 0, signed.deadline
+    )
+    with boa.reverts("invalid signature"):
+        proxy.proxy__execute_signed(*elsewhere.args(), sender=relayer)
+
+
+def test_not_a_delegate(proxy, dao, account, relayer, accept_all_checker):
+    signed = _sign(proxy, account, SOME_FUNC)
+
+    with boa.reverts("not a delegate"):
+        proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+    _delegate(proxy, dao, account, accept_all_checker)
+    boa.env.time_travel(seconds=ONE_DAY)
+    signed = _sign(proxy, account, SOME_FUNC)
+    with boa.reverts("not a delegate"):
+        proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+
+def test_dao_cannot_sign(proxy, dao, account, relayer):
+    # signed calls never fall back to the DAO role
+    proxy.grantRole(proxy.proxy__DAO_ROLE(), account.address, sender=dao)
+    signed = _sign(proxy, account, SOME_FUNC)
+
+    with boa.reverts("not a delegate"):
+        proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+
+def test_checked(proxy, dao, account, relayer, deny_all_checker):
+    _delegate(proxy, dao, account, deny_all_checker)
+    signed = _sign(proxy, account, SOME_FUNC)
+
+    with boa.reverts("denied"):
+        proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+    # the nonce is only used by calls that go through
+    assert proxy.proxy__nonce_bitmap(account.address, 0) == 0
+
+
+def test_fast_selector(proxy, dao, account, relayer, deny_all_checker):
+    _delegate(proxy, dao, account, deny_all_checker, [SOME_FUNC])
+    signed = _sign(proxy, account, SOME_FUNC)
+
+    result = proxy.proxy__execute_signed(*signed.args(), sender=relayer)
+
+    assert decode(["uint256"], result) == (42,)
+
+
+def test_selector_delegation(proxy, dao, account, relayer, accept_all_checker):
+    proxy.proxy__set_selector_delegations(
+        account.address,
+        [(SOME_FUNC, boa.env.timestamp + ONE_DAY, accept_all_checker.address)],
+        sender=dao,
+    )
+
+    proxy.proxy__execute_signed(
+        *_sign(proxy, account, SOME_FUNC).args(), sender=relayer
+    )
+
+    with boa.reverts("not a delegate"):
+        proxy.proxy__execute_signed(
+            *_sign(proxy, account, TUPLES, 1).args(), sender=relayer
+        )
@@ -0,0 +1,96 @@
+import boa
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+TUPLES = boa.eval('method_id("tuples()")')
+SOMETHING_FANCIER = boa.eval('method_id("something_fancier(address)")')
+
+
+def test_fast_selector_skips_checker(proxy, proxy_as_dummy, dao, deny_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + 1000, deny_all_checker.address, [SOME_FUNC]),
+        sender=dao,
+    )
+
+    assert proxy_as_dummy.some_func(sender=delegate) == 42
+
+
+def test_other_selectors_go_through_checker(
+    proxy, proxy_as_dummy, dao, deny_all_checker
+):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + 1000, deny_all_checker.address, [SOME_FUNC]),
+        sender=dao,
+    )
+
+    with boa.reverts("denied"):
+        proxy_as_dummy.tuples(sender=delegate)
+
+
+def test_fast_selector_expired(proxy, proxy_as_dummy, dao, deny_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + 1000, deny_all_checker.address, [SOME_FUNC]),
+        sender=dao,
+    )
+    boa.env.time_travel(seconds=1000)
+
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.some_func(sender=delegate)
+
+
+def test_fast_selectors_roundtrip(proxy, dao, deny_all_checker):
+    delegate = boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+    selectors = [SOME_FUNC, TUPLES, SOMETHING_FANCIER, b"\x00" * 4, b"\xff" * 4] + [
+        bytes([i] * 4) for i in range(1, 4)
+    ]
+
+    proxy.proxy__set_delegation(
+        delegate, (end_ts, deny_all_checker.address, selectors), sender=dao
+    )
+
+    assert proxy.proxy__delegations(delegate) == (
+        end_ts,
+        deny_all_checker.address,
+        selectors,
+    )
+
+
+def test_fast_selectors_overwritten(proxy, proxy_as_dummy, dao, deny_all_checker):
+    delegate = boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+    proxy.proxy__set_delegation(
+        delegate, (end_ts, deny_all_checker.address, [SOME_FUNC, TUPLES]), sender=dao
+    )
+
+    proxy.proxy__set_delegation(
+        delegate, (end_ts, deny_all_checker.address, [TUPLES]), sender=dao
+    )
+
+    assert proxy.proxy__delegations(delegate) == (
+        end_ts,
+        deny_all_checker.address,
+        [TUPLES],
+    )
+    with boa.reverts("denied"):
+        proxy_as_dummy.some_func(sender=delegate)
+
+
+def test_fast_selectors_cleared_on_kill(proxy, proxy_as_dummy, dao, deny_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + 1000, deny_all_checker.address, [SOME_FUNC]),
+        sender=dao,
+    )
+
+    proxy.proxy__kill_delegation(delegate, sender=dao)
+
+    assert proxy.proxy__delegations(delegate)[2] == []
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.some_func(sender=delegate)
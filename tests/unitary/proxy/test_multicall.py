@@ -0,0 +1,68 @@
+import boa
+from eth_abi import decode
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+TUPLES = boa.eval('method_id("tuples()")')
+
+
+def test_multicall_dao(proxy, dao):
+    results = proxy.proxy__multicall([SOME_FUNC, TUPLES], sender=dao)
+
+    assert decode(["uint256"], results[0]) == (42,)
+    assert decode(["uint256", "address"], results[1]) == (69, proxy.address.lower())
+
+
+def test_multicall_delegate(proxy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+
+    results = proxy.proxy__multicall([SOME_FUNC] * 3, sender=delegate)
+
+    assert [decode(["uint256"], r) for r in results] == [(42,)] * 3
+
+
+def test_multicall_delegate_checked(proxy, dao, deny_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, deny_all_checker.address, []), sender=dao
+    )
+
+    with boa.reverts("denied"):
+        proxy.proxy__multicall([SOME_FUNC], sender=delegate)
+
+
+def test_multicall_delegate_fast_selectors(proxy, dao, deny_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + 1000, deny_all_checker.address, [SOME_FUNC]),
+        sender=dao,
+    )
+
+    results = proxy.proxy__multicall([SOME_FUNC, SOME_FUNC], sender=delegate)
+    assert len(results) == 2
+
+    with boa.reverts("denied"):
+        proxy.proxy__multicall([SOME_FUNC, TUPLES], sender=delegate)
+
+
+def test_multicall_expired_delegation(proxy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, accept_all_checker.address, []), sender=dao
+    )
+    boa.env.time_travel(seconds=1000)
+
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__multicall([SOME_FUNC], sender=delegate)
+
+
+def test_multicall_unauthorized(proxy):
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__multicall([SOME_FUNC])
+
+
+def test_multicall_empty(proxy, dao):
+    assert proxy.proxy__multicall([], sender=dao) == []
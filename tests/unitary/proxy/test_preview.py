@@ -0,0 +1,135 @@
+import boa
+import pytest
+
+from tests.utils.checkers import approve_checker
+from tests.utils.deployers import MOCK_CHECKER_DEPLOYER
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+TUPLES = boa.eval('method_id("tuples()")')
+MISSING_ROLE = "access_control: account is missing role"
+ONE_DAY = 86400
+
+
+@pytest.fixture
+def delegate():
+    return boa.env.generate_address()
+
+
+def _delegate(proxy, dao, delegate, checker, fast_selectors=()):
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + ONE_DAY, checker.address, list(fast_selectors)),
+        sender=dao,
+    )
+
+
+def test_preview_allowed(proxy, dao, delegate, accept_all_checker):
+    _delegate(proxy, dao, delegate, accept_all_checker)
+
+    allowed, reason, checker_gas = proxy.proxy__preview(delegate, SOME_FUNC)
+
+    assert (allowed, reason) == (True, "")
+    assert checker_gas > 0
+
+
+def test_preview_denied(proxy, dao, delegate, deny_all_checker):
+    _delegate(proxy, dao, delegate, deny_all_checker)
+
+    allowed, reason, checker_gas = proxy.proxy__preview(delegate, SOME_FUNC)
+
+    assert (allowed, reason) == (False, "denied")
+    assert checker_gas > 0
+
+
+def test_preview_fast_selector(proxy, dao, delegate, deny_all_checker):
+    _delegate(proxy, dao, delegate, deny_all_checker, [SOME_FUNC])
+
+    assert proxy.proxy__preview(delegate, SOME_FUNC) == (True, "", 0)
+    assert proxy.proxy__preview(delegate, TUPLES)[:2] == (False, "denied")
+
+
+def test_preview_no_delegation(proxy, dao, delegate, accept_all_checker):
+    assert proxy.proxy__preview(delegate, SOME_FUNC) == (False, MISSING_ROLE, 0)
+
+    # expired delegations fall back to the DAO role, like forwarded calls
+    _delegate(proxy, dao, delegate, accept_all_checker)
+    boa.env.time_travel(seconds=ONE_DAY)
+    assert proxy.proxy__preview(delegate, SOME_FUNC) == (False, MISSING_ROLE, 0)
+
+    assert proxy.proxy__preview(dao, SOME_FUNC) == (True, "", 0)
+
+
+def test_preview_selector_delegation(proxy, dao, delegate, accept_all_checker):
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [(SOME_FUNC, boa.env.timestamp + ONE_DAY, accept_all_checker.address)],
+        sender=dao,
+    )
+
+    assert proxy.proxy__preview(delegate, SOME_FUNC)[:2] == (True, "")
+    assert proxy.proxy__preview(delegate, TUPLES) == (False, MISSING_ROLE, 0)
+    assert proxy.proxy__preview(delegate, b"") == (False, MISSING_ROLE, 0)
+
+
+def test_preview_stateful_checker(proxy, dao, delegate):
+    checker = MOCK_CHECKER_DEPLOYER.deploy()
+    approve_checker(proxy, checker, dao)
+    _delegate(proxy, dao, delegate, checker)
+    calldata = checker.foo.prepare_calldata(
+        "0x1234567890123456789012345678901234567890", 150
+    )
+
+    assert proxy.proxy__preview(delegate, calldata)[:2] == (
+        False,
+        "cooldown not expired",
+    )
+
+    boa.env.time_travel(seconds=2 * ONE_DAY)
+    _delegate(proxy, dao, delegate, checker)
+    # the cooldown reset of the checker is undone, previews can be repeated
+    for _ in range(2):
+        assert proxy.proxy__preview(delegate, calldata)[:2] == (True, "")
+
+    out_of_interval = checker.foo.prepare_calldata(
+        "0x1234567890123456789012345678901234567890", 1000
+    )
+    assert proxy.proxy__preview(delegate, out_of_interval)[:2] == (
+        False,
+        "value out of interval",
+    )
+
+
+def test_preview_and_revert_only_self(proxy, delegate):
+    with boa.reverts("only self"):
+        proxy.proxy__preview_and_revert(delegate, SOME_FUNC)
+
+
+def test_preview_long_reason(proxy, dao, delegate):
+    reason = "x" * 200
+    checker = boa.loads(f"""
+# pragma version 0.4.3
+
+@external
+def __default__():
+    raise "{reason}"
+""")
+    approve_checker(proxy, checker, dao)
+    _delegate(proxy, dao, delegate, checker)
+
+    assert proxy.proxy__preview(delegate, SOME_FUNC)[:2] == (False, reason[:128])
+
+
+def test_preview_inner_out_of_gas(proxy, dao, delegate):
+    checker = boa.loads("""
+# pragma version 0.4.3
+
+@external
+def __default__():
+    # burns all the gas it is given
+    assert msg.sender == empty(address), UNREACHABLE
+""")
+    approve_checker(proxy, checker, dao)
+    _delegate(proxy, dao, delegate, checker)
+
+    # the self call runs out of gas with the checker and reverts without data
+    assert proxy.proxy__preview(delegate, SOME_FUNC, gas=30_000) == (False, "", 0)
@@ -0,0 +1,56 @@
+import boa
+
+from tests.utils.checkers import approve_checker
+from tests.utils.deployers import (
+    BUDGET_CHECKER_DEPLOYER,
+    PROXY_DEPLOYER,
+    REENTRANT_TARGET_DEPLOYER,
+)
+from tests.utils.transactions import end_transaction
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+REENTER = boa.eval('method_id("reenter()")')
+
+
+def test_default_is_nonreentrant(dao):
+    target = REENTRANT_TARGET_DEPLOYER.deploy()
+    proxy = PROXY_DEPLOYER.deploy(target.address, dao, False)
+    # the target could otherwise call back as the DAO
+    proxy.grantRole(proxy.proxy__DAO_ROLE(), target.address, sender=dao)
+
+    proxy_as_target = target.at(proxy.address)
+
+    assert proxy_as_target.some_func(sender=dao) == 42
+    with boa.reverts():
+        proxy_as_target.reenter(sender=dao)
+
+
+def test_multicall_is_nonreentrant(dao):
+    target = REENTRANT_TARGET_DEPLOYER.deploy()
+    proxy = PROXY_DEPLOYER.deploy(target.address, dao, False)
+    proxy.grantRole(proxy.proxy__DAO_ROLE(), target.address, sender=dao)
+
+    with boa.reverts():
+        proxy.proxy__multicall([REENTER], sender=dao)
+
+
+def test_transaction_budget_across_multicall(proxy, dao):
+    delegate = boa.env.generate_address()
+    checker = BUDGET_CHECKER_DEPLOYER.deploy(3)
+    approve_checker(proxy, checker, dao)
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 1000, checker.address, []), sender=dao
+    )
+    end_transaction()
+
+    proxy.proxy__multicall([SOME_FUNC] * 3, sender=delegate)
+    end_transaction()
+
+    with boa.reverts("budget exceeded"):
+        proxy.proxy__multicall([SOME_FUNC] * 4, sender=delegate)
+    end_transaction()
+
+    # the budget is per transaction, not per multicall
+    proxy.proxy__multicall([SOME_FUNC] * 2, sender=delegate)
+    with boa.reverts("budget exceeded"):
+        proxy.proxy__multicall([SOME_FUNC] * 2, sender=delegate)
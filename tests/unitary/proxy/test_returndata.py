@@ -0,0 +1,108 @@
+import boa
+import pytest
+from eth_abi import decode
+from eth_account import Account
+
+from ownership_proxy.signing import sign_delegated_call
+from tests.utils.checkers import approve_checker
+from tests.utils.deployers import (
+    ACCEPT_ALL_CHECKER_DEPLOYER,
+    PROXY_DEPLOYER,
+    RETURNDATA_TARGET_DEPLOYER,
+)
+
+MAX_OUTSIZE = 32 * 128
+MAX_LARGE_OUTSIZE = 32 * 10000
+MAX_MULTICALL_OUTSIZE = 32 * 32
+
+
+def _words(size):
+    """Number of words returned by `words` for `size` bytes of return data."""
+    return (size - 64) // 32
+
+
+@pytest.fixture(scope="module")
+def target():
+    return RETURNDATA_TARGET_DEPLOYER.deploy()
+
+
+@pytest.fixture(scope="module")
+def proxy_as_target(target, dao):
+    proxy = PROXY_DEPLOYER.deploy(target.address, dao, False)
+    return target.at(proxy.address)
+
+
+@pytest.fixture(scope="module")
+def large_proxy_as_target(target, dao):
+    proxy = PROXY_DEPLOYER.deploy(target.address, dao, True)
+    return target.at(proxy.address)
+
+
+@pytest.mark.parametrize("size", [64, 1024, MAX_OUTSIZE])
+def test_returndata(proxy_as_target, dao, size):
+    n = _words(size)
+    assert proxy_as_target.words(n, sender=dao) == list(range(n))
+
+
+def test_returndata_too_large(proxy_as_target, dao):
+    with boa.reverts("return data too large"):
+        proxy_as_target.words(_words(MAX_OUTSIZE) + 1, sender=dao)
+
+
+@pytest.mark.parametrize("size", [64, MAX_OUTSIZE + 32, 32 * 1000])
+def test_large_returndata(large_proxy_as_target, dao, size):
+    n = _words(size)
+    assert large_proxy_as_target.words(n, sender=dao) == list(range(n))
+
+
+def test_large_returndata_flag(proxy_as_target, large_proxy_as_target):
+    proxy = PROXY_DEPLOYER.at(proxy_as_target.address)
+    large_proxy = PROXY_DEPLOYER.at(large_proxy_as_target.address)
+
+    assert not proxy.proxy__large_returndata()
+    assert large_proxy.proxy__large_returndata()
+
+
+def test_multicall_returndata(proxy_as_target, dao):
+    proxy = PROXY_DEPLOYER.at(proxy_as_target.address)
+    call = proxy_as_target.words.prepare_calldata(_words(MAX_MULTICALL_OUTSIZE))
+
+    (result,) = proxy.proxy__multicall([call], sender=dao)
+    assert len(result) == MAX_MULTICALL_OUTSIZE
+
+
+def test_multicall_returndata_too_large(proxy_as_target, dao):
+    proxy = PROXY_DEPLOYER.at(proxy_as_target.address)
+    call = proxy_as_target.words.prepare_calldata(_words(MAX_MULTICALL_OUTSIZE) + 1)
+
+    with boa.reverts("return data too large"):
+        proxy.proxy__multicall([call], sender=dao)
+
+
+def _execute_signed(proxy_as_target, dao, n):
+    proxy = PROXY_DEPLOYER.at(proxy_as_target.address)
+    account = Account.create()
+    checker = ACCEPT_ALL_CHECKER_DEPLOYER.deploy()
+    approve_checker(proxy, checker, dao)
+    proxy.proxy__set_delegation(
+        account.address, (boa.env.timestamp + 1000, checker.address, []), sender=dao
+    )
+
+    chain_id = boa.env.evm.patch.chain_id
+    data = proxy_as_target.words.prepare_calldata(n)
+    signed = sign_delegated_call(
+        account.key, proxy.address, chain_id, data, 0, boa.env.timestamp + 1000
+    )
+    return proxy.proxy__execute_signed(*signed.args())
+
+
+def test_execute_signed_returndata_too_large(proxy_as_target, dao):
+    with boa.reverts("return data too large"):
+        _execute_signed(proxy_as_target, dao, _words(MAX_OUTSIZE) + 1)
+
+
+def test_execute_signed_large_returndata(large_proxy_as_target, dao):
+    n = _words(MAX_OUTSIZE) + 1
+
+    result = _execute_signed(large_proxy_as_target, dao, n)
+    assert list(decode(["uint256[]"], result)[0]) == list(range(n))
@@ -0,0 +1,192 @@
+import boa
+
+from tests.utils.constants import ZERO_ADDRESS
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+TUPLES = boa.eval('method_id("tuples()")')
+SOMETHING_FANCIER = boa.eval('method_id("something_fancier(address)")')
+
+
+def test_selector_delegations_roundtrip(
+    proxy, dao, accept_all_checker, deny_all_checker
+):
+    delegate = boa.env.generate_address()
+    delegations = [
+        (SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address),
+        (TUPLES, boa.env.timestamp + 2000, deny_all_checker.address),
+    ]
+
+    proxy.proxy__set_selector_delegations(delegate, delegations, sender=dao)
+
+    assert proxy.proxy__selector_delegations(delegate) == delegations
+    assert proxy.proxy__delegations(delegate) == (0, ZERO_ADDRESS, [])
+
+
+def test_selector_routed_to_its_checker(
+    proxy, proxy_as_dummy, dao, accept_all_checker, deny_all_checker
+):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [
+            (SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address),
+            (TUPLES, boa.env.timestamp + 1000, deny_all_checker.address),
+        ],
+        sender=dao,
+    )
+
+    assert proxy_as_dummy.some_func(sender=delegate) == 42
+    with boa.reverts("denied"):
+        proxy_as_dummy.tuples(sender=delegate)
+
+
+def test_unlisted_selector_rejected(proxy, proxy_as_dummy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [(SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address)],
+        sender=dao,
+    )
+
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.tuples(sender=delegate)
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.something_fancier(delegate, sender=delegate)
+
+
+def test_selector_delegations_expire_independently(
+    proxy, proxy_as_dummy, dao, accept_all_checker
+):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [
+            (SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address),
+            (TUPLES, boa.env.timestamp + 2000, accept_all_checker.address),
+        ],
+        sender=dao,
+    )
+
+    boa.env.time_travel(seconds=1500)
+
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.some_func(sender=delegate)
+    assert proxy_as_dummy.tuples(sender=delegate) == (69, proxy.address)
+
+
+def test_selector_delegations_multicall(
+    proxy, dao, accept_all_checker, deny_all_checker
+):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [
+            (SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address),
+            (TUPLES, boa.env.timestamp + 1000, deny_all_checker.address),
+        ],
+        sender=dao,
+    )
+
+    assert len(proxy.proxy__multicall([SOME_FUNC, SOME_FUNC], sender=delegate)) == 2
+    with boa.reverts("denied"):
+        proxy.proxy__multicall([SOME_FUNC, TUPLES], sender=delegate)
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__multicall([SOME_FUNC, SOMETHING_FANCIER], sender=delegate)
+
+
+def test_selector_delegations_replaced(proxy, proxy_as_dummy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+    proxy.proxy__set_selector_delegations(
+        delegate, [(SOME_FUNC, end_ts, accept_all_checker.address)], sender=dao
+    )
+
+    proxy.proxy__set_selector_delegations(
+        delegate, [(TUPLES, end_ts, accept_all_checker.address)], sender=dao
+    )
+
+    assert proxy.proxy__selector_delegations(delegate) == [
+        (TUPLES, end_ts, accept_all_checker.address)
+    ]
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.some_func(sender=delegate)
+
+
+def test_delegation_replaces_selector_delegations(
+    proxy, proxy_as_dummy, dao, accept_all_checker, deny_all_checker
+):
+    delegate = boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+    proxy.proxy__set_selector_delegations(
+        delegate, [(SOME_FUNC, end_ts, accept_all_checker.address)], sender=dao
+    )
+
+    proxy.proxy__set_delegation(
+        delegate, (end_ts, deny_all_checker.address, []), sender=dao
+    )
+    assert proxy.proxy__selector_delegations(delegate) == []
+    with boa.reverts("denied"):
+        proxy_as_dummy.some_func(sender=delegate)
+
+    # stale selector delegations don't come back with selector mode
+    proxy.proxy__set_selector_delegations(
+        delegate, [(TUPLES, end_ts, accept_all_checker.address)], sender=dao
+    )
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.some_func(sender=delegate)
+
+
+def test_kill_selector_delegations(proxy, proxy_as_dummy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [(SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address)],
+        sender=dao,
+    )
+
+    proxy.proxy__kill_delegation(delegate, sender=dao)
+
+    assert proxy.proxy__selector_delegations(delegate) == []
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.some_func(sender=delegate)
+
+
+def test_set_selector_delegations_requires_dao_role(proxy, accept_all_checker):
+    with boa.reverts("access_control: account is missing role"):
+        proxy.proxy__set_selector_delegations(
+            boa.env.generate_address(),
+            [(SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address)],
+        )
+
+
+def test_set_selector_delegations_invalid(
+    proxy, dao, accept_all_checker, deny_all_checker
+):
+    delegate = boa.env.generate_address()
+    end_ts = boa.env.timestamp + 1000
+
+    with boa.reverts("no selector delegations"):
+        proxy.proxy__set_selector_delegations(delegate, [], sender=dao)
+    with boa.reverts("empty delegate"):
+        proxy.proxy__set_selector_delegations(
+            ZERO_ADDRESS, [(SOME_FUNC, end_ts, accept_all_checker.address)], sender=dao
+        )
+    with boa.reverts("duplicate selector"):
+        proxy.proxy__set_selector_delegations(
+            delegate,
+            [
+                (SOME_FUNC, end_ts, accept_all_checker.address),
+                (SOME_FUNC, end_ts, deny_all_checker.address),
+            ],
+            sender=dao,
+        )
+    with boa.reverts("invalid delegation duration"):
+        proxy.proxy__set_selector_delegations(
+            delegate,
+            [(SOME_FUNC, boa.env.timestamp, accept_all_checker.address)],
+            sender=dao,
+        )
+    with boa.reverts("checker not approved"):
+        proxy.proxy__set_selector_delegations(
+            delegate, [(SOME_FUNC, end_ts, proxy.address)], sender=dao
+        )
@@ -0,0 +1,152 @@
+import boa
+
+from tests.utils.constants import ZERO_ADDRESS
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+TUPLES = boa.eval('method_id("tuples()")')
+
+
+def _delegate(proxy, dao, checker, duration=1000, fast_selectors=()):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate,
+        (boa.env.timestamp + duration, checker.address, list(fast_selectors)),
+        sender=dao,
+    )
+    return delegate
+
+
+def _delegates(proxy):
+    return proxy.proxy__delegates(0, 100)
+
+
+def test_delegates_indexed_once(proxy, dao, accept_all_checker):
+    first = _delegate(proxy, dao, accept_all_checker)
+    second = _delegate(proxy, dao, accept_all_checker)
+    proxy.proxy__set_delegation(
+        first, (boa.env.timestamp + 2000, accept_all_checker.address, []), sender=dao
+    )
+    proxy.proxy__set_selector_delegations(
+        second,
+        [(SOME_FUNC, boa.env.timestamp + 1000, accept_all_checker.address)],
+        sender=dao,
+    )
+
+    assert proxy.proxy__delegate_count() == 2
+    assert _delegates(proxy) == [first, second]
+
+
+def test_index_does_not_leak_into_metadata(proxy, dao, accept_all_checker):
+    _delegate(proxy, dao, accept_all_checker)
+    delegate = _delegate(proxy, dao, accept_all_checker, fast_selectors=[SOME_FUNC])
+
+    assert proxy.proxy__delegations(delegate) == (
+        boa.env.timestamp + 1000,
+        accept_all_checker.address,
+        [SOME_FUNC],
+    )
+
+
+def test_kill_swaps_last_delegate(proxy, dao, accept_all_checker):
+    first, second, third = [_delegate(proxy, dao, accept_all_checker) for _ in range(3)]
+
+    proxy.proxy__kill_delegation(first, sender=dao)
+    assert _delegates(proxy) == [third, second]
+
+    # the moved delegate's position was updated
+    proxy.proxy__kill_delegation(third, sender=dao)
+    assert _delegates(proxy) == [second]
+
+    proxy.proxy__kill_delegation(second, sender=dao)
+    assert proxy.proxy__delegate_count() == 0
+
+    # killing a delegate without delegation leaves the index alone
+    proxy.proxy__kill_delegation(first, sender=dao)
+    assert proxy.proxy__delegate_count() == 0
+
+
+def test_delegates_paging(proxy, dao, accept_all_checker):
+    delegates = [_delegate(proxy, dao, accept_all_checker) for _ in range(5)]
+
+    assert proxy.proxy__delegates(1, 3) == delegates[1:4]
+    assert proxy.proxy__delegates(3, 10) == delegates[3:]
+    assert proxy.proxy__delegates(5, 10) == []
+
+
+def test_sweep_expired(proxy, dao, accept_all_checker):
+    expired = [
+        _delegate(proxy, dao, accept_all_checker, duration=100) for _ in range(2)
+    ]
+    active = _delegate(proxy, dao, accept_all_checker, duration=1000)
+    boa.env.time_travel(seconds=100)
+
+    assert proxy.proxy__expired_delegates(0, 100) == expired
+
+    # anyone can sweep, active and unknown delegates are skipped
+    unknown = boa.env.generate_address()
+    swept = proxy.proxy__sweep_expired(
+        [expired[0], active, unknown, expired[1]], sender=boa.env.generate_address()
+    )
+
+    assert swept == 2
+    assert [e.delegate for e in proxy.get_logs()] == expired
+    assert _delegates(proxy) == [active]
+    assert proxy.proxy__delegations(expired[0]) == (0, ZERO_ADDRESS, [])
+    assert proxy.proxy__expired_delegates(0, 100) == []
+
+
+def test_swept_delegate_falls_back_to_dao_check(
+    proxy, proxy_as_dummy, dao, accept_all_checker
+):
+    delegate = _delegate(proxy, dao, accept_all_checker, duration=100)
+    boa.env.time_travel(seconds=100)
+    proxy.proxy__sweep_expired([delegate])
+
+    with boa.reverts("access_control: account is missing role"):
+        proxy_as_dummy.some_func(sender=delegate)
+
+
+def test_sweep_twice(proxy, dao, accept_all_checker):
+    delegate = _delegate(proxy, dao, accept_all_checker, duration=100)
+    boa.env.time_travel(seconds=100)
+
+    assert proxy.proxy__sweep_expired([delegate, delegate]) == 1
+    assert proxy.proxy__sweep_expired([delegate]) == 0
+
+
+def test_sweep_fast_selectors(proxy, dao, accept_all_checker):
+    delegate = _delegate(
+        proxy, dao, accept_all_checker, duration=100, fast_selectors=[SOME_FUNC]
+    )
+    boa.env.time_travel(seconds=100)
+
+    proxy.proxy__sweep_expired([delegate])
+
+    # a new delegation doesn't inherit the swept fast selectors
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 100, accept_all_checker.address, []), sender=dao
+    )
+    assert proxy.proxy__delegations(delegate)[2] == []
+
+
+def test_sweep_selector_mode(proxy, dao, accept_all_checker):
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_selector_delegations(
+        delegate,
+        [
+            (SOME_FUNC, boa.env.timestamp + 100, accept_all_checker.address),
+            (TUPLES, boa.env.timestamp + 200, accept_all_checker.address),
+        ],
+        sender=dao,
+    )
+
+    # expired once all its selectors are
+    boa.env.time_travel(seconds=100)
+    assert proxy.proxy__expired_delegates(0, 100) == []
+    assert proxy.proxy__sweep_expired([delegate]) == 0
+
+    boa.env.time_travel(seconds=100)
+    assert proxy.proxy__expired_delegates(0, 100) == [delegate]
+    assert proxy.proxy__sweep_expired([delegate]) == 1
+    assert proxy.proxy__selector_delegations(delegate) == []
+    assert proxy.proxy__delegate_count() == 0
@@ -0,0 +1,51 @@
+import boa
+import pytest
+from eth_account import Account
+
+from ownership_proxy.signing import (
+    digest,
+    domain_separator,
+    nonce_masks,
+    sign_delegated_call,
+    unused_nonces,
+)
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+
+
+def test_domain_separator(proxy):
+    chain_id = boa.env.evm.patch.chain_id
+
+    assert domain_separator(proxy.address, chain_id) == proxy.proxy__domain_separator()
+
+
+def test_digest_matches_signature():
+    account = Account.create()
+    proxy_address = boa.env.generate_address()
+
+    signed = sign_delegated_call(account.key, proxy_address, 1, SOME_FUNC, 3, 1000)
+
+    # eth_account hashes the typed data on its own, signatures are deterministic
+    h = digest(proxy_address, 1, account.address, SOME_FUNC, 3, 1000)
+    assert Account.unsafe_sign_hash(h, account.key).signature == signed.signature
+    assert signed.args() == (account.address, SOME_FUNC, 3, 1000, signed.signature)
+
+
+def test_calldata_too_large():
+    with pytest.raises(ValueError, match="calldata too large"):
+        sign_delegated_call(
+            Account.create().key, boa.env.generate_address(), 1, b"\x00" * 1025, 0, 0
+        )
+
+
+def test_nonce_masks():
+    assert nonce_masks([0, 3, 256, 511, 3]) == {0: 0b1001, 1: 1 | (1 << 255)}
+
+
+def test_unused_nonces(proxy):
+    account = Account.create()
+    proxy.proxy__invalidate_nonces(0, 2**256 - 1 - 0b100, sender=account.address)
+    proxy.proxy__invalidate_nonces(1, 0b1, sender=account.address)
+
+    assert unused_nonces(proxy, account.address, 3) == [2, 257, 258]
+    assert unused_nonces(proxy, account.address, 2, word=5) == [1280, 1281]
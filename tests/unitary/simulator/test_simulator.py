@@ -0,0 +1,162 @@
+import boa
+import pytest
+
+from ownership_proxy.simulator import (
+    DelegationSimulator,
+    decode_revert_reason,
+    intrinsic_gas,
+)
+from tests.utils.checkers import approve_checker
+from tests.utils.deployers import (
+    BUDGET_CHECKER_DEPLOYER,
+    MOCK_CHECKER_DEPLOYER,
+    PROXY_DEPLOYER,
+)
+
+SOME_FUNC = boa.eval('method_id("some_func()")')
+FOO = boa.eval('method_id("foo(address,uint256)")')
+WHITELISTED = "0x1234567890123456789012345678901234567890"
+DAY = 86400
+
+
+@pytest.fixture(scope="module")
+def foo_target():
+    return boa.loads("""
+# pragma version 0.4.3
+
+@external
+def foo(addy: address, amount: uint256) -> uint256:
+    return amount
+""")
+
+
+@pytest.fixture(scope="module")
+def foo_proxy(foo_target, dao):
+    return PROXY_DEPLOYER.deploy(foo_target.address, dao, False)
+
+
+@pytest.fixture
+def delegate(foo_proxy, dao):
+    delegate = boa.env.generate_address()
+    checker = MOCK_CHECKER_DEPLOYER.deploy()
+    approve_checker(foo_proxy, checker, dao)
+    foo_proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + 30 * DAY, checker.address, []), sender=dao
+    )
+    return delegate
+
+
+def _foo(addy, amount):
+    return FOO + boa.util.abi.abi_encode("(address,uint256)", (addy, amount))
+
+
+def test_simulate_success(foo_proxy, delegate):
+    simulator = DelegationSimulator(foo_proxy.address)
+    boa.env.time_travel(seconds=2 * DAY)
+
+    result = simulator.simulate(delegate, _foo(WHITELISTED, 150))
+
+    assert result.success
+    assert result.reason is None
+    assert int.from_bytes(result.output, "big") == 150
+    assert result.gas_used > intrinsic_gas(_foo(WHITELISTED, 150))
+
+
+def test_simulate_checker_revert(foo_proxy, delegate):
+    simulator = DelegationSimulator(foo_proxy.address)
+
+    # the cooldown set on deployment has not expired yet
+    result = simulator.simulate(delegate, _foo(WHITELISTED, 150))
+
+    assert not result.success
+    assert result.reason == "cooldown not expired"
+
+
+def test_simulate_at_timestamp(foo_proxy, delegate):
+    simulator = DelegationSimulator(foo_proxy.address)
+
+    result = simulator.simulate(
+        delegate, _foo(WHITELISTED, 150), boa.env.timestamp + 2 * DAY
+    )
+
+    assert result.success
+
+
+def test_simulate_expired_delegation(foo_proxy, delegate):
+    simulator = DelegationSimulator(foo_proxy.address)
+
+    result = simulator.simulate(
+        delegate, _foo(WHITELISTED, 150), boa.env.timestamp + 31 * DAY
+    )
+
+    assert result.reason == "access_control: account is missing role"
+
+
+def test_simulate_leaves_state_untouched(foo_proxy, delegate):
+    simulator = DelegationSimulator(foo_proxy.address)
+    timestamp = boa.env.timestamp
+
+    simulator.simulate(delegate, _foo(WHITELISTED, 150), timestamp + 2 * DAY)
+
+    assert boa.env.timestamp == timestamp
+    boa.env.time_travel(seconds=2 * DAY)
+    # the cooldown was not reset by the simulation
+    assert simulator.simulate(delegate, _foo(WHITELISTED, 150)).success
+
+
+def test_simulate_batch(foo_proxy, delegate):
+    simulator = DelegationSimulator(foo_proxy.address)
+    calls = [
+        _foo(WHITELISTED, 150),
+        _foo(WHITELISTED, 50),
+        _foo(boa.env.generate_address(), 150),
+        SOME_FUNC,
+    ]
+
+    results = simulator.simulate_batch(delegate, calls, boa.env.timestamp + 2 * DAY)
+
+    assert [r.success for r in results] == [True, False, False, False]
+    assert [r.reason for r in results[1:3]] == [
+        "value out of interval",
+        "address not whitelisted",
+    ]
+    # functions not mirrored by the checker revert without data
+    assert results[3].reason is None
+
+
+def test_simulate_batch_sequential(foo_proxy, delegate):
+    simulator = DelegationSimulator(foo_proxy.address)
+    calls = [_foo(WHITELISTED, 150)] * 2
+
+    independent = simulator.simulate_batch(delegate, calls, boa.env.timestamp + 2 * DAY)
+    sequential = simulator.simulate_batch(
+        delegate, calls, boa.env.timestamp + 2 * DAY, sequential=True
+    )
+
+    assert [r.success for r in independent] == [True, True]
+    assert [r.success for r in sequential] == [True, False]
+    assert sequential[1].reason == "cooldown not expired"
+
+
+def test_simulate_batch_sequential_transient_storage(proxy, dao):
+    # budgets are per transaction, a sequential batch is a batch of transactions
+    checker = BUDGET_CHECKER_DEPLOYER.deploy(1)
+    approve_checker(proxy, checker, dao)
+    delegate = boa.env.generate_address()
+    proxy.proxy__set_delegation(
+        delegate, (boa.env.timestamp + DAY, checker.address, []), sender=dao
+    )
+    simulator = DelegationSimulator(proxy.address)
+
+    results = simulator.simulate_batch(delegate, [SOME_FUNC] * 2, sequential=True)
+
+    assert [r.success for r in results] == [True, True]
+
+
+def test_decode_revert_reason():
+    assert decode_revert_reason(b"") is None
+    assert decode_revert_reason(b"\x01\x02") == "0x0102"
+    assert (
+        decode_revert_reason(bytes.fromhex("4e487b71") + (0x11).to_bytes(32, "big"))
+        == "panic: 0x11"
+    )
@@ -0,0 +1,44 @@
+import boa
+
+from ownership_proxy.sweeper import ExpirySweeper
+
+
+def _delegates(proxy, dao, checker, n, duration):
+    delegates = [boa.env.generate_address() for _ in range(n)]
+    metadata = (boa.env.timestamp + duration, checker.address, [])
+    for i in range(0, n, 100):
+        batch = delegates[i : i + 100]
+        proxy.proxy__set_delegations(batch, [metadata] * len(batch), sender=dao)
+    return delegates
+
+
+def test_find_expired(proxy, dao, accept_all_checker):
+    expired = _delegates(proxy, dao, accept_all_checker, 5, 100)
+    _delegates(proxy, dao, accept_all_checker, 3, 1000)
+    boa.env.time_travel(seconds=100)
+
+    sweeper = ExpirySweeper.at(proxy.address, page_size=2)
+
+    assert sorted(sweeper.find_expired()) == sorted(expired)
+
+
+def test_sweep(proxy, dao, accept_all_checker):
+    _delegates(proxy, dao, accept_all_checker, 120, 100)
+    active = _delegates(proxy, dao, accept_all_checker, 2, 1000)
+    boa.env.time_travel(seconds=100)
+
+    # more expired delegates than fit in a batch
+    assert ExpirySweeper.at(proxy.address).sweep() == 120
+
+    assert proxy.proxy__delegate_count() == 2
+    assert sorted(proxy.proxy__delegates(0, 100)) == sorted(active)
+
+
+def test_sweep_min_batch(proxy, dao, accept_all_checker):
+    _delegates(proxy, dao, accept_all_checker, 2, 100)
+    boa.env.time_travel(seconds=100)
+
+    assert ExpirySweeper.at(proxy.address, min_batch=3).sweep() == 0
+    assert proxy.proxy__delegate_count() == 2
+
+    assert ExpirySweeper.at(proxy.address, min_batch=2).sweep() == 2
@@ -0,0 +1,11 @@
+import boa
+from vyper.utils import keccak256
+
+
+def codehash(address):
+    return keccak256(boa.env.get_code(address))
+
+
+def approve_checker(proxy, checker, dao):
+    """Approve the code hash of `checker` so it can be used in delegations."""
+    proxy.proxy__set_checker_codehash(codehash(checker.address), True, sender=dao)
@@ -1,3 +1,23 @@
 import boa
 
-PASSTHROUGH_CHECKER_DEPLOYER = boa.load_partial("tests/mocks/passthrough_checker.vy")
\ No newline at end of file
+# compiled once per session (and cached on disk by boa across runs and
+# workers), tests only pay for the deployment
+PROXY_DEPLOYER = boa.load_partial("ownership_proxy/proxy.vy")
+
+DUMMY_FACTORY_DEPLOYER = boa.load_partial("tests/mocks/dummy_factory.vy")
+CALLER_DEPLOYER = boa.load_partial("tests/mocks/caller.vy")
+REENTRANT_TARGET_DEPLOYER = boa.load_partial("tests/mocks/reentrant_target.vy")
+
+PASSTHROUGH_CHECKER_DEPLOYER = boa.load_partial("tests/mocks/passthrough_checker.vy")
+ACCEPT_ALL_CHECKER_DEPLOYER = boa.load_partial("tests/mocks/accept_all_checker.vy")
+DENY_ALL_CHECKER_DEPLOYER = boa.load_partial("tests/mocks/deny_all_checker.vy")
+MOCK_CHECKER_DEPLOYER = boa.load_partial("tests/mocks/mock_checker.vy")
+BUDGET_CHECKER_DEPLOYER = boa.load_partial("tests/mocks/budget_checker.vy")
+INITIALIZABLE_CHECKER_DEPLOYER = boa.load_partial(
+    "tests/mocks/initializable_checker.vy"
+)
+TRANSFER_CHECKER_DEPLOYER = boa.load_partial("tests/mocks/transfer_checker.vy")
+
+CHECKER_FACTORY_DEPLOYER = boa.load_partial("ownership_proxy/checker_factory.vy")
+RETURNDATA_TARGET_DEPLOYER = boa.load_partial("tests/mocks/returndata_target.vy")
+CALLDATA_CHECKER_DEPLOYER = boa.load_partial("ownership_proxy/calldata_checker.vy")
@@ -0,0 +1,124 @@
+import contextlib
+import json
+from pathlib import Path
+
+import boa
+
+from ownership_proxy.profiler import cold_access
+
+SNAPSHOT_PATH = Path(__file__).parent.parent / "gas" / "snapshot.json"
+
+# Relative increase over the recorded value that is tolerated before a
+# benchmark fails (1 = 100%)
+REGRESSION_THRESHOLD = 0.02
+
+
+def _gas_used(computation):
+    # refunds are capped at a fifth of the gas used (EIP-3529)
+    gas_used = computation.get_gas_used()
+    return gas_used - min(computation.get_gas_refund(), gas_used // 5)
+
+
+@contextlib.contextmanager
+def committed_storage(env):
+    """
+    Price SSTOREs against the storage as it is when entering the context, as
+    if everything before had been committed in earlier transactions.
+
+    boa never commits storage, so the original value of a slot (EIP-2200) is
+    its value before the session, and rewriting a slot set up earlier in the
+    test is priced as a dirty write with oversized refunds.
+    """
+    state = env.evm.vm.state
+    get_storage = state.get_storage
+    originals = {}
+
+    def _get_storage(address, slot, from_journal=True):
+        if from_journal:
+            return get_storage(address, slot)
+        # SSTORE looks up the original value before writing, so the first
+        # lookup of a slot reads its value when entering the context
+        key = (address, slot)
+        if key not in originals:
+            originals[key] = get_storage(address, slot)
+        return originals[key]
+
+    state.get_storage = _get_storage
+    try:
+        yield
+    finally:
+        del state.get_storage
+
+
+@contextlib.contextmanager
+def _transaction_start(env):
+    with cold_access(env), committed_storage(env):
+        yield
+
+
+def measure(fn, *args, **kwargs):
+    """
+    Call a contract function as the first call of a transaction (cold
+    storage/account access, storage committed) and return its gas.
+    """
+    with _transaction_start(boa.env):
+        fn(*args, **kwargs)
+    return _gas_used(fn.contract._computation)
+
+
+def measure_raw(to, data, sender, value=0):
+    """Same as `measure` but for raw calldata (i.e. calls routed through `__default__`)."""
+    with _transaction_start(boa.env):
+        computation = boa.env.raw_call(to, sender=sender, data=data, value=value)
+    return _gas_used(computation)
+
+
+def measure_revert(fn, *args):
+    """Same as `measure` for a call that is expected to revert."""
+    with _transaction_start(boa.env):
+        computation = boa.env.execute_code(
+            to_address=fn.contract.address, data=fn.prepare_calldata(*args)
+        )
+    assert computation.is_error, "call did not revert"
+    return _gas_used(computation)
+
+
+class GasSnapshot:
+    def __init__(
+        self, path=SNAPSHOT_PATH, threshold=REGRESSION_THRESHOLD, update=False
+    ):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.update = update
+        self.recorded = json.loads(self.path.read_text()) if self.path.exists() else {}
+        self.measured = {}
+
+    def check(self, name, gas_used):
+        self.measured[name] = gas_used
+
+        if self.update:
+            return
+
+        hint = "run with --update-gas-snapshot to record it"
+        assert name in self.recorded, f"no gas snapshot for {name}, {hint}"
+
+        recorded = self.recorded[name]
+        assert gas_used <= recorded * (1 + self.threshold), (
+            f"gas regression for {name}: {gas_used} > {recorded} "
+            f"(+{self.threshold:.0%} threshold)"
+        )
+        # large improvements fail too, so the snapshot keeps catching regressions
+        assert gas_used >= recorded * (1 - self.threshold), (
+            f"stale gas snapshot for {name}: {gas_used} < {recorded} "
+            f"(-{self.threshold:.0%} threshold), {hint}"
+        )
+
+    def write(self):
+        """Record the measured values, only when updating the snapshot."""
+        if not self.update or not self.measured:
+            return
+
+        snapshot = {**self.recorded, **self.measured}
+        self.path.write_text(
+            json.dumps(dict(sorted(snapshot.items())), indent=2) + "\n"
+        )
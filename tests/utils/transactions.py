@@ -0,0 +1,9 @@
+import boa
+
+
+def end_transaction():
+    """
+    boa executes every call in the same transaction context, clear what
+    the EVM would have cleared between two transactions.
+    """
+    boa.env.evm.vm.state.clear_transient_storage()